@@ -0,0 +1,128 @@
+"""
+국토부 실거래가 XML 파서 벤치마크
+BeautifulSoup(lxml-xml) 전체 트리 파싱 vs lxml iterparse 스트리밍 파싱
+
+사용법:
+    # 저장해 둔 응답 파일로 측정
+    python scripts/bench_molit_parser.py --input saved_response.xml --apt 중계그린
+
+    # 응답 파일이 없으면 서울 구 단위 규모의 합성 응답 생성 후 측정
+    python scripts/bench_molit_parser.py --items 800 --repeat 20
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawlers.molit_parser import iter_molit_records  # noqa: E402
+
+
+def _synthesize_response(n_items: int, apt_name: str) -> bytes:
+    """구-월 단위 응답 흉내: n_items건 중 약 1/20만 대상 단지"""
+    items = []
+    for i in range(n_items):
+        name = apt_name if i % 20 == 0 else f"다른단지{i % 97}"
+        items.append(
+            "<item>"
+            f"<거래금액>{60000 + i * 7:,}</거래금액>"
+            "<건축년도>1995</건축년도><년>2025</년>"
+            f"<법정동>중계동</법정동><아파트>{name}</아파트>"
+            f"<월>10</월><일>{i % 28 + 1}</일>"
+            f"<전용면적>{49 + i % 40}.94</전용면적>"
+            f"<지번>{400 + i % 60}</지번><지역코드>11350</지역코드>"
+            f"<층>{i % 25 + 1}</층>"
+            "</item>"
+        )
+    body = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><header><resultCode>00</resultCode>"
+        "<resultMsg>NORMAL SERVICE.</resultMsg></header>"
+        f"<body><items>{''.join(items)}</items>"
+        f"<numOfRows>{n_items}</numOfRows><pageNo>1</pageNo>"
+        f"<totalCount>{n_items}</totalCount></body></response>"
+    )
+    return body.encode("utf-8")
+
+
+def _parse_bs4(xml: bytes, apt_name: str) -> list:
+    """기존 방식: BeautifulSoup 전체 트리 + item.find() 반복"""
+    from bs4 import BeautifulSoup
+
+    rows = []
+    soup = BeautifulSoup(xml, "lxml-xml")
+    for item in soup.find_all("item"):
+        name = item.find("아파트")
+        if name and apt_name and apt_name not in name.text:
+            continue
+        deal_amount = item.find("거래금액")
+        deal_day = item.find("일")
+        deal_floor = item.find("층")
+        area = item.find("전용면적")
+        if not all([deal_amount, deal_day, deal_floor, area]):
+            continue
+        rows.append((
+            int(deal_day.text.strip()),
+            int(deal_floor.text.strip()),
+            float(area.text.strip()),
+            int(deal_amount.text.strip().replace(",", "")) * 10000,
+        ))
+    return rows
+
+
+def _parse_iter(xml: bytes, apt_name: str) -> list:
+    """신규 방식: iterparse 스트리밍 + 단지명 조기 필터"""
+    apt_filter = (lambda name: apt_name in name) if apt_name else None
+    return [
+        (r.day, r.floor, r.area_m2, r.price_raw)
+        for r in iter_molit_records(xml, apt_filter)
+    ]
+
+
+def _bench(func, xml: bytes, apt_name: str, repeat: int) -> tuple:
+    """repeat회 실행 → (최소 소요시간(초), 결과)"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(xml, apt_name)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="국토부 XML 파서 벤치마크")
+    parser.add_argument("--input", type=str, help="저장된 API 응답 XML 경로")
+    parser.add_argument("--apt", type=str, default="중계그린", help="필터할 단지명")
+    parser.add_argument("--items", type=int, default=800, help="합성 응답 item 수")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "rb") as f:
+            xml = f.read()
+        source = args.input
+    else:
+        xml = _synthesize_response(args.items, args.apt)
+        source = f"합성 응답 ({args.items} items)"
+
+    print(f"입력: {source}, {len(xml) / 1024:.0f} KB, 단지명 필터: {args.apt or '(없음)'}")
+
+    iter_time, iter_rows = _bench(_parse_iter, xml, args.apt, args.repeat)
+    print(f"  lxml iterparse : {iter_time * 1000:8.2f} ms  ({len(iter_rows)}건)")
+
+    try:
+        bs4_time, bs4_rows = _bench(_parse_bs4, xml, args.apt, args.repeat)
+    except ImportError:
+        print("  BeautifulSoup  : bs4 미설치, 비교 생략")
+        return
+
+    print(f"  BeautifulSoup  : {bs4_time * 1000:8.2f} ms  ({len(bs4_rows)}건)")
+    print(f"  속도 향상      : {bs4_time / iter_time:8.1f}x")
+    if bs4_rows != iter_rows:
+        print("  [WARN] 두 파서의 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
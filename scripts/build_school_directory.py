@@ -0,0 +1,51 @@
+"""
+NEIS 학교 디렉토리 내려받기
+config.yaml의 neis_api_key / school.offices 설정으로 temp/neis_schools.db를 만든다.
+
+사용법:
+    python scripts/build_school_directory.py            # 오래된 교육청만 갱신
+    python scripts/build_school_directory.py --force    # 전체 다시 받기
+    python scripts/build_school_directory.py --offices B10 J10 --key XXXX
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import load_config  # noqa: E402
+from src.crawlers.neis_directory import (  # noqa: E402
+    EDUCATION_OFFICES,
+    get_school_directory,
+    refresh_school_directory,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NEIS 학교 디렉토리 내려받기")
+    parser.add_argument("--config", type=str, default="config/config.yaml", help="설정 파일 경로")
+    parser.add_argument("--key", type=str, help="NEIS 인증키 (설정 파일 값 대신 사용)")
+    parser.add_argument("--offices", nargs="+", help="교육청 코드 (예: B10 J10 E10)")
+    parser.add_argument("--force", action="store_true", help="갱신 주기와 관계없이 다시 받기")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    if args.key:
+        config["neis_api_key"] = args.key
+    if args.offices:
+        unknown = [o for o in args.offices if o not in EDUCATION_OFFICES]
+        if unknown:
+            print(f"[ERROR] 알 수 없는 교육청 코드: {', '.join(unknown)}")
+            sys.exit(1)
+        config.setdefault("school", {})["offices"] = args.offices
+    if not config.get("neis_api_key"):
+        print("[ERROR] NEIS 인증키가 없습니다 (--key 또는 config.yaml의 neis_api_key)")
+        sys.exit(1)
+
+    updated = refresh_school_directory(config, force=args.force)
+    directory = get_school_directory(config)
+    print(f"갱신 {len(updated)}개 교육청, 전체 {directory.count()}개 학교 → {directory.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+지하철역 바이너리 테이블 생성
+src/data/stations.csv (name,line,lat,lng) → src/data/stations.bin
+
+사용법:
+    python scripts/build_station_table.py
+    python scripts/build_station_table.py --csv my_stations.csv --out /tmp/stations.bin
+
+CSV는 노선별로 운행 순서대로 적는다 (노선망 소요시간 계산이 순서를 사용).
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.station_table import (  # noqa: E402
+    STATIONS_BIN,
+    STATIONS_CSV,
+    StationTable,
+    read_station_table,
+    read_stations_csv,
+    write_station_table,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지하철역 바이너리 테이블 생성")
+    parser.add_argument("--csv", type=str, default=STATIONS_CSV, help="원본 CSV 경로")
+    parser.add_argument("--out", type=str, default=STATIONS_BIN, help="출력 .bin 경로")
+    args = parser.parse_args()
+
+    rows = read_stations_csv(args.csv)
+    if not rows:
+        print(f"[ERROR] CSV에 역이 없습니다: {args.csv}")
+        sys.exit(1)
+
+    seen = set()
+    for name, line, lat, lng in rows:
+        if (name, line) in seen:
+            print(f"  [WARN] 중복 역: {name} ({line})")
+        seen.add((name, line))
+        if not (33.0 <= lat <= 39.0 and 124.0 <= lng <= 132.0):
+            print(f"  [WARN] 좌표 범위 이상: {name} ({line}) {lat}, {lng}")
+
+    table = StationTable.from_rows(rows)
+    write_station_table(table, args.out)
+
+    # 다시 읽어서 검증
+    loaded = read_station_table(args.out)
+    assert loaded.rows() == table.rows(), "저장한 테이블을 다시 읽은 결과가 다릅니다"
+
+    print(f"역 {len(table)}개, 역명 {len(table.names)}개, 노선 {len(table.lines)}개")
+    print(f"  {args.csv} ({os.path.getsize(args.csv) / 1024:.1f} KB)")
+    print(f"  → {args.out} ({os.path.getsize(args.out) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
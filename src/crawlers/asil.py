@@ -7,15 +7,23 @@ import os
 import re
 import time
 import random
+import asyncio
+import threading
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
+import numpy as np
 
-from src.models import PriceInfo, Transaction
+from src.models import ImageAsset, PriceInfo, Transaction
 from src.utils.text_helpers import format_price
 from src.crawlers.browser_utils import is_playwright_available, get_browser_page, run_async
+from src.crawlers.capture_profiles import get_capture_profile
+from src.crawlers.http_utils import HostLimiter
+from src.crawlers.molit_parser import MolitDistrictIndex, iter_molit_records
+from src.processors.price_store import PriceHistoryStore, month_key
+from src.processors.price_stats import MonthlyPriceStats, build_price_info
 
 
 # 국토부 실거래가 API
@@ -78,118 +86,234 @@ def fetch_price_info_mock(complex_id: str, complex_name: str = "") -> PriceInfo:
     )
 
 
+def _recent_deal_months(months: int, today: Optional[date] = None) -> List[Tuple[int, int]]:
+    """오늘 기준 최근 months개월의 (연, 월) 목록 (최신순)"""
+    today = today or date.today()
+    result = []
+    for i in range(months):
+        month = today.month - i
+        year = today.year
+        while month <= 0:
+            month += 12
+            year -= 1
+        result.append((year, month))
+    return result
+
+
+async def _fetch_molit_month_async(
+    client: httpx.AsyncClient,
+    limiter: HostLimiter,
+    lawd_cd: str,
+    deal_ymd: str,
+    api_key: str,
+    max_retries: int = 2,
+) -> Tuple[Optional[bytes], str]:
+    """
+    국토부 API 한 달치 조회 (호스트별 동시 요청 제한 적용)
+
+    Returns:
+        (응답 XML 또는 None, 실패 사유)
+    """
+    error = ""
+    for attempt in range(max_retries + 1):
+        async with limiter.limit(MOLIT_API_URL):
+            try:
+                resp = await client.get(MOLIT_API_URL, params={
+                    "LAWD_CD": lawd_cd,
+                    "DEAL_YMD": deal_ymd,
+                    "serviceKey": api_key,
+                })
+                resp.raise_for_status()
+                return resp.content, ""
+            except Exception as e:
+                error = str(e) or type(e).__name__
+        # 재시도 전 대기 (서버 부하 방지) — 슬롯은 놓고 기다려 다른 달 요청을 막지 않음
+        if attempt < max_retries:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * (attempt + 1))
+    return None, error
+
+
+async def _fetch_molit_months_async(
+    lawd_cd: str,
+    api_key: str,
+    deal_ymds: List[str],
+    max_concurrency: int = 4,
+) -> Dict[str, Tuple[Optional[bytes], str]]:
+    """여러 달의 국토부 API 응답을 동시에 조회 → {deal_ymd: (xml, 실패 사유)}"""
+    limiter = HostLimiter(per_host=max_concurrency)
+    limits = httpx.Limits(max_connections=max_concurrency)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        responses = await asyncio.gather(*[
+            _fetch_molit_month_async(client, limiter, lawd_cd, ymd, api_key)
+            for ymd in deal_ymds
+        ])
+    return dict(zip(deal_ymds, responses))
+
+
+# 구-월 단위 단지명 인덱스 캐시 {(lawd_cd, deal_ymd): MolitDistrictIndex}
+# 배치 실행에서 같은 구의 여러 단지가 응답/인덱스를 공유한다.
+# 최근에 쓴 DISTRICT_INDEX_CACHE_MAX개만 보관 (긴 배치에서 메모리가 계속 늘지 않도록)
+DISTRICT_INDEX_CACHE_MAX = 240
+_DISTRICT_INDEX_CACHE: "OrderedDict[Tuple[str, str], MolitDistrictIndex]" = OrderedDict()
+_DISTRICT_INDEX_LOCK = threading.Lock()
+
+
+def _cached_district_index(lawd_cd: str, deal_ymd: str) -> Optional[MolitDistrictIndex]:
+    key = (lawd_cd, deal_ymd)
+    with _DISTRICT_INDEX_LOCK:
+        index = _DISTRICT_INDEX_CACHE.get(key)
+        if index is not None:
+            _DISTRICT_INDEX_CACHE.move_to_end(key)
+        return index
+
+
+def _store_district_index(lawd_cd: str, deal_ymd: str, index: MolitDistrictIndex):
+    key = (lawd_cd, deal_ymd)
+    with _DISTRICT_INDEX_LOCK:
+        _DISTRICT_INDEX_CACHE[key] = index
+        _DISTRICT_INDEX_CACHE.move_to_end(key)
+        while len(_DISTRICT_INDEX_CACHE) > DISTRICT_INDEX_CACHE_MAX:
+            _DISTRICT_INDEX_CACHE.popitem(last=False)
+
+
+def _load_district_indexes(
+    lawd_cd: str,
+    api_key: str,
+    deal_ymds: List[str],
+    max_concurrency: int = 4,
+) -> Tuple[Dict[str, MolitDistrictIndex], Dict[str, str]]:
+    """
+    구-월 인덱스 로드 (캐시에 없는 달만 API 조회)
+
+    Returns:
+        ({deal_ymd: MolitDistrictIndex}, {실패한 deal_ymd: 사유})
+    """
+    failed_months: Dict[str, str] = {}
+    indexes: Dict[str, MolitDistrictIndex] = {}
+    for ymd in deal_ymds:
+        index = _cached_district_index(lawd_cd, ymd)
+        if index is not None:
+            indexes[ymd] = index
+    missing = [ymd for ymd in deal_ymds if ymd not in indexes]
+
+    if missing:
+        try:
+            responses = run_async(_fetch_molit_months_async(
+                lawd_cd, api_key, missing, max_concurrency,
+            ))
+        except Exception as e:
+            print(f"[ERROR] 실거래가 API 호출 실패: {e}")
+            responses = {ymd: (None, str(e)) for ymd in missing}
+
+        for ymd, (xml, error) in responses.items():
+            if xml is None:
+                failed_months[ymd] = error
+                continue
+            try:
+                index = MolitDistrictIndex(iter_molit_records(xml))
+            except Exception as e:
+                failed_months[ymd] = f"응답 파싱 실패: {e}"
+                continue
+            indexes[ymd] = index
+            _store_district_index(lawd_cd, ymd, index)
+
+    return {ymd: indexes[ymd] for ymd in deal_ymds if ymd in indexes}, failed_months
+
+
 def fetch_price_info_from_api(
     complex_id: str,
     lawd_cd: str,
     api_key: str,
     complex_name: str = "",
     months: int = 6,
+    max_concurrency: int = 4,
+    jibun: str = "",
+    history_path: Optional[str] = None,
 ) -> Optional[PriceInfo]:
     """
     국토부 공공 API로 실거래가 데이터 조회
 
+    월별 요청은 호스트당 max_concurrency개까지 동시에 보내고,
+    결과는 날짜순으로 병합한다. 실패한 달은 PriceInfo.failed_months에 기록.
+    구-월 응답은 단지명 인덱스로 캐시되어 같은 구의 다른 단지가 재사용한다.
+    history_path가 있으면 단지별 이력 저장소에 누적하고 빠진 달만 조회한다.
+
     Args:
         complex_id: 단지 ID
         lawd_cd: 법정동코드 5자리
         api_key: 공공데이터포털 API 키
         complex_name: 단지명 (필터링에 사용)
         months: 조회할 개월 수
+        max_concurrency: 호스트당 동시 요청 수
+        jibun: 단지 지번 (동명 단지 구분용, 선택)
+        history_path: 단지별 실거래 이력 저장소 파일 경로 (.npz, 선택)
 
     Returns:
         PriceInfo 또는 None
     """
     today = date.today()
-    all_transactions: List[Transaction] = []
-
-    for i in range(months):
-        month = today.month - i
-        year = today.year
-        while month <= 0:
-            month += 12
-            year -= 1
-
-        deal_ymd = f"{year}{month:02d}"
-
-        try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.get(MOLIT_API_URL, params={
-                    "LAWD_CD": lawd_cd,
-                    "DEAL_YMD": deal_ymd,
-                    "serviceKey": api_key,
-                })
-                resp.raise_for_status()
-
-            soup = BeautifulSoup(resp.text, "lxml-xml")
-            items = soup.find_all("item")
-
-            for item in items:
-                apt_name = item.find("아파트")
-                if apt_name and complex_name and complex_name not in apt_name.text:
-                    continue
-
-                deal_amount = item.find("거래금액")
-                deal_day = item.find("일")
-                deal_floor = item.find("층")
-                area = item.find("전용면적")
-
-                if not all([deal_amount, deal_day, deal_floor, area]):
-                    continue
-
-                price_raw = int(deal_amount.text.strip().replace(",", "")) * 10000
-                area_m2 = float(area.text.strip())
-                floor_num = int(deal_floor.text.strip())
-                day = int(deal_day.text.strip())
-
-                txn = Transaction(
-                    date=date(year, month, min(day, 28)),
-                    area_pyeong=f"{round(area_m2 / 3.305785)}평",
-                    area_m2=area_m2,
-                    floor=floor_num,
-                    price=format_price(price_raw),
-                    price_raw=price_raw,
-                )
-                all_transactions.append(txn)
+    year_months = _recent_deal_months(months, today)
+
+    # 저장된 이력이 있으면 빠진 달(+ 신고 중인 최근 달)만 조회
+    store = PriceHistoryStore.load(history_path) if history_path else PriceHistoryStore("")
+    month_keys = store.missing_months([month_key(y, m) for y, m in year_months], today)
+    deal_ymds = [str(k) for k in month_keys]
+    if history_path and len(store):
+        print(f"  실거래 이력 {len(store)}건 보유, {len(deal_ymds)}개월만 조회")
+
+    # 단지명이 없으면 구-월 응답에서 단지를 고를 수 없음 → 조회/저장 없이 보유 이력만 사용
+    # (빈 결과로 replace_month 하면 그 달이 '거래 0건으로 조회 완료'로 남는다)
+    if not complex_name:
+        print("[WARN] 단지명이 없어 실거래가 API 조회 생략")
+        if not len(store):
+            return None
+        price_info = _price_info_from_store(complex_id, store, today)
+        price_info.history_path = history_path
+        return price_info
 
-            polite_delay(0.5, 1.5)
+    indexes, failed_months = _load_district_indexes(
+        lawd_cd, api_key, deal_ymds, max_concurrency,
+    )
 
-        except Exception as e:
-            print(f"[ERROR] 실거래가 API 호출 실패 ({deal_ymd}): {e}")
+    for key in month_keys:
+        index = indexes.get(str(key))
+        if index is None:
             continue
+        records = index.lookup(complex_name, jibun)
+        store.replace_month(
+            key,
+            [r.day for r in records],
+            [r.area_m2 for r in records],
+            [r.floor for r in records],
+            [r.price_raw for r in records],
+        )
 
-    if not all_transactions:
-        return fetch_price_info_mock(complex_id, complex_name)
+    if failed_months:
+        print(f"[WARN] 실거래가 API {len(failed_months)}/{len(deal_ymds)}개월 실패: "
+              f"{', '.join(sorted(failed_months))}")
 
-    # 최신순 정렬
-    all_transactions.sort(key=lambda t: t.date, reverse=True)
+    if not len(store):
+        return fetch_price_info_mock(complex_id, complex_name)
 
-    # 통계 계산
-    month1_txns = [t for t in all_transactions if t.date.month == today.month and t.date.year == today.year]
-    prev_month = today.month - 1 if today.month > 1 else 12
-    prev_year = today.year if today.month > 1 else today.year - 1
-    month2_txns = [t for t in all_transactions if t.date.month == prev_month and t.date.year == prev_year]
+    if history_path:
+        store.save()
 
-    # 최근 3개월 최고/최저
-    recent_3m = all_transactions[:min(len(all_transactions), 20)]
-    if recent_3m:
-        high = max(recent_3m, key=lambda t: t.price_raw)
-        low = min(recent_3m, key=lambda t: t.price_raw)
-    else:
-        high = low = all_transactions[0] if all_transactions else None
+    price_info = _price_info_from_store(complex_id, store, today)
+    price_info.failed_months = failed_months
+    price_info.history_path = history_path
+    return price_info
 
-    # 역대 최고가
-    all_time = max(all_transactions, key=lambda t: t.price_raw)
 
-    return PriceInfo(
-        complex_id=complex_id,
-        recent_transactions=all_transactions,
-        month1_count=len(month1_txns),
-        month1_label=f"{today.year}년 {today.month}월",
-        month2_count=len(month2_txns),
-        month2_label=f"{prev_year}년 {prev_month}월",
-        recent_3m_high=high.price if high else "",
-        recent_3m_low=low.price if low else "",
-        all_time_high=all_time.price if all_time else "",
-        all_time_high_date=f"{all_time.date.strftime('%y년 %m월')}" if all_time else "",
+def _price_info_from_store(
+    complex_id: str, store: PriceHistoryStore, today: date
+) -> PriceInfo:
+    """실거래 이력 컬럼에서 PriceInfo 생성 (표에 쓸 최근 6개월만 Transaction으로 변환)"""
+    y6, m6 = _recent_deal_months(6, today)[-1]
+    stats = MonthlyPriceStats.from_columns(store.dates, store.price_raw)
+    return build_price_info(
+        complex_id, stats,
+        recent_transactions=store.to_transactions(since=date(y6, m6, 1)),
+        today=today,
     )
 
 
@@ -198,13 +322,19 @@ def fetch_price_info(
     complex_name: str = "",
     lawd_cd: str = "",
     api_key: str = "",
+    months: int = 6,
+    max_concurrency: int = 4,
+    jibun: str = "",
+    history_path: Optional[str] = None,
 ) -> PriceInfo:
     """
     실거래가 데이터 수집 (API 키가 있으면 공공 API, 없으면 mock)
     """
     if api_key and lawd_cd:
         result = fetch_price_info_from_api(
-            complex_id, lawd_cd, api_key, complex_name
+            complex_id, lawd_cd, api_key, complex_name,
+            months=months, max_concurrency=max_concurrency, jibun=jibun,
+            history_path=history_path,
         )
         if result:
             return result
@@ -288,98 +418,37 @@ def _parse_asil_chart_data(raw_js: str, complex_id: str) -> Optional[PriceInfo]:
 
     today = date.today()
 
-    # 매매 거래가 있는 월만 필터
-    sale_months = [e for e in parsed if e.get("M_CNT", 0) > 0 and "M" in e]
+    # 매매 거래가 있는 월만 (M = 월 평균가, M_CNT = 건수)
+    sale_months = []
+    for e in parsed:
+        try:
+            y, m = (int(x) for x in str(e.get("date", "")).split("/")[:2])
+        except ValueError:
+            continue
+        if e.get("M_CNT", 0) > 0 and "M" in e:
+            sale_months.append((date(y, m, 1), int(e["M"]) * 10000, int(e["M_CNT"])))
 
-    # 이번 달 / 지난 달 거래건수
-    cur_key = f"{today.year}/{today.month}"
-    prev_m = today.month - 1
-    prev_y = today.year
-    if prev_m <= 0:
-        prev_m += 12
-        prev_y -= 1
-    prev_key = f"{prev_y}/{prev_m}"
+    dates = np.array([d for d, _, _ in sale_months], dtype="datetime64[D]")
+    prices = np.array([p for _, p, _ in sale_months], dtype=np.int64)
+    counts = np.array([c for _, _, c in sale_months], dtype=np.int64)
+    stats = MonthlyPriceStats.from_columns(dates, prices, counts)
 
-    month1_count = 0
-    month2_count = 0
-    for e in parsed:
-        if e["date"] == cur_key:
-            month1_count = e.get("M_CNT", 0)
-        if e["date"] == prev_key:
-            month2_count = e.get("M_CNT", 0)
-
-    # 최근 6개월 매매 데이터 (거래 있는 월)
-    recent_6m_entries = []
-    for i in range(6):
-        m = today.month - i
-        y = today.year
-        while m <= 0:
-            m += 12
-            y -= 1
-        key = f"{y}/{m}"
-        for e in sale_months:
-            if e["date"] == key:
-                recent_6m_entries.append(e)
-
-    # 최근 3개월 최고/최저
-    recent_3m_entries = []
-    for i in range(3):
-        m = today.month - i
-        y = today.year
-        while m <= 0:
-            m += 12
-            y -= 1
-        key = f"{y}/{m}"
-        for e in sale_months:
-            if e["date"] == key:
-                recent_3m_entries.append(e)
-
-    if recent_3m_entries:
-        high_3m = max(e["M"] for e in recent_3m_entries)
-        low_3m = min(e["M"] for e in recent_3m_entries)
-    elif recent_6m_entries:
-        high_3m = max(e["M"] for e in recent_6m_entries)
-        low_3m = min(e["M"] for e in recent_6m_entries)
-    else:
-        high_3m = low_3m = 0
-
-    # 역대 최고가
-    if sale_months:
-        ath_entry = max(sale_months, key=lambda e: e["M"])
-        ath_price = ath_entry["M"]
-        ath_parts = ath_entry["date"].split("/")
-        ath_date_str = f"{int(ath_parts[0]) % 100}년 {ath_parts[1]}월"
-    else:
-        ath_price = 0
-        ath_date_str = ""
-
-    # Transaction 리스트: 최근 6개월 월별 집계 → Transaction 객체
+    # Transaction 리스트: 최근 6개월 월별 집계 → Transaction 객체 (최신순)
+    y6, m6 = _recent_deal_months(6, today)[-1]
     transactions = []
-    for e in sorted(recent_6m_entries, key=lambda x: x["date"], reverse=True):
-        parts = e["date"].split("/")
-        y, m = int(parts[0]), int(parts[1])
-        price_raw = e["M"] * 10000  # 만원 → 원
+    for d, price_raw, cnt in sorted(sale_months, key=lambda x: x[0], reverse=True):
+        if d < date(y6, m6, 1) or d > today:
+            continue
         transactions.append(Transaction(
-            date=date(y, m, 1),
+            date=d,
             area_pyeong="전체",
             area_m2=0.0,
-            floor=e["M_CNT"],  # 건수를 floor 필드에 임시 저장
+            floor=cnt,  # 건수를 floor 필드에 임시 저장
             price=format_price(price_raw),
             price_raw=price_raw,
         ))
 
-    return PriceInfo(
-        complex_id=complex_id,
-        recent_transactions=transactions,
-        month1_count=month1_count,
-        month1_label=f"{today.year}년 {today.month}월",
-        month2_count=month2_count,
-        month2_label=f"{prev_y}년 {prev_m}월",
-        recent_3m_high=format_price(high_3m * 10000) if high_3m else "",
-        recent_3m_low=format_price(low_3m * 10000) if low_3m else "",
-        all_time_high=format_price(ath_price * 10000) if ath_price else "",
-        all_time_high_date=ath_date_str,
-    )
+    return build_price_info(complex_id, stats, transactions, today=today)
 
 
 async def _capture_asil_price_chart_async(
@@ -393,7 +462,7 @@ async def _capture_asil_price_chart_async(
     아실(asil.kr) 매매가 추이 그래프 캡처 + 실거래 데이터 파싱 (async)
 
     Returns:
-        {"chart_path": str, "price_info": PriceInfo or None} 또는 None
+        {"chart_path": ImageAsset, "price_info": PriceInfo or None} 또는 None
     """
     gu, dong = _parse_gu_dong(address)
     if not gu or not dong:
@@ -402,7 +471,9 @@ async def _capture_asil_price_chart_async(
 
     print(f"  아실 차트 캡처 시도: {complex_name} ({gu} {dong})")
 
-    async with get_browser_page(viewport_width=1400, viewport_height=900) as page:
+    profile = get_capture_profile("asil_chart")
+    save_path = profile.path_for(save_path)
+    async with get_browser_page(profile=profile) as page:
         # JSONP 차트 데이터 캡처용
         chart_data_raw = []
 
@@ -495,8 +566,9 @@ async def _capture_asil_price_chart_async(
             print(f"  [WARN] 아실: #chartHolder1 요소 없음")
             return None
 
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        await chart_el.screenshot(path=save_path)
+        chart = ImageAsset.from_bytes(
+            await chart_el.screenshot(**profile.element_screenshot_options()), path=save_path,
+        ).write_behind()
         print(f"  아실 차트 캡처 성공: {save_path}")
 
         # 10. JSONP 데이터에서 PriceInfo 파싱
@@ -509,7 +581,7 @@ async def _capture_asil_price_chart_async(
                       f"지난달 {price_info.month2_count}건)")
 
         # 11. 거래내역 스크린샷 캡처 (같은 브라우저 세션 재사용)
-        deals_path = os.path.join(os.path.dirname(save_path), "deals_table.png")
+        deals_path = profile.path_for(os.path.join(os.path.dirname(save_path), "deals_table.png"))
         deals_url = (
             f"https://asil.kr/app/price_detail_ver_3_9.jsp"
             f"?os=pc&user=null&building=apt&apt={apt_value}"
@@ -551,14 +623,14 @@ async def _capture_asil_price_chart_async(
             # 뷰포트를 줄여서 body가 콘텐츠 높이에 맞게 되도록 함
             await page.set_viewport_size({"width": 480, "height": 100})
             await page.wait_for_timeout(300)
-            await page.screenshot(path=deals_path, full_page=True)
+            deals = await page.screenshot(full_page=True, **profile.element_screenshot_options())
             print(f"  아실 거래내역 캡처 성공: {deals_path}")
             if price_info:
-                price_info.deals_image_path = deals_path
+                price_info.deals_image_path = ImageAsset.from_bytes(deals, path=deals_path).write_behind()
         except Exception as e:
             print(f"  [WARN] 아실 거래내역 캡처 실패: {e}")
 
-        return {"chart_path": save_path, "price_info": price_info}
+        return {"chart_path": chart, "price_info": price_info}
 
 
 def capture_asil_price_chart(
@@ -571,7 +643,7 @@ def capture_asil_price_chart(
     아실 매매가 추이 그래프 캡처 + 실거래 데이터 파싱 (동기 래퍼)
 
     Returns:
-        {"chart_path": str, "price_info": PriceInfo or None} 또는 None
+        {"chart_path": ImageAsset, "price_info": PriceInfo or None} 또는 None
     """
     if not is_playwright_available():
         print(f"  [INFO] Playwright 미설치, 아실 차트 캡처 건너뜀")
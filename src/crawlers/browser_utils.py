@@ -26,21 +26,30 @@ def is_playwright_available() -> bool:
 @asynccontextmanager
 async def get_browser_page(
     headless: bool = True,
-    device_scale_factor: int = 2,
+    device_scale_factor: float = 2,
     viewport_width: int = 1280,
     viewport_height: int = 900,
     locale: str = "ko-KR",
+    profile=None,
 ):
     """
     Playwright 브라우저 페이지를 yield하는 context manager
 
+    profile(capture_profiles.CaptureProfile)을 주면 뷰포트/배율은 프로필 값을 사용한다.
+
     Usage:
-        async with get_browser_page() as page:
+        profile = get_capture_profile("route")
+        async with get_browser_page(profile=profile) as page:
             await page.goto(url)
-            await page.screenshot(path="out.png")
+            await page.screenshot(path="out.png", **profile.screenshot_options())
     """
     from playwright.async_api import async_playwright
 
+    if profile is not None:
+        viewport_width = profile.viewport_width
+        viewport_height = profile.viewport_height
+        device_scale_factor = profile.device_scale_factor
+
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=headless)
         context = await browser.new_context(
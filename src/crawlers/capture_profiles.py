@@ -0,0 +1,177 @@
+"""
+Playwright 캡처 프로필
+결과물(artifact)마다 뷰포트 / 배율 / 잘라낼 영역 / 저장 형식을 정해 둔다.
+값은 이미지가 들어갈 슬라이드 영역(slide_utils.IMAGE_BOXES)과 목표 DPI에서 계산하므로,
+슬라이드에서 보이지 않는 픽셀까지 렌더링/인코딩하지 않는다.
+
+- 잘라낼 영역(clip): 캡처 가능한 영역 안에서 슬라이드 영역과 같은 비율의 최대 사각형
+- 배율(device_scale_factor): clip × 배율이 영역 × DPI 이상이 되는 최소값 (1~2, 0.25 단위)
+- 요소 캡처(clip 없음)는 요소의 대략적인 CSS 크기(content)로 배율을 계산하고,
+  fit_viewport이면 뷰포트 높이를 영역 비율에 맞춘다
+- 저장 형식: 사진 같은 이미지(위성지도, 그라데이션 차트)는 JPEG, 나머지는 PNG
+
+Usage:
+    profile = get_capture_profile("route")
+    async with get_browser_page(profile=profile) as page:
+        ...
+        await page.screenshot(path=profile.path_for(save_path), **profile.screenshot_options())
+"""
+import math
+import os
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from src.generators.slide_utils import IMAGE_BOXES
+from src.processors.image_optimizer import DEFAULT_DPI
+
+
+class CaptureProfile(NamedTuple):
+    """캡처 설정 (크기는 모두 CSS 픽셀)"""
+    name: str
+    viewport_width: int
+    viewport_height: int
+    device_scale_factor: float
+    clip: Optional[Tuple[int, int, int, int]] = None  # (x, y, width, height)
+    image_type: str = "png"                            # png / jpeg (jpeg는 .jpg 경로로 저장)
+    quality: Optional[int] = None                      # jpeg 품질
+
+    @property
+    def viewport(self) -> Dict[str, int]:
+        return {"width": self.viewport_width, "height": self.viewport_height}
+
+    @property
+    def extension(self) -> str:
+        return ".jpg" if self.image_type == "jpeg" else ".png"
+
+    def path_for(self, path: str) -> str:
+        """저장 형식에 맞게 확장자를 바꾼 경로"""
+        return os.path.splitext(path)[0] + self.extension
+
+    def screenshot_options(self) -> dict:
+        """page.screenshot / locator.screenshot에 넘길 옵션 (path 제외)"""
+        options: dict = {"type": self.image_type}
+        if self.clip and self.clip[2] > 0 and self.clip[3] > 0:
+            x, y, w, h = self.clip
+            options["clip"] = {"x": x, "y": y, "width": w, "height": h}
+        if self.image_type == "jpeg" and self.quality:
+            options["quality"] = self.quality
+        return options
+
+    def element_screenshot_options(self) -> dict:
+        """요소 캡처용 옵션 (clip 미지원)"""
+        options = self.screenshot_options()
+        options.pop("clip", None)
+        return options
+
+
+# 결과물별 배치 영역 / 캡처 조건
+# boxes: 이 이미지가 들어가는 슬라이드 영역 (첫 번째가 비율 기준)
+# viewport: 기본 뷰포트, area: 캡처 가능한 영역 (x, y, w, h) — 이 안에서 clip 계산
+# content: 요소 캡처일 때 요소의 대략적인 CSS 크기
+# image_type / quality: 저장 형식 (없으면 PNG)
+_PROFILE_SPECS: Dict[str, dict] = {
+    # 네이버지도 위성지도 (단지위치) — 컨트롤이 없는 중앙 600×600
+    "site_plan": {
+        "boxes": ("overview_site_plan", "property_dong"),
+        "viewport": (1000, 900),
+        "area": (100, 100, 600, 600),
+        "square": True,
+        "image_type": "jpeg",
+        "quality": 85,
+    },
+    # 네이버지도 경로 — 좌측 패널(약 380px)을 숨겨도 경로는 나머지 영역에 맞춰져 있음
+    "route": {
+        "boxes": ("location_walk", "location_transit", "school_elementary"),
+        "viewport": (1280, 900),
+        "area": (380, 0, 900, 900),
+    },
+    # 아실 학군지도 (#map 요소) — 뷰포트를 영역 비율로 맞춤
+    "school_map": {
+        "boxes": ("school_middle_high",),
+        "viewport": (1400, 900),
+        "content": (1400, 900),
+        "fit_viewport": True,
+    },
+    # 아실 매매가 차트 (#chartHolder1) + 같은 세션의 거래내역 표 (폭 480)
+    "asil_chart": {
+        "boxes": ("price_graph", "price_deals"),
+        "viewport": (1400, 900),
+        "content": (900, 500),
+        "image_type": "jpeg",
+        "quality": 85,
+    },
+    # 네이버부동산 단지정보 요약 리스트
+    "complex_detail": {
+        "boxes": ("overview_site_plan",),
+        "viewport": (1400, 900),
+        "content": (560, 400),
+    },
+}
+
+
+def _box_size(name: str) -> Tuple[float, float]:
+    _, _, width, height = IMAGE_BOXES[name]
+    return width, height
+
+
+def _fit_aspect(area: Tuple[int, int, int, int], aspect: float) -> Tuple[int, int, int, int]:
+    """area 안에서 가로/세로 비율이 aspect인 중앙 최대 사각형"""
+    x, y, w, h = area
+    if w / h > aspect:
+        new_w, new_h = round(h * aspect), h
+    else:
+        new_w, new_h = w, round(w / aspect)
+    return x + (w - new_w) // 2, y + (h - new_h) // 2, new_w, new_h
+
+
+def _scale_for(size: Tuple[int, int], boxes, dpi: int) -> float:
+    """size(CSS px) 이미지가 모든 영역에서 dpi 이상이 되는 배율 (1~2, 0.25 단위)"""
+    need = 1.0
+    for box in boxes:
+        box_w, box_h = _box_size(box)
+        need = max(need, box_w * dpi / size[0], box_h * dpi / size[1])
+    return min(2.0, math.ceil(need * 4) / 4)
+
+
+def build_capture_profile(name: str, dpi: int = DEFAULT_DPI, image_type: str = "png",
+                          quality: Optional[int] = None) -> CaptureProfile:
+    """_PROFILE_SPECS 항목 → CaptureProfile"""
+    spec = _PROFILE_SPECS[name]
+    boxes = spec["boxes"]
+    box_w, box_h = _box_size(boxes[0])
+    aspect = 1.0 if spec.get("square") else box_w / box_h
+    vw, vh = spec["viewport"]
+
+    clip = None
+    if "area" in spec:
+        clip = _fit_aspect(spec["area"], aspect)
+        scale = _scale_for((clip[2], clip[3]), boxes, dpi)
+    else:
+        cw, ch = spec["content"]
+        if spec.get("fit_viewport"):
+            vh = round(vw / aspect)
+            cw, ch = vw, vh
+        scale = _scale_for((cw, ch), boxes, dpi)
+
+    return CaptureProfile(
+        name=name,
+        viewport_width=vw,
+        viewport_height=vh,
+        device_scale_factor=scale,
+        clip=clip,
+        image_type=image_type,
+        quality=quality if image_type == "jpeg" else None,
+    )
+
+
+_PROFILES: Dict[str, CaptureProfile] = {}
+
+
+def get_capture_profile(name: str) -> CaptureProfile:
+    """이름으로 캡처 프로필 조회 (처음 조회할 때 계산 후 캐시)"""
+    profile = _PROFILES.get(name)
+    if profile is None:
+        spec = _PROFILE_SPECS[name]
+        profile = _PROFILES[name] = build_capture_profile(
+            name, image_type=spec.get("image_type", "png"), quality=spec.get("quality"),
+        )
+    return profile
@@ -0,0 +1,142 @@
+"""
+우선순위 캐스케이드 실행기
+느린 원격 소스를 동시에 시작해 두고, 즉시 얻을 수 있는 로컬 결과를 잠정 답으로 쥔 채
+마감 시간 안에 더 높은 우선순위 소스가 답하면 그 결과로 교체한다.
+
+소스별 응답 시간 / 적중률은 프로세스 전체에서 누적해 get_cascade_stats()로 조회한다.
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+# ─── 소스별 통계 ───
+
+_STATS: Dict[str, Dict[str, float]] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def _record(name: str, hit: bool, elapsed: Optional[float]):
+    """
+    소스 1회 실행 결과 기록
+
+    elapsed가 None이면 결과를 기다리지 않고 버린 경우 (마감 초과, 또는 더 높은 순위가 이미 답함)
+    """
+    with _STATS_LOCK:
+        stat = _STATS.setdefault(name, {"calls": 0, "hits": 0, "abandoned": 0, "total_sec": 0.0})
+        stat["calls"] += 1
+        if elapsed is None:
+            stat["abandoned"] += 1
+            return
+        stat["total_sec"] += elapsed
+        if hit:
+            stat["hits"] += 1
+
+
+def get_cascade_stats() -> Dict[str, Dict[str, float]]:
+    """
+    소스별 누적 통계
+
+    Returns:
+        {소스명: {"calls", "hits", "abandoned", "hit_rate", "avg_ms"}}
+        (hit_rate는 전체 호출 대비, avg_ms는 끝까지 기다린 호출 기준)
+    """
+    with _STATS_LOCK:
+        result = {}
+        for name, s in _STATS.items():
+            finished = s["calls"] - s["abandoned"]
+            result[name] = {
+                "calls": s["calls"],
+                "hits": s["hits"],
+                "abandoned": s["abandoned"],
+                "hit_rate": s["hits"] / s["calls"] if s["calls"] else 0.0,
+                "avg_ms": s["total_sec"] / finished * 1000 if finished else 0.0,
+            }
+        return result
+
+
+def format_cascade_stats() -> str:
+    """통계 요약 문자열 (로그 출력용)"""
+    lines = []
+    for name, s in sorted(get_cascade_stats().items()):
+        lines.append(
+            f"  {name:<24} 호출 {s['calls']:>3}  적중 {s['hit_rate'] * 100:5.1f}%  "
+            f"평균 {s['avg_ms']:7.0f}ms  중단 {s['abandoned']}"
+        )
+    return "\n".join(lines)
+
+
+# ─── 실행 ───
+
+def _timed(name: str, func: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    try:
+        result = func()
+    except Exception as e:
+        print(f"  [WARN] {name} 실패: {e}")
+        result = None
+    return result, time.perf_counter() - start
+
+
+def run_cascade(
+    remote: Sequence[Tuple[str, Callable[[], Any]]],
+    local: Optional[Tuple[str, Callable[[], Any]]] = None,
+    deadline: float = 8.0,
+    is_hit: Callable[[Any], bool] = bool,
+) -> Tuple[Any, Optional[str]]:
+    """
+    캐스케이드 실행
+
+    Args:
+        remote: [(소스명, 함수)] — 앞쪽일수록 우선순위가 높다. 모두 동시에 시작
+        local: (소스명, 함수) — 가장 낮은 우선순위. 원격 소스를 시작한 뒤 바로 실행해 잠정 답으로 사용
+        deadline: 원격 소스를 기다리는 최대 시간 (초)
+        is_hit: 결과가 쓸 만한지 판단하는 함수 (기본: truthy)
+
+    Returns:
+        (결과, 채택된 소스명) — 아무것도 없으면 (None, None)
+    """
+    best, best_name, best_rank = None, None, len(remote)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(remote)), thread_name_prefix="cascade")
+    futures = {
+        pool.submit(_timed, name, func): (rank, name)
+        for rank, (name, func) in enumerate(remote)
+    }
+    pending = set(futures)
+
+    try:
+        # 로컬 소스는 원격 요청이 진행되는 동안 바로 계산
+        if local:
+            local_name, local_func = local
+            result, elapsed = _timed(local_name, local_func)
+            hit = is_hit(result)
+            _record(local_name, hit, elapsed)
+            if hit:
+                best, best_name = result, local_name
+
+        end = time.monotonic() + deadline
+        while pending:
+            # 잠정 답보다 우선순위가 높은 소스가 남아 있지 않으면 더 기다릴 필요 없음
+            if not any(futures[f][0] < best_rank for f in pending):
+                break
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                rank, name = futures[future]
+                result, elapsed = future.result()
+                hit = is_hit(result)
+                _record(name, hit, elapsed)
+                if hit and rank < best_rank:
+                    best, best_name, best_rank = result, name, rank
+    finally:
+        for future in pending:
+            if not future.cancel():
+                # 이미 실행 중 — 결과를 기다리지 않고 중단으로 기록
+                _record(futures[future][1], False, None)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return best, best_name
@@ -0,0 +1,129 @@
+"""
+엔드포인트 상태 기록 (실행 간 유지)
+같은 기능을 하는 대체 엔드포인트(비공식 API 경로 변형 등)의 최근 성공률/응답시간을
+JSON 파일에 기록해 두고, 다음 요청부터 잘 되는 엔드포인트를 먼저 시도한다.
+연속으로 실패한 엔드포인트는 일정 시간 건너뛴다.
+
+Usage:
+    health = get_endpoint_health()
+    for url in health.order("naver_map.search", SEARCH_URLS):
+        start = time.perf_counter()
+        ok = False
+        try:
+            ...
+            ok = True
+        finally:
+            health.record("naver_map.search", url, ok, time.perf_counter() - start)
+"""
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Optional, Sequence
+
+
+DEFAULT_HEALTH_PATH = os.path.join("temp", "endpoint_health.json")
+
+# 최근 결과 가중치 (지수이동평균)
+_EMA_ALPHA = 0.3
+# 처음 보는 엔드포인트의 성공률 초기값
+_INITIAL_SUCCESS = 0.5
+# 이 횟수만큼 연속 실패하면 COOLDOWN_SEC 동안 건너뜀
+COOLDOWN_AFTER_FAILURES = 3
+COOLDOWN_SEC = 30 * 60
+
+
+class EndpointHealth:
+    """
+    엔드포인트 그룹별 상태 레지스트리
+
+    {그룹: {url: {"success": EMA, "latency_ms": EMA, "fail_streak": N,
+                  "last_fail": ts, "last_ok": ts, "calls": N}}}
+    """
+
+    def __init__(self, path: str = DEFAULT_HEALTH_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, dict]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, dict]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  [WARN] 엔드포인트 상태 파일 로드 실패, 초기화: {e}")
+            return {}
+
+    def _save(self):
+        """원자적 저장 (락 안에서 호출)"""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"  [WARN] 엔드포인트 상태 저장 실패: {e}")
+
+    def _in_cooldown(self, stat: Optional[dict], now: float) -> bool:
+        if not stat or stat.get("fail_streak", 0) < COOLDOWN_AFTER_FAILURES:
+            return False
+        return now - stat.get("last_fail", 0) < COOLDOWN_SEC
+
+    def order(self, group: str, endpoints: Sequence[str]) -> List[str]:
+        """
+        시도할 순서로 정렬된 엔드포인트 목록
+
+        성공률 높은 순 → 응답 빠른 순. 쿨다운 중인 엔드포인트는 제외하되,
+        모두 쿨다운 중이면 전체를 그대로 반환한다 (아무것도 안 해 보는 것보다 낫다).
+        """
+        now = time.time()
+        with self._lock:
+            stats = self._data.get(group, {})
+            ready = [e for e in endpoints if not self._in_cooldown(stats.get(e), now)]
+            if not ready:
+                ready = list(endpoints)
+
+            def key(e):
+                stat = stats.get(e) or {}
+                # 원래 순서를 마지막 기준으로 유지 (안정 정렬)
+                return (-stat.get("success", _INITIAL_SUCCESS), stat.get("latency_ms", 0.0))
+
+            return sorted(ready, key=key)
+
+    def record(self, group: str, endpoint: str, ok: bool, elapsed_sec: float):
+        """요청 1회 결과 기록 후 파일 저장"""
+        now = time.time()
+        with self._lock:
+            stat = self._data.setdefault(group, {}).setdefault(endpoint, {
+                "success": _INITIAL_SUCCESS, "latency_ms": 0.0,
+                "fail_streak": 0, "last_fail": 0, "last_ok": 0, "calls": 0,
+            })
+            stat["calls"] += 1
+            stat["success"] = (1 - _EMA_ALPHA) * stat["success"] + _EMA_ALPHA * (1.0 if ok else 0.0)
+            if ok:
+                latency_ms = elapsed_sec * 1000
+                prev = stat["latency_ms"]
+                stat["latency_ms"] = latency_ms if not prev else (1 - _EMA_ALPHA) * prev + _EMA_ALPHA * latency_ms
+                stat["fail_streak"] = 0
+                stat["last_ok"] = now
+            else:
+                stat["fail_streak"] += 1
+                stat["last_fail"] = now
+            self._save()
+
+
+_HEALTH: Optional[EndpointHealth] = None
+_HEALTH_LOCK = threading.Lock()
+
+
+def get_endpoint_health() -> EndpointHealth:
+    """프로세스 공용 레지스트리 (temp/endpoint_health.json)"""
+    global _HEALTH
+    with _HEALTH_LOCK:
+        if _HEALTH is None:
+            _HEALTH = EndpointHealth()
+        return _HEALTH
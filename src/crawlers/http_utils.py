@@ -0,0 +1,34 @@
+"""
+HTTP 유틸리티 (httpx 공유 모듈)
+호스트별 동시 요청 제한 등 비동기 크롤링 공통 로직
+"""
+import asyncio
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostLimiter:
+    """
+    호스트별 동시 요청 수 제한
+
+    같은 호스트로 가는 요청은 per_host 개까지만 동시에 진행된다.
+    asyncio.Semaphore는 이벤트 루프에 묶이므로 코루틴 실행 단위로 생성해서 사용한다.
+
+    Usage:
+        limiter = HostLimiter(per_host=4)
+        async with limiter.limit(url):
+            resp = await client.get(url)
+    """
+
+    def __init__(self, per_host: int = 4):
+        self.per_host = max(1, per_host)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def limit(self, url: str) -> asyncio.Semaphore:
+        """url의 호스트에 해당하는 Semaphore 반환"""
+        host = urlparse(url).netloc
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host)
+            self._semaphores[host] = sem
+        return sem
@@ -0,0 +1,166 @@
+"""
+국토부 실거래가 XML 파서
+lxml iterparse로 <item>을 하나씩 스트리밍 파싱 → compact 레코드 생성
+
+응답 트리 전체를 만들지 않고, 처리한 <item>은 즉시 메모리에서 해제한다.
+아파트명 필터를 주면 다른 단지 item은 나머지 필드를 변환하지 않고 건너뛴다.
+"""
+from io import BytesIO
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from lxml import etree
+
+from src.utils.text_helpers import normalize_apt_name, apt_base_name
+
+
+class MolitRecord(NamedTuple):
+    """국토부 실거래 item 1건 (월 단위 응답 안에서의 레코드)"""
+    apt_name: str       # "중계그린"
+    jibun: str          # "450" (없으면 "")
+    day: int            # 거래일
+    floor: int
+    area_m2: float      # 전용면적
+    price_raw: int      # 원 단위
+
+
+# XML 태그 → 레코드 필드
+_FIELD_TAGS = {
+    "아파트": "apt_name",
+    "지번": "jibun",
+    "일": "day",
+    "층": "floor",
+    "전용면적": "area_m2",
+    "거래금액": "price_raw",
+}
+
+_REQUIRED_FIELDS = ("day", "floor", "area_m2", "price_raw")
+
+
+def _build_record(fields: dict) -> Optional[MolitRecord]:
+    """수집한 필드 문자열 → MolitRecord (필수 필드 누락/형식 오류 시 None)"""
+    if not all(fields.get(k) for k in _REQUIRED_FIELDS):
+        return None
+    try:
+        return MolitRecord(
+            apt_name=fields.get("apt_name", ""),
+            jibun=fields.get("jibun", ""),
+            day=int(fields["day"]),
+            floor=int(fields["floor"]),
+            area_m2=float(fields["area_m2"]),
+            price_raw=int(fields["price_raw"].replace(",", "")) * 10000,
+        )
+    except ValueError:
+        return None
+
+
+def iter_molit_records(
+    xml: Union[bytes, str],
+    apt_filter: Optional[Callable[[str], bool]] = None,
+) -> Iterator[MolitRecord]:
+    """
+    국토부 실거래 API 응답 XML에서 item 레코드를 순서대로 yield
+
+    Args:
+        xml: 응답 본문 (bytes 권장 — XML 선언의 인코딩을 그대로 사용)
+        apt_filter: 아파트명을 받아 포함 여부를 반환하는 함수 (None이면 전체)
+
+    Yields:
+        MolitRecord
+    """
+    if isinstance(xml, str):
+        xml = xml.encode("utf-8")
+
+    fields = {}
+    skip = False
+    for _, elem in etree.iterparse(BytesIO(xml), events=("end",), recover=True):
+        tag = elem.tag
+        if tag == "item":
+            if not skip:
+                record = _build_record(fields)
+                if record:
+                    yield record
+            fields = {}
+            skip = False
+            # 처리 끝난 item 해제 (이전 형제 노드까지)
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+            continue
+
+        if skip:
+            continue
+        name = _FIELD_TAGS.get(tag)
+        if not name:
+            continue
+        text = (elem.text or "").strip()
+        if name == "apt_name" and apt_filter and not apt_filter(text):
+            skip = True
+            continue
+        fields[name] = text
+
+
+# ─── 구-월 단위 단지명 인덱스 ───
+
+def _jibun_main(jibun: str) -> str:
+    """지번 본번만 추출 ("450-1" → "450")"""
+    return (jibun or "").strip().split("-")[0]
+
+
+class MolitDistrictIndex:
+    """
+    구-월 단위 응답 전체를 정규화된 단지명(+지번)으로 한 번만 그룹핑한 인덱스
+
+    같은 구의 단지 여러 개를 처리할 때 단지마다 item 전체를 다시 훑지 않고
+    lookup()으로 해당 단지 레코드를 바로 꺼낸다.
+    """
+
+    def __init__(self, records: Iterable[MolitRecord]):
+        self._by_name: Dict[str, List[MolitRecord]] = defaultdict(list)
+        self._by_name_jibun: Dict[Tuple[str, str], List[MolitRecord]] = defaultdict(list)
+        self._names_by_base: Dict[str, List[str]] = defaultdict(list)
+        self.size = 0
+
+        for rec in records:
+            key = normalize_apt_name(rec.apt_name)
+            if key not in self._by_name:
+                self._names_by_base[apt_base_name(key)].append(key)
+            self._by_name[key].append(rec)
+            jibun = _jibun_main(rec.jibun)
+            if jibun:
+                self._by_name_jibun[(key, jibun)].append(rec)
+            self.size += 1
+
+    def lookup(self, complex_name: str, jibun: str = "") -> List[MolitRecord]:
+        """
+        단지명(+지번)으로 레코드 조회
+
+        1. 정규화된 단지명 완전 일치 (공백/"아파트"/괄호 차이 무시)
+        2. 없으면 차수·단지 접미사를 뗀 이름으로 일치 — 단, 단지명에 "N차"처럼
+           접미사가 있으면 다른 차수와 섞이지 않도록 접미사 없는 이름만 허용
+        3. 지번이 주어지고 일치하는 레코드가 있으면 그 레코드만 반환
+        """
+        key = normalize_apt_name(complex_name)
+        base = apt_base_name(key)
+
+        if key in self._by_name:
+            names = [key]
+        elif base != key:
+            names = [base] if base in self._by_name else []
+        else:
+            names = self._names_by_base.get(base, [])
+
+        jibun = _jibun_main(jibun)
+        if jibun:
+            by_jibun = []
+            for name in names:
+                by_jibun.extend(self._by_name_jibun.get((name, jibun), []))
+            if by_jibun:
+                return by_jibun
+
+        rows = []
+        for name in names:
+            rows.extend(self._by_name[name])
+        return rows
@@ -0,0 +1,138 @@
+"""
+네이버 클라우드 Directions API 경로 제공자
+config.yaml의 naver_maps_client_id / naver_maps_client_secret으로 공식 길찾기 API를 호출해
+출발지 → 목적지 도로 거리 / 경로 좌표를 얻는다.
+
+- 공식 Directions API는 자동차 경로만 제공한다. 도보 시간은 직선거리 대신
+  도로 거리 기준으로 계산하고 (보행속도 4.5km/h), 대중교통 시간은 기존처럼
+  내장 노선망 그래프 / 지도 API를 사용한다
+- 여러 구간은 동시에 요청하고, 결과는 좌표 캐시(geo_cache "directions")에 저장한다
+- 키가 없거나 실패하면 None — 호출하는 쪽에서 기존 추정값을 사용
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from src.utils.geo_cache import get_geo_cache
+
+
+DEFAULT_DIRECTIONS_URL = "https://maps.apigw.ntruss.com/map-direction/v1/driving"
+
+# 도보 속도 (km/h, naver_map과 동일)
+WALK_SPEED_KMH = 4.5
+# 동시에 보내는 요청 수
+MAX_CONCURRENCY = 4
+
+Point = Tuple[float, float]  # (lat, lng)
+
+
+def has_directions_keys(config: Optional[dict]) -> bool:
+    """Directions API 인증키가 설정되어 있는지"""
+    config = config or {}
+    return bool(config.get("naver_maps_client_id") and config.get("naver_maps_client_secret"))
+
+
+def _goal_label(goal: Point) -> str:
+    """캐시 라벨: 목적지 좌표 (약 10m 단위)"""
+    return f"{goal[0]:.4f},{goal[1]:.4f}"
+
+
+def _parse_route(data: dict) -> Optional[Dict]:
+    """응답 JSON → 경로 dict (code 0이 아니면 None)"""
+    if data.get("code") != 0:
+        return None
+    routes = data.get("route", {})
+    for option_routes in routes.values():
+        if not option_routes:
+            continue
+        route = option_routes[0]
+        summary = route.get("summary", {})
+        distance_m = summary.get("distance", 0)
+        duration_ms = summary.get("duration", 0)
+        if not distance_m:
+            continue
+        return {
+            "distance_m": distance_m,
+            "drive_minutes": max(1, round(duration_ms / 60000)),
+            "walk_minutes": max(1, round(distance_m / 1000 * 60 / WALK_SPEED_KMH)),
+            "path": route.get("path", []),  # [[lng, lat], ...]
+        }
+    return None
+
+
+def fetch_route(
+    start: Point,
+    goal: Point,
+    config: dict,
+    timeout: float = 10.0,
+) -> Optional[Dict]:
+    """
+    출발지 → 목적지 경로 1건
+
+    Args:
+        start, goal: (lat, lng)
+        config: naver_maps_client_id / naver_maps_client_secret / naver_maps_directions_url
+
+    Returns:
+        {"distance_m": 도로 거리, "drive_minutes": 자동차 소요시간,
+         "walk_minutes": 도로 거리 기준 도보 시간, "path": [[lng, lat], ...]} 또는 None
+    """
+    if not has_directions_keys(config) or not all(start) or not all(goal):
+        return None
+
+    cache = get_geo_cache(config)
+    label = _goal_label(goal)
+    cached = cache.get_value("directions", start[0], start[1], label=label)
+    if cached:
+        return cached
+
+    url = config.get("naver_maps_directions_url") or DEFAULT_DIRECTIONS_URL
+    headers = {
+        "X-NCP-APIGW-API-KEY-ID": config["naver_maps_client_id"],
+        "X-NCP-APIGW-API-KEY": config["naver_maps_client_secret"],
+    }
+    params = {
+        "start": f"{start[1]},{start[0]}",
+        "goal": f"{goal[1]},{goal[0]}",
+        "option": "trafast",
+    }
+    try:
+        resp = httpx.get(url, params=params, headers=headers, timeout=timeout)
+        if resp.status_code != 200:
+            print(f"  [WARN] Directions API 응답 오류: HTTP {resp.status_code}")
+            return None
+        route = _parse_route(resp.json())
+    except Exception as e:
+        print(f"  [WARN] Directions API 요청 실패: {e}")
+        return None
+
+    if route:
+        cache.put_value("directions", start[0], start[1], route, label=label)
+    return route
+
+
+def fetch_routes(
+    pairs: Dict[str, Tuple[Point, Point]],
+    config: dict,
+    timeout: float = 10.0,
+) -> Dict[str, Optional[Dict]]:
+    """
+    여러 구간 동시 조회
+
+    Args:
+        pairs: {이름: (출발 (lat, lng), 도착 (lat, lng))}
+
+    Returns:
+        {이름: fetch_route 결과 또는 None}
+    """
+    if not pairs or not has_directions_keys(config):
+        return {name: None for name in pairs}
+
+    workers = min(MAX_CONCURRENCY, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="directions") as pool:
+        futures = {
+            name: pool.submit(fetch_route, start, goal, config, timeout)
+            for name, (start, goal) in pairs.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
@@ -15,8 +15,9 @@ import re
 import httpx
 from typing import Optional, Dict, Any, List, Tuple
 
-from src.models import ComplexInfo, PropertyDetail
+from src.models import ComplexInfo, ImageAsset, ImageRef, PropertyDetail
 from src.utils.url_parser import parse_naver_land_url
+from src.crawlers.naver_static_map import has_static_map_keys, fetch_site_plan_static
 
 
 # ─── 상수 ───
@@ -249,10 +250,9 @@ def _fetch_article_list(
 
 # ─── 이미지 다운로드 ───
 
-def _download_image(url: str, save_path: str) -> bool:
-    """이미지 다운로드"""
+def _download_image(url: str, save_path: str) -> Optional[ImageAsset]:
+    """이미지 다운로드 → ImageAsset (save_path 사본은 백그라운드 저장)"""
     try:
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
         headers = {
             "User-Agent": DESKTOP_UA,
             "Referer": "https://fin.land.naver.com/",
@@ -260,12 +260,11 @@ def _download_image(url: str, save_path: str) -> bool:
         with httpx.Client(headers=headers, timeout=30.0, follow_redirects=True) as client:
             response = client.get(url)
             response.raise_for_status()
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-        return True
+            asset = ImageAsset.from_bytes(response.content, path=save_path)
+        return asset.write_behind()
     except Exception as e:
         print(f"[ERROR] 이미지 다운로드 실패: {url[:80]} - {e}")
-        return False
+        return None
 
 
 # ─── 학교 SSR 데이터 추출 ───
@@ -399,6 +398,7 @@ def fetch_complex_info(complex_id: str, temp_dir: str = "temp") -> Optional[Comp
             "dong_count": dong_count,
             "construction_company": construction_company,
             "road_address": road_address,
+            "jibun": addr.get("jibun", ""),
         }
         try:
             with open(os.path.join(debug_dir, "meta.json"), "w", encoding="utf-8") as f:
@@ -451,7 +451,7 @@ def fetch_complex_info(complex_id: str, temp_dir: str = "temp") -> Optional[Comp
 
 def _download_complex_photo(
     complex_id: str, photos: List[Dict], temp_dir: str
-) -> Optional[str]:
+) -> Optional[ImageRef]:
     """단지 전경사진 다운로드"""
     save_path = os.path.join(temp_dir, complex_id, "aerial.jpg")
 
@@ -477,23 +477,39 @@ def _download_complex_photo(
         photo_url = photos[0].get("url", "")
 
     if photo_url:
-        if _download_image(photo_url, save_path):
-            return save_path
+        return _download_image(photo_url, save_path)
 
     return None
 
 
-def _load_legal_division(complex_id: str, temp_dir: str) -> str:
-    """저장된 메타데이터에서 법정동코드 로드"""
+def _load_meta(complex_id: str, temp_dir: str) -> Dict[str, Any]:
+    """저장된 단지 메타데이터(meta.json) 로드"""
     meta_path = os.path.join(temp_dir, complex_id, "meta.json")
     if os.path.exists(meta_path):
         try:
             with open(meta_path, "r", encoding="utf-8") as f:
-                meta = json.load(f)
-                return meta.get("legal_division_number", "0000000000")
+                return json.load(f)
         except Exception:
             pass
-    return "0000000000"
+    return {}
+
+
+def _load_legal_division(complex_id: str, temp_dir: str) -> str:
+    """저장된 메타데이터에서 법정동코드 로드"""
+    return _load_meta(complex_id, temp_dir).get("legal_division_number", "0000000000")
+
+
+def load_lawd_cd(complex_id: str, temp_dir: str = "temp") -> str:
+    """저장된 메타데이터에서 실거래가 API용 시군구 코드(법정동코드 앞 5자리) 로드"""
+    legal_division = _load_legal_division(complex_id, temp_dir)
+    if not legal_division or legal_division == "0000000000":
+        return ""
+    return legal_division[:5]
+
+
+def load_jibun(complex_id: str, temp_dir: str = "temp") -> str:
+    """저장된 메타데이터에서 단지 지번 로드 (실거래가 동명 단지 구분용)"""
+    return _load_meta(complex_id, temp_dir).get("jibun", "")
 
 
 def fetch_property_detail(
@@ -602,8 +618,8 @@ def fetch_property_detail(
             img_save_path = os.path.join(temp_dir, complex_id, f"article_{article_no}.jpg")
             if os.path.exists(img_save_path):
                 article_img_path = img_save_path
-            elif _download_image(rep_img, img_save_path):
-                article_img_path = img_save_path
+            else:
+                article_img_path = _download_image(rep_img, img_save_path)
 
         # 태그에서 방 정보 추출
         tags = article_data.get("tagList", [])
@@ -713,7 +729,7 @@ def _download_floor_plan_from_ssr(
     complex_id: str,
     area_pyeong: str,
     temp_dir: str,
-) -> Optional[str]:
+) -> Optional[ImageRef]:
     """
     SSR HTML에서 평면도 이미지 URL 추출 → 다운로드.
 
@@ -723,7 +739,7 @@ def _download_floor_plan_from_ssr(
         temp_dir: 이미지 저장 폴더
 
     Returns:
-        저장된 이미지 파일 경로 또는 None
+        다운로드한 ImageAsset, 이전에 저장된 파일 경로 또는 None
     """
     save_path = os.path.join(temp_dir, complex_id, "floor_plan.jpg")
 
@@ -757,9 +773,10 @@ def _download_floor_plan_from_ssr(
         image_urls = base[key]
         if image_urls:
             url = image_urls[0]
-            if _download_image(url, save_path):
+            asset = _download_image(url, save_path)
+            if asset:
                 print(f"  [OK] 평면도 다운로드 완료")
-                return save_path
+                return asset
             break
 
     print(f"  [WARN] 평면도 다운로드 실패")
@@ -772,7 +789,7 @@ async def _capture_site_plan_async(
     longitude: float,
     temp_dir: str,
     timeout: int = 30000,
-) -> Optional[str]:
+) -> Optional[ImageRef]:
     """
     네이버지도 위성+건물지도에서 단지 위치 스크린샷 캡처.
 
@@ -780,14 +797,19 @@ async def _capture_site_plan_async(
     건물 배치/동 번호가 보이는 이미지를 생성.
 
     Returns:
-        저장된 이미지 파일 경로 또는 None
+        캡처한 ImageAsset, 이전에 저장된 파일 경로 또는 None
     """
     from playwright.async_api import async_playwright
+    from src.crawlers.capture_profiles import get_capture_profile
 
-    save_path = os.path.join(temp_dir, complex_id, "site_plan.png")
-    if os.path.exists(save_path):
-        print(f"  [CACHE] 단지위치 캐시 사용")
-        return save_path
+    profile = get_capture_profile("site_plan")
+    base_path = os.path.join(temp_dir, complex_id, "site_plan.png")
+    save_path = profile.path_for(base_path)
+    # 이전 캡처 또는 Static Map API로 받은 PNG
+    for cached_path in (save_path, base_path):
+        if os.path.exists(cached_path):
+            print(f"  [CACHE] 단지위치 캐시 사용")
+            return cached_path
 
     if not latitude or not longitude:
         print(f"  [SKIP] 좌표 없음 → 단지위치 캡처 생략")
@@ -802,8 +824,8 @@ async def _capture_site_plan_async(
                 args=["--disable-blink-features=AutomationControlled"],
             )
             context = await browser.new_context(
-                viewport={"width": 1000, "height": 900},
-                device_scale_factor=2,
+                viewport=profile.viewport,
+                device_scale_factor=profile.device_scale_factor,
                 locale="ko-KR",
                 user_agent=DESKTOP_UA,
             )
@@ -825,15 +847,13 @@ async def _capture_site_plan_async(
             await page.wait_for_timeout(500)
 
             # 중앙 영역만 클리핑 (UI 컨트롤 제외)
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            clip = {"x": 100, "y": 100, "width": 600, "height": 600}
-            await page.screenshot(path=save_path, clip=clip)
+            data = await page.screenshot(**profile.screenshot_options())
 
             await context.close()
             await browser.close()
 
         print(f"  [OK] 단지위치 지도 캡처 완료")
-        return save_path
+        return ImageAsset.from_bytes(data, path=save_path).write_behind()
 
     except Exception as e:
         print(f"  [WARN] 단지위치 캡처 실패: {e}")
@@ -846,12 +866,14 @@ def capture_complex_images(
     temp_dir: str,
     latitude: float = 0.0,
     longitude: float = 0.0,
+    config: Optional[dict] = None,
 ) -> dict:
     """
     단지 평면도 + 단지위치 이미지 캡처 (메인 진입점).
 
     1. 평면도: SSR HTML에서 URL 추출 → 직접 다운로드
-    2. 단지위치: 네이버지도에서 건물배치 지도 스크린샷
+    2. 단지위치: 네이버 클라우드 Static Map API (키가 있을 때)
+                 → 없거나 실패하면 네이버지도 건물배치 지도 스크린샷
 
     Args:
         complex_id: 단지 ID
@@ -859,9 +881,11 @@ def capture_complex_images(
         temp_dir: 이미지 저장 폴더
         latitude: 단지 위도
         longitude: 단지 경도
+        config: 설정 (naver_maps_client_id / naver_maps_client_secret)
 
     Returns:
-        {"floor_plan_path": str|None, "site_plan_path": str|None}
+        {"floor_plan_path": ImageAsset|str|None, "site_plan_path": ImageAsset|str|None}
+        (새로 받은 이미지는 ImageAsset, 이전에 저장된 파일은 경로)
     """
     from src.crawlers.browser_utils import is_playwright_available, run_async
 
@@ -873,7 +897,15 @@ def capture_complex_images(
         complex_id, area_pyeong, temp_dir
     )
 
-    # 2. 단지위치 — 네이버지도 스크린샷
+    # 2. 단지위치 — Static Map API → 네이버지도 스크린샷
+    site_plan_path = os.path.join(temp_dir, complex_id, "site_plan.png")
+    if latitude and longitude and not os.path.exists(site_plan_path) and has_static_map_keys(config):
+        result["site_plan_path"] = fetch_site_plan_static(
+            latitude, longitude, site_plan_path, config,
+        )
+        if result["site_plan_path"]:
+            return result
+
     if is_playwright_available() and latitude and longitude:
         site_plan = run_async(
             _capture_site_plan_async(complex_id, latitude, longitude, temp_dir)
@@ -893,16 +925,18 @@ async def _capture_complex_detail_async(
     complex_id: str,
     temp_dir: str,
     timeout: int = 30000,
-) -> Optional[str]:
+) -> Optional[ImageRef]:
     """
     fin.land.naver.com 단지정보 페이지에서 기본 정보(세대수, 사용승인일 등)
     상세 리스트를 스크린샷 캡처.
 
     Returns:
-        저장된 이미지 파일 경로 또는 None
+        캡처한 ImageAsset, 이전에 저장된 파일 경로 또는 None
     """
     from playwright.async_api import async_playwright
+    from src.crawlers.capture_profiles import get_capture_profile
 
+    profile = get_capture_profile("complex_detail")
     save_path = os.path.join(temp_dir, complex_id, "complex_detail.png")
     if os.path.exists(save_path):
         print(f"  [CACHE] 단지정보 스크린샷 캐시 사용")
@@ -917,8 +951,8 @@ async def _capture_complex_detail_async(
                 args=["--disable-blink-features=AutomationControlled"],
             )
             context = await browser.new_context(
-                viewport={"width": 1400, "height": 900},
-                device_scale_factor=2,
+                viewport=profile.viewport,
+                device_scale_factor=profile.device_scale_factor,
                 locale="ko-KR",
                 user_agent=DESKTOP_UA,
             )
@@ -935,12 +969,11 @@ async def _capture_complex_detail_async(
                 '[class*="ComplexBaseInfoSummary"] ul'
             ).first
             if await detail_list.count() > 0:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                await detail_list.screenshot(path=save_path)
+                data = await detail_list.screenshot(**profile.element_screenshot_options())
                 await context.close()
                 await browser.close()
                 print(f"  [OK] 단지정보 스크린샷 캡처 완료")
-                return save_path
+                return ImageAsset.from_bytes(data, path=save_path).write_behind()
 
             await context.close()
             await browser.close()
@@ -956,7 +989,7 @@ async def _capture_complex_detail_async(
 def capture_complex_detail_screenshot(
     complex_id: str,
     temp_dir: str,
-) -> Optional[str]:
+) -> Optional[ImageRef]:
     """단지정보 상세 스크린샷 캡처 (동기 래퍼)"""
     from src.crawlers.browser_utils import is_playwright_available, run_async
 
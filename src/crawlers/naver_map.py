@@ -7,14 +7,20 @@ import os
 import re
 import json
 import math
+import time
 from typing import Optional, Dict, Tuple
 from urllib.parse import quote
 
 import httpx
 
-from src.models import LocationInfo
+from src.models import ImageAsset, LocationInfo
 from src.processors.image_processor import create_placeholder_image
-from src.data.subway_stations import SEOUL_STATIONS
+from src.data.station_index import StationHit, get_station_index
+from src.data.transit_graph import get_transit_graph
+from src.crawlers.cascade import run_cascade
+from src.crawlers.endpoint_health import get_endpoint_health
+from src.crawlers.naver_directions import has_directions_keys, fetch_routes
+from src.utils.geo_cache import get_geo_cache
 
 
 DESKTOP_UA = (
@@ -162,42 +168,42 @@ def _find_nearest_station_db(lat: float, lng: float) -> Dict:
     if not lat or not lng:
         return {}
 
-    nearest_any = None
-    nearest_any_dist = float("inf")
-    nearest_preferred = None
-    nearest_preferred_dist = float("inf")
-
-    for name, line, s_lat, s_lng in SEOUL_STATIONS:
-        dist_m = _haversine_km(lat, lng, s_lat, s_lng) * 1000
-        entry = {
-            "station_name": name + "역" if not name.endswith("역") else name,
-            "line": line,
-            "lat": s_lat,
-            "lng": s_lng,
-            "distance_m": dist_m,
-            "walk_minutes": _estimate_walk_minutes(dist_m),
-        }
+    index = get_station_index()
+    nearest_any = index.nearest(lat, lng, k=1)
+    nearest_preferred = index.nearest(
+        lat, lng, k=1,
+        lines=_PREFERRED_LINES, max_distance_m=_PREFERRED_MAX_DISTANCE_M,
+    )
+
+    # 주요 노선 역이 1.5km 이내이면 우선 선택
+    if nearest_preferred:
+        preferred = nearest_preferred[0]
+        if nearest_any and nearest_any[0].distance_m < preferred.distance_m:
+            any_hit = nearest_any[0]
+            print(f"  [교통] {_station_display_name(any_hit.name)}({any_hit.line}) "
+                  f"{any_hit.distance_m:.0f}m 대신 → "
+                  f"{_station_display_name(preferred.name)}({preferred.line}) "
+                  f"{preferred.distance_m:.0f}m 선택 (주요노선 우선)")
+        return _station_entry(preferred)
 
-        # 전체 최근접
-        if dist_m < nearest_any_dist:
-            nearest_any_dist = dist_m
-            nearest_any = entry
+    return _station_entry(nearest_any[0]) if nearest_any else {}
 
-        # 주요 노선 최근접
-        if line in _PREFERRED_LINES and dist_m < nearest_preferred_dist:
-            nearest_preferred_dist = dist_m
-            nearest_preferred = entry
 
-    # 주요 노선 역이 1.5km 이내이면 우선 선택
-    if nearest_preferred and nearest_preferred_dist <= _PREFERRED_MAX_DISTANCE_M:
-        if nearest_any and nearest_any_dist < nearest_preferred_dist:
-            print(f"  [교통] {nearest_any['station_name']}({nearest_any['line']}) "
-                  f"{nearest_any_dist:.0f}m 대신 → "
-                  f"{nearest_preferred['station_name']}({nearest_preferred['line']}) "
-                  f"{nearest_preferred_dist:.0f}m 선택 (주요노선 우선)")
-        return nearest_preferred
+def _station_display_name(name: str) -> str:
+    """역명에 "역" 접미사 붙이기 (강남 → 강남역)"""
+    return name if name.endswith("역") else name + "역"
+
 
-    return nearest_any or {}
+def _station_entry(hit: StationHit) -> Dict:
+    """인덱스 검색 결과 → 역 정보 dict"""
+    return {
+        "station_name": _station_display_name(hit.name),
+        "line": hit.line,
+        "lat": hit.lat,
+        "lng": hit.lng,
+        "distance_m": hit.distance_m,
+        "walk_minutes": _estimate_walk_minutes(hit.distance_m),
+    }
 
 
 # ─── Naver Map 검색 API ───
@@ -221,7 +227,13 @@ def _search_nearby_station_api(lat: float, lng: float) -> Dict:
         "https://map.naver.com/v5/api/search/allSearch",
     ]
 
-    for base_url in search_urls:
+    # 최근에 잘 되던 엔드포인트부터 시도 (연속 실패 중인 것은 잠시 건너뜀)
+    # 역이 없다는 정상 응답은 성공으로 기록 (예외 / 200 이외 / 해석 불가 응답만 실패)
+    health = get_endpoint_health()
+    for base_url in health.order("naver_map.search", search_urls):
+        start = time.perf_counter()
+        result = {}
+        ok = False
         try:
             params = {
                 "query": "지하철역",
@@ -234,15 +246,26 @@ def _search_nearby_station_api(lat: float, lng: float) -> Dict:
                 resp = client.get(base_url, params=params)
                 if resp.status_code == 200:
                     data = resp.json()
-                    result = _parse_station_search_result(data, lat, lng)
-                    if result:
-                        return result
+                    if _is_station_payload(data):
+                        result = _parse_station_search_result(data, lat, lng)
+                        ok = True
         except Exception:
-            continue
+            ok = False
+        health.record("naver_map.search", base_url, ok, time.perf_counter() - start)
+        if result:
+            return result
 
     return {}
 
 
+_STATION_RESULT_KEYS = ("place", "result", "places", "items")
+
+
+def _is_station_payload(data) -> bool:
+    """검색 API 응답 구조를 알아볼 수 있는지 (결과 0건이어도 True)"""
+    return isinstance(data, dict) and any(key in data for key in _STATION_RESULT_KEYS)
+
+
 def _parse_station_search_result(data: dict, origin_lat: float, origin_lng: float) -> Dict:
     """검색 결과에서 가장 가까운 지하철역 정보 추출"""
     # 다양한 응답 구조 시도
@@ -250,7 +273,7 @@ def _parse_station_search_result(data: dict, origin_lat: float, origin_lng: floa
 
     # 일반적인 구조
     if isinstance(data, dict):
-        for key in ["place", "result", "places", "items"]:
+        for key in _STATION_RESULT_KEYS:
             if key in data:
                 items = data[key]
                 if isinstance(items, dict) and "list" in items:
@@ -324,7 +347,12 @@ def _fetch_transit_time_api(
         "https://map.naver.com/p/api/transit/directions/point-to-point",
     ]
 
-    for url in endpoints:
+    # 경로가 없다는 정상 응답은 성공으로 기록 (예외 / 200 이외 / 해석 불가 응답만 실패)
+    health = get_endpoint_health()
+    for url in health.order("naver_map.transit", endpoints):
+        start = time.perf_counter()
+        minutes = 0
+        ok = False
         try:
             params = {
                 "start": f"{start_lng},{start_lat}",
@@ -338,15 +366,26 @@ def _fetch_transit_time_api(
                 resp = client.get(url, params=params)
                 if resp.status_code == 200:
                     data = resp.json()
-                    minutes = _parse_transit_time(data)
-                    if minutes > 0:
-                        return minutes
+                    if _is_transit_payload(data):
+                        minutes = _parse_transit_time(data)
+                        ok = True
         except Exception:
-            continue
+            ok = False
+        health.record("naver_map.transit", url, ok, time.perf_counter() - start)
+        if minutes > 0:
+            return minutes
 
     return 0
 
 
+_TRANSIT_RESULT_KEYS = ("paths", "route", "routes", "duration", "totalTime")
+
+
+def _is_transit_payload(data) -> bool:
+    """경로 API 응답 구조를 알아볼 수 있는지 (경로 0건이어도 True)"""
+    return isinstance(data, dict) and any(key in data for key in _TRANSIT_RESULT_KEYS)
+
+
 def _parse_transit_time(data: dict) -> int:
     """대중교통 경로 응답에서 최단 소요시간 추출"""
     # 다양한 응답 구조 대응
@@ -447,26 +486,28 @@ def fetch_location_info(
     gangnam = config.get("gangnam_station", {})
     gangnam_lat = gangnam.get("lat", GANGNAM_LAT)
     gangnam_lng = gangnam.get("lng", GANGNAM_LNG)
+    gangnam_name = gangnam.get("name", "강남")
+    transit_config = config.get("transit", {})
 
     img_dir = os.path.join(temp_dir, complex_id)
     os.makedirs(img_dir, exist_ok=True)
 
     # ── 1. 가장 가까운 지하철역 찾기 ──
-    station_info = {}
-
-    # 1-1. SSR HTML에서 교통 정보 추출
-    print(f"  [교통] SSR에서 역 정보 추출 시도...")
-    station_info = _fetch_station_from_land_ssr(complex_id)
-
-    # 1-2. Naver Map 검색 API
-    if not station_info and complex_lat and complex_lng:
-        print(f"  [교통] Naver Map API로 근처 역 검색...")
-        station_info = _search_nearby_station_api(complex_lat, complex_lng)
-
-    # 1-3. 내장 지하철역 DB 검색 (fallback)
-    if not station_info and complex_lat and complex_lng:
-        print(f"  [교통] 내장 DB에서 근처 역 검색...")
-        station_info = _find_nearest_station_db(complex_lat, complex_lng)
+    # SSR > Naver Map API > 내장 DB 우선순위. 원격 소스는 동시에 시작하고,
+    # 내장 DB 결과를 잠정 답으로 둔 채 마감 시간 안에 더 높은 순위가 답하면 교체
+    has_coords = bool(complex_lat and complex_lng)
+    remote = [("station.ssr", lambda: _fetch_station_from_land_ssr(complex_id))]
+    if has_coords:
+        remote.append(("station.naver_api", lambda: _search_nearby_station_api(complex_lat, complex_lng)))
+    local = ("station.db", lambda: _find_nearest_station_db(complex_lat, complex_lng)) if has_coords else None
+
+    print(f"  [교통] 근처 역 검색 (SSR / Naver Map API / 내장 DB 동시)...")
+    station_info, station_source = run_cascade(
+        remote, local, deadline=transit_config.get("station_deadline_sec", 8),
+    )
+    station_info = station_info or {}
+    if station_source:
+        print(f"  [교통] 역 정보 출처: {station_source}")
 
     nearest_station = station_info.get("station_name", "")
     station_line = station_info.get("line", "")
@@ -474,7 +515,17 @@ def fetch_location_info(
     walk_minutes = station_info.get("walk_minutes", 0)
     station_transit_minutes = 0
 
-    # 도보 시간 추정 (SSR에 없을 경우)
+    # 도보 시간 (SSR에 없을 경우): Directions API 도로 거리 → 직선거리 추정
+    station_lat = station_info.get("lat", 0)
+    station_lng = station_info.get("lng", 0)
+    if (not walk_minutes and has_coords and station_lat and station_lng
+            and transit_config.get("use_directions_api", True) and has_directions_keys(config)):
+        routes = fetch_routes(
+            {"station": ((complex_lat, complex_lng), (station_lat, station_lng))}, config,
+        )
+        if routes["station"]:
+            walk_minutes = routes["station"]["walk_minutes"]
+            print(f"  [교통] 도로 거리 {routes['station']['distance_m']}m 기준 도보 {walk_minutes}분")
     if not walk_minutes and station_distance_m > 0:
         walk_minutes = _estimate_walk_minutes(station_distance_m)
 
@@ -486,35 +537,57 @@ def fetch_location_info(
     gangnam_minutes = 0
 
     if complex_lat and complex_lng:
-        # 2-1. Naver Map API로 대중교통 소요시간 조회
-        print(f"  [교통] 강남역까지 대중교통 소요시간 조회...")
-        gangnam_minutes = _fetch_transit_time_api(
-            complex_lat, complex_lng, gangnam_lat, gangnam_lng,
-        )
+        # 2-0. 근처 단지에서 이미 조회한 결과 재사용 (좌표 캐시)
+        geo_cache = get_geo_cache(config)
+        gangnam_minutes = geo_cache.get_value(
+            "gangnam_minutes", complex_lat, complex_lng, label=gangnam_name,
+        ) or 0
 
-        # 2-2. API 실패 시 거리 기반 추정
+        # 2-1. Naver Map API로 대중교통 소요시간 조회
+        if gangnam_minutes == 0 and transit_config.get("use_naver_api", True):
+            print(f"  [교통] 강남역까지 대중교통 소요시간 조회...")
+            gangnam_minutes = _fetch_transit_time_api(
+                complex_lat, complex_lng, gangnam_lat, gangnam_lng,
+            )
+            if gangnam_minutes:
+                geo_cache.put_value(
+                    "gangnam_minutes", complex_lat, complex_lng, gangnam_minutes, label=gangnam_name,
+                )
+
+        # 2-2. 내장 노선망 그래프로 계산 (오프라인)
+        if gangnam_minutes == 0:
+            graph_minutes = get_transit_graph().minutes_to(
+                complex_lat, complex_lng, gangnam_lat, gangnam_lng, hub_name=gangnam_name,
+            )
+            if graph_minutes:
+                gangnam_minutes = graph_minutes
+                print(f"  [교통] 노선망 기준 {gangnam_name}역까지 {gangnam_minutes}분")
+
+        # 2-3. 거리 기반 추정
         if gangnam_minutes == 0:
             dist_km = _haversine_km(complex_lat, complex_lng, gangnam_lat, gangnam_lng)
             gangnam_minutes = _estimate_transit_minutes(dist_km)
             print(f"  [교통] 강남역 거리 {dist_km:.1f}km → 추정 {gangnam_minutes}분")
 
-    # ── 3. 이미지 (placeholder) ──
-    walk_img = os.path.join(img_dir, "walk_route.png")
-    transit_img = os.path.join(img_dir, "transit_route.png")
+    # ── 3. 이미지 (캡처는 메모리 이미지, 없으면 이전 파일 / placeholder) ──
+    walk_path = os.path.join(img_dir, "walk_route.png")
+    transit_path = os.path.join(img_dir, "transit_route.png")
 
     # Playwright 사용 가능하면 스크린샷 시도
-    _try_capture_screenshots(
+    captured = _try_capture_screenshots(
         complex_lat, complex_lng, complex_name,
         station_info, gangnam_lat, gangnam_lng,
-        walk_img, transit_img,
+        walk_path, transit_path,
     )
+    walk_img = captured.get("walk") or walk_path
+    transit_img = captured.get("transit") or transit_path
 
     # placeholder 생성 (이미지 없을 때)
-    if not os.path.exists(walk_img):
+    if walk_img is walk_path and not os.path.exists(walk_path):
         label = f"[{nearest_station or complex_name} → 최근접역 경로]"
-        create_placeholder_image(walk_img, 600, 450, text=label)
-    if not os.path.exists(transit_img):
-        create_placeholder_image(transit_img, 600, 450, text="[강남역 대중교통 경로]")
+        create_placeholder_image(walk_path, 600, 450, text=label)
+    if transit_img is transit_path and not os.path.exists(transit_path):
+        create_placeholder_image(transit_path, 600, 450, text="[강남역 대중교통 경로]")
 
     # 역 이름 정리
     if not nearest_station:
@@ -540,14 +613,21 @@ def _try_capture_screenshots(
     station_info: dict,
     gangnam_lat: float, gangnam_lng: float,
     walk_img_path: str, transit_img_path: str,
-):
-    """Playwright 가용 시 경로 스크린샷 캡처 시도"""
+) -> Dict[str, ImageAsset]:
+    """
+    Playwright 가용 시 경로 스크린샷 캡처 시도
+
+    Returns:
+        {"walk": ImageAsset, "transit": ImageAsset} 중 캡처(또는 캐시)된 것만.
+        디스크 사본은 각 경로에 백그라운드로 저장된다.
+    """
     from src.crawlers.browser_utils import is_playwright_available, run_async
 
+    captured: Dict[str, ImageAsset] = {}
     if not is_playwright_available():
-        return
+        return captured
     if not complex_lat or not complex_lng:
-        return
+        return captured
 
     # 도보 경로 (단지 → 최근접역)
     station_lat = station_info.get("lat", 0)
@@ -556,24 +636,39 @@ def _try_capture_screenshots(
 
     if station_lat and station_lng and not os.path.exists(walk_img_path):
         try:
-            run_async(_capture_route_screenshot(
+            asset = run_async(_capture_route_screenshot(
                 complex_lat, complex_lng, complex_name,
                 station_lat, station_lng, station_name,
                 mode="walk", save_path=walk_img_path,
             ))
+            if asset:
+                captured["walk"] = asset
         except Exception as e:
             print(f"  [WARN] 도보 경로 스크린샷 실패: {e}")
 
     # 대중교통 경로 (단지 → 강남역)
-    if not os.path.exists(transit_img_path):
-        try:
-            run_async(_capture_route_screenshot(
-                complex_lat, complex_lng, complex_name,
-                gangnam_lat, gangnam_lng, "강남역",
-                mode="transit", save_path=transit_img_path,
-            ))
-        except Exception as e:
-            print(f"  [WARN] 대중교통 경로 스크린샷 실패: {e}")
+    # 출발지 라벨(단지명)이 지도에 찍히므로 같은 라벨로 캡처한 근처 결과만 재사용
+    if os.path.exists(transit_img_path):
+        return captured
+    geo_cache = get_geo_cache()
+    cached = geo_cache.get_bytes("transit_route", complex_lat, complex_lng, label=complex_name)
+    if cached:
+        captured["transit"] = ImageAsset.from_bytes(cached, path=transit_img_path).write_behind()
+        return captured
+    try:
+        asset = run_async(_capture_route_screenshot(
+            complex_lat, complex_lng, complex_name,
+            gangnam_lat, gangnam_lng, "강남역",
+            mode="transit", save_path=transit_img_path,
+        ))
+        if asset:
+            captured["transit"] = asset
+            geo_cache.put_bytes(
+                "transit_route", complex_lat, complex_lng, asset.data, label=complex_name,
+            )
+    except Exception as e:
+        print(f"  [WARN] 대중교통 경로 스크린샷 실패: {e}")
+    return captured
 
 
 async def _capture_route_screenshot(
@@ -581,9 +676,16 @@ async def _capture_route_screenshot(
     end_lat: float, end_lng: float, end_name: str,
     mode: str, save_path: str,
     timeout: int = 30000,
-) -> Optional[str]:
-    """Playwright로 네이버지도 경로 스크린샷 캡처 (좌측 패널 숨김)"""
+) -> Optional[ImageAsset]:
+    """
+    Playwright로 네이버지도 경로 스크린샷 캡처 (좌측 패널 숨김)
+
+    스크린샷 바이트를 그대로 ImageAsset으로 반환하고, save_path 사본은 백그라운드로 저장한다.
+    """
     from src.crawlers.browser_utils import get_browser_page
+    from src.crawlers.capture_profiles import get_capture_profile
+
+    profile = get_capture_profile("route")
 
     try:
         url = _build_naver_map_directions_url(
@@ -591,7 +693,7 @@ async def _capture_route_screenshot(
             end_lat, end_lng, end_name,
             mode=mode,
         )
-        async with get_browser_page() as page:
+        async with get_browser_page(profile=profile) as page:
             await page.goto(url, wait_until="networkidle", timeout=timeout)
             await page.wait_for_timeout(5000)
 
@@ -604,9 +706,8 @@ async def _capture_route_screenshot(
             }""")
             await page.wait_for_timeout(500)
 
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            await page.screenshot(path=save_path, full_page=False)
-            return save_path
+            data = await page.screenshot(**profile.screenshot_options())
+            return ImageAsset.from_bytes(data, path=save_path).write_behind()
     except Exception as e:
         print(f"  [WARN] 경로 스크린샷 실패 ({mode}): {e}")
         return None
@@ -0,0 +1,146 @@
+"""
+네이버 클라우드 Static Map API 이미지 제공자
+config.yaml에 naver_maps_client_id / naver_maps_client_secret이 있으면
+브라우저로 map.naver.com을 띄우지 않고 HTTP 요청 한 번으로 지도 이미지를 받는다.
+
+- 중심 좌표 / 줌 레벨 / 지도 유형(basic, satellite 등) / 마커 지원
+- Static Map API는 경로(폴리라인) 오버레이를 지원하지 않으므로 경로 이미지는
+  기존 Playwright 캡처를 그대로 사용한다
+- naver_maps_static_url에 로컬 대체 서버 주소를 넣으면 같은 요청(인증 헤더, center/level/
+  markers 파라미터)이 그 서버로 가므로, 실제 키 없이 응답 처리(HTTP 오류, 이미지가 아닌 응답,
+  깨진 이미지 → None)를 확인할 수 있다
+"""
+import os
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+from src.models import ImageAsset
+
+
+DEFAULT_STATIC_MAP_URL = "https://maps.apigw.ntruss.com/map-static/v2/raster"
+
+# API 제한: 가로/세로 최대 1024px, scale 1 또는 2
+MAX_SIZE = 1024
+
+
+def has_static_map_keys(config: Optional[dict]) -> bool:
+    """Static Map API 인증키가 설정되어 있는지"""
+    config = config or {}
+    return bool(config.get("naver_maps_client_id") and config.get("naver_maps_client_secret"))
+
+
+def build_marker(
+    lat: float,
+    lng: float,
+    label: str = "",
+    color: str = "",
+    size: str = "mid",
+    marker_type: str = "d",
+) -> str:
+    """
+    markers 파라미터 값 1개
+
+    Args:
+        marker_type: d(기본) / n(라벨 가능) / a, t(텍스트) 등
+        label: 마커 라벨 (n 타입, 영문/숫자 1자)
+        color: 마커 색 ("0xC8102E" 등, 타입에 따라 무시됨)
+    """
+    parts = [f"type:{marker_type}", f"size:{size}", f"pos:{lng} {lat}"]
+    if label:
+        parts.append(f"label:{label}")
+    if color:
+        parts.append(f"color:{color}")
+    return "|".join(parts)
+
+
+def fetch_static_map(
+    lat: float,
+    lng: float,
+    save_path: str,
+    config: dict,
+    level: int = 16,
+    width: int = 600,
+    height: int = 600,
+    scale: int = 2,
+    maptype: str = "basic",
+    markers: Optional[Sequence[str]] = None,
+    image_format: str = "png",
+    timeout: float = 15.0,
+) -> Optional[ImageAsset]:
+    """
+    Static Map 이미지 1장
+
+    Args:
+        lat, lng: 지도 중심
+        save_path: 디스크 사본 경로 (백그라운드 저장)
+        config: naver_maps_client_id / naver_maps_client_secret / naver_maps_static_url
+        level: 줌 레벨 (1~20, 네이버지도 URL의 줌과 동일)
+        width, height: 논리 픽셀 크기 (최대 1024), 실제 이미지는 × scale
+        maptype: basic / traffic / satellite / satellite_base / terrain
+        markers: build_marker() 값 목록
+
+    Returns:
+        응답 이미지 (ImageAsset) 또는 None
+    """
+    if not has_static_map_keys(config) or not lat or not lng:
+        return None
+
+    url = config.get("naver_maps_static_url") or DEFAULT_STATIC_MAP_URL
+    headers = {
+        "X-NCP-APIGW-API-KEY-ID": config["naver_maps_client_id"],
+        "X-NCP-APIGW-API-KEY": config["naver_maps_client_secret"],
+    }
+    params: Dict[str, object] = {
+        "center": f"{lng},{lat}",
+        "level": level,
+        "w": min(int(width), MAX_SIZE),
+        "h": min(int(height), MAX_SIZE),
+        "scale": 2 if scale >= 2 else 1,
+        "maptype": maptype,
+        "format": image_format,
+        "lang": "ko",
+    }
+    if markers:
+        params["markers"] = list(markers)
+
+    try:
+        resp = httpx.get(url, params=params, headers=headers, timeout=timeout)
+    except Exception as e:
+        print(f"  [WARN] Static Map 요청 실패: {e}")
+        return None
+
+    content_type = resp.headers.get("content-type", "")
+    if resp.status_code != 200 or not content_type.startswith("image/"):
+        detail = resp.text[:120] if not content_type.startswith("image/") else ""
+        print(f"  [WARN] Static Map 응답 오류: HTTP {resp.status_code} {detail}")
+        return None
+
+    try:
+        asset = ImageAsset.from_bytes(resp.content, path=save_path)
+    except Exception as e:
+        print(f"  [WARN] Static Map 이미지 해석 실패: {e}")
+        return None
+    return asset.write_behind()
+
+
+def fetch_site_plan_static(
+    lat: float,
+    lng: float,
+    save_path: str,
+    config: dict,
+    markers: Optional[List[str]] = None,
+) -> Optional[ImageAsset]:
+    """
+    단지위치(배치도) 위성지도 — _capture_site_plan_async와 같은 화면
+    (단지 좌표 중심, zoom 18, 위성+라벨, 600×600 @2x)
+    """
+    asset = fetch_static_map(
+        lat, lng, save_path, config,
+        level=18, width=600, height=600, scale=2,
+        maptype="satellite", markers=markers,
+        image_format=os.path.splitext(save_path)[1].lstrip(".").lower() or "png",
+    )
+    if asset:
+        print(f"  [OK] 단지위치 지도 (Static Map API) 저장 완료")
+    return asset
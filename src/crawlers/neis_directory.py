@@ -0,0 +1,370 @@
+"""
+NEIS 학교 디렉토리 (로컬 sqlite)
+NEIS 개방 API schoolInfo를 시도교육청 단위로 통째로 내려받아 sqlite에 저장해 두고,
+브리핑 생성 중 학교 조회는 로컬 테이블에서 바로 찾는다.
+
+- 조회 키: 표준학교코드(SD_SCHUL_CODE) / 정규화한 학교명 (인덱스)
+- 같은 이름의 학교가 여러 지역에 있으므로 이름 조회는 시도교육청을 먼저 좁혀서 찾는다
+- 교육청별 마지막 갱신 시각을 기록하고 refresh_days가 지나면 다시 내려받는다
+- 대량 조회(pSize 1000)는 NEIS 인증키가 필요 (config.yaml의 neis_api_key)
+  키가 없으면 미리 받아두기를 건너뛰고, 실시간 조회 결과만 테이블에 쌓는다
+
+저장 위치: temp/neis_schools.db
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+
+NEIS_API_URL = "https://open.neis.go.kr/hub/schoolInfo"
+DEFAULT_DIRECTORY_PATH = os.path.join("temp", "neis_schools.db")
+
+# 시도교육청 코드 (ATPT_OFCDC_SC_CODE)
+EDUCATION_OFFICES = {
+    "B10": "서울특별시교육청",
+    "C10": "부산광역시교육청",
+    "D10": "대구광역시교육청",
+    "E10": "인천광역시교육청",
+    "F10": "광주광역시교육청",
+    "G10": "대전광역시교육청",
+    "H10": "울산광역시교육청",
+    "I10": "세종특별자치시교육청",
+    "J10": "경기도교육청",
+    "K10": "강원특별자치도교육청",
+    "M10": "충청북도교육청",
+    "N10": "충청남도교육청",
+    "P10": "전북특별자치도교육청",
+    "Q10": "전라남도교육청",
+    "R10": "경상북도교육청",
+    "S10": "경상남도교육청",
+    "T10": "제주특별자치도교육청",
+}
+# 기본 대상: 수도권
+DEFAULT_OFFICES = ("B10", "J10", "E10")
+
+# 주소 첫 단어(시도) 접두사 → 교육청 코드
+_SIDO_OFFICES = (
+    ("서울", "B10"), ("부산", "C10"), ("대구", "D10"), ("인천", "E10"),
+    ("광주", "F10"), ("대전", "G10"), ("울산", "H10"), ("세종", "I10"),
+    ("경기", "J10"), ("강원", "K10"),
+    ("충북", "M10"), ("충청북", "M10"), ("충남", "N10"), ("충청남", "N10"),
+    ("전북", "P10"), ("전라북", "P10"), ("전남", "Q10"), ("전라남", "Q10"),
+    ("경북", "R10"), ("경상북", "R10"), ("경남", "S10"), ("경상남", "S10"),
+    ("제주", "T10"),
+)
+DEFAULT_REFRESH_DAYS = 30
+
+# NEIS 한 페이지 최대 건수
+_PAGE_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schools (
+    code        TEXT PRIMARY KEY,
+    office_code TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    norm_name   TEXT NOT NULL,
+    kind        TEXT,
+    row_json    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_schools_norm_name ON schools(norm_name);
+CREATE TABLE IF NOT EXISTS refresh_log (
+    office_code  TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL,
+    row_count    INTEGER NOT NULL
+);
+"""
+
+
+def normalize_school_name(name: str) -> str:
+    """학교명 정규화 (공백/괄호/구두점 제거) — '서울 상봉초등학교' → '서울상봉초등학교'"""
+    return re.sub(r"[\s()\[\]·.,\-]", "", name or "")
+
+
+def office_for_address(address: str) -> str:
+    """주소의 시도 → 교육청 코드 ('서울특별시 송파구 거여동' → 'B10', 시도가 없으면 '')"""
+    words = (address or "").split()
+    if not words:
+        return ""
+    for prefix, office in _SIDO_OFFICES:
+        if words[0].startswith(prefix):
+            return office
+    return ""
+
+
+class SchoolDirectory:
+    """
+    학교 디렉토리 테이블
+
+    Usage:
+        directory = get_school_directory(config)
+        directory.refresh(api_key, ["B10"])          # 오래된 교육청만 다시 받기
+        row = directory.lookup(name="상봉초등학교", office_code="B10")  # NEIS schoolInfo row (dict)
+    """
+
+    def __init__(self, path: str = DEFAULT_DIRECTORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    with sqlite3.connect(self.path) as conn:
+                        conn.executescript(_SCHEMA)
+                    self._ready = True
+        return sqlite3.connect(self.path, timeout=10.0)
+
+    # ─── 조회 ───
+
+    def lookup(self, name: str = "", code: str = "", office_code: str = "") -> Optional[Dict]:
+        """
+        학교 조회 (코드 → 정확한 학교명 → 지역 접두사가 빠진 학교명 순)
+
+        office_code를 주면 이름 조회는 그 교육청 안에서 먼저 찾고, 없을 때만 전국에서 찾는다.
+
+        Returns:
+            NEIS schoolInfo row dict 또는 None
+        """
+        norm = normalize_school_name(name)
+        if not code and not norm:
+            return None
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            print(f"  [WARN] 학교 디렉토리 열기 실패: {e}")
+            return None
+        try:
+            row = None
+            if code:
+                row = conn.execute(
+                    "SELECT row_json FROM schools WHERE code = ?", (code,)
+                ).fetchone()
+            for office in ((office_code, "") if office_code else ("",)):
+                if row is not None or not norm:
+                    break
+                where, args = (" AND office_code = ?", (office,)) if office else ("", ())
+                row = conn.execute(
+                    f"SELECT row_json FROM schools WHERE norm_name = ?{where} ORDER BY code LIMIT 1",
+                    (norm, *args),
+                ).fetchone()
+                if row is None and len(norm) >= 4:
+                    # '상봉초등학교' → '서울상봉초등학교'
+                    row = conn.execute(
+                        f"SELECT row_json FROM schools WHERE norm_name LIKE ?{where} "
+                        f"ORDER BY length(norm_name), code LIMIT 1",
+                        ("%" + norm, *args),
+                    ).fetchone()
+            return json.loads(row[0]) if row else None
+        except sqlite3.Error as e:
+            print(f"  [WARN] 학교 디렉토리 조회 실패: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def count(self, office_code: str = "") -> int:
+        """저장된 학교 수 (office_code를 주면 해당 교육청만)"""
+        conn = self._connect()
+        try:
+            if office_code:
+                sql, args = "SELECT COUNT(*) FROM schools WHERE office_code = ?", (office_code,)
+            else:
+                sql, args = "SELECT COUNT(*) FROM schools", ()
+            return conn.execute(sql, args).fetchone()[0]
+        finally:
+            conn.close()
+
+    # ─── 저장 ───
+
+    def upsert(self, rows: Iterable[Dict]) -> int:
+        """NEIS row 저장 (실시간 조회 결과도 여기로 쌓는다). 저장한 건수 반환"""
+        records = []
+        for row in rows:
+            code = row.get("SD_SCHUL_CODE")
+            name = row.get("SCHUL_NM")
+            if not code or not name:
+                continue
+            records.append((
+                code,
+                row.get("ATPT_OFCDC_SC_CODE", ""),
+                name,
+                normalize_school_name(name),
+                row.get("SCHUL_KND_SC_NM", ""),
+                json.dumps(row, ensure_ascii=False),
+            ))
+        if not records:
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO schools "
+                    "(code, office_code, name, norm_name, kind, row_json) VALUES (?, ?, ?, ?, ?, ?)",
+                    records,
+                )
+        finally:
+            conn.close()
+        return len(records)
+
+    def _replace_office(self, office_code: str, rows: List[Dict]):
+        """교육청 전체 교체 (폐교 등 사라진 학교 정리)"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM schools WHERE office_code = ?", (office_code,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO schools "
+                    "(code, office_code, name, norm_name, kind, row_json) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            r["SD_SCHUL_CODE"], office_code, r["SCHUL_NM"],
+                            normalize_school_name(r["SCHUL_NM"]),
+                            r.get("SCHUL_KND_SC_NM", ""),
+                            json.dumps(r, ensure_ascii=False),
+                        )
+                        for r in rows
+                        if r.get("SD_SCHUL_CODE") and r.get("SCHUL_NM")
+                    ],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO refresh_log (office_code, refreshed_at, row_count) VALUES (?, ?, ?)",
+                    (office_code, time.time(), len(rows)),
+                )
+        finally:
+            conn.close()
+
+    # ─── 갱신 ───
+
+    def last_refreshed(self, office_code: str) -> float:
+        """교육청 마지막 갱신 시각 (epoch, 없으면 0)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT refreshed_at FROM refresh_log WHERE office_code = ?", (office_code,)
+            ).fetchone()
+            return row[0] if row else 0.0
+        finally:
+            conn.close()
+
+    def is_stale(self, office_code: str, refresh_days: float = DEFAULT_REFRESH_DAYS) -> bool:
+        return time.time() - self.last_refreshed(office_code) > refresh_days * 86400
+
+    def refresh(
+        self,
+        api_key: str,
+        offices: Iterable[str] = DEFAULT_OFFICES,
+        refresh_days: float = DEFAULT_REFRESH_DAYS,
+        force: bool = False,
+    ) -> Dict[str, int]:
+        """
+        오래된 교육청 데이터를 다시 내려받기
+
+        Returns:
+            {교육청 코드: 저장한 학교 수} (갱신한 교육청만)
+        """
+        updated = {}
+        if not api_key:
+            return updated
+        for office in offices:
+            if not force and not self.is_stale(office, refresh_days):
+                continue
+            name = EDUCATION_OFFICES.get(office, office)
+            print(f"  [NEIS] {name} 학교 목록 내려받는 중...")
+            rows = _download_office(api_key, office)
+            if rows is None:
+                print(f"  [WARN] {name} 학교 목록 다운로드 실패, 기존 데이터 유지")
+                continue
+            self._replace_office(office, rows)
+            updated[office] = len(rows)
+            print(f"  [NEIS] {name} {len(rows)}개 학교 저장")
+        return updated
+
+
+def _download_office(api_key: str, office_code: str, timeout: float = 30.0) -> Optional[List[Dict]]:
+    """교육청 하나의 schoolInfo 전체 (페이지 단위 조회). 실패 시 None"""
+    rows: List[Dict] = []
+    page = 1
+    total = None
+    try:
+        with httpx.Client(timeout=timeout) as client:
+            while total is None or len(rows) < total:
+                resp = client.get(NEIS_API_URL, params={
+                    "KEY": api_key,
+                    "Type": "json",
+                    "ATPT_OFCDC_SC_CODE": office_code,
+                    "pIndex": str(page),
+                    "pSize": str(_PAGE_SIZE),
+                })
+                if resp.status_code != 200:
+                    return None
+                data = resp.json()
+                school_info = data.get("schoolInfo")
+                if not school_info:
+                    # 데이터 없음(INFO-200)은 빈 목록, 그 외 오류는 실패
+                    code = data.get("RESULT", {}).get("CODE", "")
+                    return rows if code == "INFO-200" else None
+                if total is None:
+                    head = school_info[0].get("head", [])
+                    total = head[0].get("list_total_count", 0) if head else 0
+                page_rows = school_info[1].get("row", []) if len(school_info) > 1 else []
+                if not page_rows:
+                    break
+                rows.extend(page_rows)
+                page += 1
+    except Exception as e:
+        print(f"  [WARN] NEIS 학교 목록 조회 실패 ({office_code}): {e}")
+        return None
+    return rows
+
+
+# ─── 공용 인스턴스 ───
+
+_DIRECTORY: Optional[SchoolDirectory] = None
+_DIRECTORY_LOCK = threading.Lock()
+
+
+def get_school_directory(config: Optional[dict] = None) -> SchoolDirectory:
+    """
+    프로세스 공용 학교 디렉토리
+
+    처음 호출할 때 config의 school.directory_path를 사용한다.
+    """
+    global _DIRECTORY
+    with _DIRECTORY_LOCK:
+        if _DIRECTORY is None:
+            school_config = (config or {}).get("school", {})
+            _DIRECTORY = SchoolDirectory(school_config.get("directory_path", DEFAULT_DIRECTORY_PATH))
+        return _DIRECTORY
+
+
+def refresh_school_directory(config: dict, force: bool = False) -> Dict[str, int]:
+    """
+    설정대로 학교 디렉토리 갱신 (실행 시작 시 한 번 호출)
+
+    config:
+        neis_api_key: NEIS 인증키 (없으면 건너뜀)
+        school: {offices: [B10, J10, E10], refresh_days: 30}
+    """
+    api_key = config.get("neis_api_key", "")
+    school_config = config.get("school", {})
+    directory = get_school_directory(config)
+    if not api_key:
+        print(f"  [INFO] neis_api_key 없음 — 학교 디렉토리 미리 받기 생략 (실시간 조회 결과만 저장)")
+        return {}
+    try:
+        return directory.refresh(
+            api_key,
+            offices=school_config.get("offices", DEFAULT_OFFICES),
+            refresh_days=school_config.get("refresh_days", DEFAULT_REFRESH_DAYS),
+            force=force,
+        )
+    except sqlite3.Error as e:
+        print(f"  [WARN] 학교 디렉토리 갱신 실패: {e}")
+        return {}
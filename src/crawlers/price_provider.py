@@ -0,0 +1,286 @@
+"""
+실거래가 헤지(hedged) 수집
+아실 캡처 / 국토부 API / 저장된 실거래 이력을 동시에 시작하고,
+완성도 기준을 넘는 결과가 먼저 나오면 그 결과를 바로 사용한다.
+
+느린 아실 세션이 단지 하나의 처리 시간을 통째로 잡아먹지 않도록,
+남은 작업은 취소(시작 전) 하거나 백그라운드에서 끝나도록 내버려 둔다.
+각 소스는 서로 다른 그래프 파일(price_chart_{소스}.png)에 저장하므로 늦게 끝난 작업이
+결과를 덮어쓰지 않는다. main의 matplotlib 대체 그래프(price_chart.png)와도 겹치지 않는다.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date
+from typing import Callable, Dict, Optional, Tuple
+
+from src.models import PriceInfo
+from src.crawlers.asil import (
+    capture_asil_price_chart,
+    fetch_price_info_from_api,
+    fetch_price_info_mock,
+    _price_info_from_store,
+)
+from src.processors.chart_generator import generate_price_chart_from_columns
+from src.processors.image_optimizer import image_size_bytes
+from src.processors.price_store import PriceHistoryStore
+
+
+# 소스 우선순위 (동시에 끝났거나 아무도 기준을 못 넘었을 때 앞쪽 우선)
+SOURCE_PRIORITY = ("asil", "molit", "cache")
+
+# 그래프 점수를 다 받으려면 필요한 기간 (년) — 아실 그래프는 15년
+DEFAULT_MIN_CHART_YEARS = 10.0
+
+GRAPH_SCORE = 0.4
+
+
+def _graph_score(price_info: PriceInfo, native_chart: bool, min_chart_years: float) -> float:
+    """
+    그래프 점수 (0.0 ~ GRAPH_SCORE)
+
+    이력 저장소로 그린 그래프(국토부/저장 이력)는 저장소 기간이 min_chart_years에
+    못 미치면 기간 비율만큼만 준다. 6개월치 그래프가 15년 아실 그래프와 같은 점수를 받지 않도록.
+    """
+    has_image = bool(image_size_bytes(price_info.price_graph_image_path))
+    if not price_info.history_path:
+        return GRAPH_SCORE if has_image else 0.0
+    if not (has_image or native_chart):
+        return 0.0
+    if min_chart_years <= 0:
+        return GRAPH_SCORE
+    return GRAPH_SCORE * min(1.0, price_info.history_years / min_chart_years)
+
+
+def score_price_info(
+    price_info: Optional[PriceInfo],
+    native_chart: bool = False,
+    min_chart_years: float = DEFAULT_MIN_CHART_YEARS,
+) -> float:
+    """
+    가격 슬라이드 기준 완성도 점수 (0.0 ~ 1.0)
+
+    그래프 0.4 + 최근 거래 0.2 + 최근 3개월 최고/최저 0.2 + 역대 최고가 0.2
+    native_chart이면 실거래 이력 저장소만 있어도 그래프를 그릴 수 있는 것으로 보되,
+    이미지든 네이티브 차트든 저장소 기반 그래프는 기간이 min_chart_years 이상이어야 그래프 점수를 다 받는다.
+    """
+    if price_info is None:
+        return 0.0
+    score = _graph_score(price_info, native_chart, min_chart_years)
+    if price_info.recent_transactions:
+        score += 0.2
+    if price_info.recent_3m_high and price_info.recent_3m_low:
+        score += 0.2
+    if price_info.all_time_high:
+        score += 0.2
+    return round(score, 2)
+
+
+def _chart_from_store(store: PriceHistoryStore, complex_name: str, chart_path: Optional[str]) -> Optional[str]:
+    """이력 저장소 컬럼으로 그래프 생성 (chart_path가 없으면 생략 — 네이티브 차트 사용)"""
+    if not chart_path:
+        return None
+    ok = generate_price_chart_from_columns(
+        store.dates, store.price_raw, complex_name, chart_path,
+    )
+    return chart_path if ok else None
+
+
+def _source_asil(complex_id: str, complex_name: str, address: str, chart_path: str) -> Optional[PriceInfo]:
+    """아실 차트 캡처 + 차트 데이터 파싱"""
+    result = capture_asil_price_chart(complex_name, complex_id, address, chart_path)
+    if not result:
+        return None
+    price_info = result.get("price_info") or PriceInfo(complex_id=complex_id)
+    price_info.price_graph_image_path = result.get("chart_path")
+    return price_info
+
+
+def _source_molit(
+    complex_id: str,
+    complex_name: str,
+    lawd_cd: str,
+    api_key: str,
+    jibun: str,
+    months: int,
+    max_concurrency: int,
+    history_path: str,
+    chart_path: Optional[str],
+) -> Optional[PriceInfo]:
+    """국토부 API 조회 (이력 저장소 갱신) + 저장소 그래프"""
+    price_info = fetch_price_info_from_api(
+        complex_id, lawd_cd, api_key, complex_name,
+        months=months, max_concurrency=max_concurrency, jibun=jibun,
+        history_path=history_path,
+    )
+    # 실거래 0건이면 mock이 돌아온다 (history_path 없음) → 결과 없음으로 처리
+    if not price_info or not price_info.history_path:
+        return None
+    store = PriceHistoryStore.load(history_path)
+    price_info.history_years = store.covered_years()
+    price_info.price_graph_image_path = _chart_from_store(store, complex_name, chart_path)
+    return price_info
+
+
+def _source_cache(
+    complex_id: str,
+    complex_name: str,
+    history_path: str,
+    chart_path: Optional[str],
+) -> Optional[PriceInfo]:
+    """저장된 실거래 이력만으로 결과 생성 (네트워크 없음)"""
+    if not os.path.exists(history_path):
+        return None
+    store = PriceHistoryStore.load(history_path)
+    if not len(store):
+        return None
+    price_info = _price_info_from_store(complex_id, store, date.today())
+    price_info.history_path = history_path
+    price_info.history_years = store.covered_years()
+    price_info.price_graph_image_path = _chart_from_store(store, complex_name, chart_path)
+    return price_info
+
+
+def _is_fresh(path: str, max_age_hours: float) -> bool:
+    """파일이 max_age_hours 이내에 갱신되었는지"""
+    try:
+        return (time.time() - os.path.getmtime(path)) <= max_age_hours * 3600
+    except OSError:
+        return False
+
+
+def _pick_best(results: Dict[str, Tuple[Optional[PriceInfo], float]]) -> Optional[str]:
+    """점수가 가장 높은 소스 (동점이면 우선순위 순)"""
+    best = None
+    for name in SOURCE_PRIORITY:
+        if name not in results or results[name][0] is None:
+            continue
+        if best is None or results[name][1] > results[best][1]:
+            best = name
+    return best
+
+
+def fetch_price_hedged(
+    complex_id: str,
+    complex_name: str,
+    address: str,
+    temp_dir: str = "temp",
+    lawd_cd: str = "",
+    api_key: str = "",
+    jibun: str = "",
+    months: int = 6,
+    max_concurrency: int = 4,
+    min_score: float = 0.8,
+    timeout: float = 90.0,
+    cache_max_age_hours: float = 24.0,
+    use_asil: bool = True,
+    native_chart: bool = False,
+    min_chart_years: float = DEFAULT_MIN_CHART_YEARS,
+) -> PriceInfo:
+    """
+    실거래가 소스를 동시에 실행하고 먼저 완성된 결과를 반환
+
+    - asil: 아실 차트 캡처 (Playwright)
+    - molit: 국토부 API (api_key, lawd_cd가 있을 때)
+    - cache: cache_max_age_hours 이내에 저장된 실거래 이력 (네트워크 없음)
+
+    score_price_info()가 min_score 이상인 결과가 나오면 즉시 반환하고,
+    timeout 안에 아무도 기준을 못 넘으면 끝난 결과 중 가장 높은 점수를 쓴다.
+    모두 실패하면 mock 데이터. 채택된 소스는 PriceInfo.price_source에 기록한다.
+    native_chart이면 저장소 그래프 이미지(matplotlib)를 만들지 않는다 (슬라이드에서 네이티브 차트).
+    채택된 결과의 그래프가 min_chart_years보다 짧으면, 기간을 채운 다른 소스(보통 아실)의
+    그래프 이미지를 대신 쓴다.
+
+    Returns:
+        PriceInfo (price_graph_image_path 포함)
+    """
+    complex_dir = os.path.join(temp_dir, complex_id)
+    history_path = os.path.join(complex_dir, "price_history.npz")
+
+    def store_chart_path(filename: str) -> Optional[str]:
+        return None if native_chart else os.path.join(complex_dir, filename)
+
+    sources: Dict[str, Callable[[], Optional[PriceInfo]]] = {}
+    if use_asil:
+        sources["asil"] = lambda: _source_asil(
+            complex_id, complex_name, address,
+            os.path.join(complex_dir, "price_chart_asil.png"),
+        )
+    if api_key and lawd_cd:
+        sources["molit"] = lambda: _source_molit(
+            complex_id, complex_name, lawd_cd, api_key, jibun,
+            months, max_concurrency, history_path,
+            store_chart_path("price_chart_molit.png"),
+        )
+    if _is_fresh(history_path, cache_max_age_hours):
+        sources["cache"] = lambda: _source_cache(
+            complex_id, complex_name, history_path,
+            store_chart_path("price_chart_cache.png"),
+        )
+
+    results: Dict[str, Tuple[Optional[PriceInfo], float]] = {}
+    started = time.perf_counter()
+    winner = None
+
+    if sources:
+        pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="price")
+        futures = {pool.submit(func): name for name, func in sources.items()}
+        pending = set(futures)
+        deadline = started + timeout
+
+        try:
+            while pending and winner is None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures[future]
+                    try:
+                        price_info = future.result()
+                    except Exception as e:
+                        print(f"  [WARN] 실거래가 소스 '{name}' 실패: {e}")
+                        price_info = None
+                    score = score_price_info(price_info, native_chart, min_chart_years)
+                    results[name] = (price_info, score)
+                    print(f"  실거래가 소스 '{name}' 완료: 점수 {score:.2f} "
+                          f"({time.perf_counter() - started:.1f}초)")
+
+                # 같은 시점에 끝난 결과가 여럿이면 우선순위가 높은 쪽
+                complete = {k: v for k, v in results.items() if v[1] >= min_score}
+                winner = _pick_best(complete)
+        finally:
+            # 시작 전 작업은 취소, 실행 중인 작업은 기다리지 않음 (각자 다른 파일에 저장)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if pending:
+            names = ", ".join(sorted(futures[f] for f in pending))
+            print(f"  [INFO] 실거래가 소스 대기 중단: {names}")
+
+    if winner is None:
+        winner = _pick_best(results)
+
+    # 그래프가 없거나 기간이 짧은 결과면 더 나은 다른 소스의 그래프 이미지를 빌려 쓴다
+    if winner:
+        best_info = results[winner][0]
+        current = _graph_score(best_info, native_chart, min_chart_years)
+        donors = [
+            name for name in SOURCE_PRIORITY
+            if name != winner and results.get(name, (None, 0.0))[0] is not None
+            and results[name][0].price_graph_image_path
+        ]
+        donor = max(donors, key=lambda n: _graph_score(results[n][0], False, min_chart_years), default=None)
+        if donor and _graph_score(results[donor][0], False, min_chart_years) > current:
+            best_info.price_graph_image_path = results[donor][0].price_graph_image_path
+            print(f"  실거래가 그래프는 '{donor}' 소스 사용")
+
+    if winner is None:
+        print(f"[INFO] Mock 실거래가 데이터 사용 (complex_id: {complex_id})")
+        price_info = fetch_price_info_mock(complex_id, complex_name)
+        price_info.price_source = "mock"
+        return price_info
+
+    price_info = results[winner][0]
+    price_info.price_source = winner
+    print(f"  실거래가 소스 채택: {winner} (점수 {results[winner][1]:.2f})")
+    return price_info
@@ -5,39 +5,65 @@
 
 데이터 수집 전략:
   1. SSR에서 배정 학교 기본정보 (학교명, 거리, 도보시간) 획득
-  2. NEIS 개방 API (open.neis.go.kr)로 학교 상세정보 (주소, 전화, 설립일, 홈페이지 등)
+  2. NEIS 학교 디렉토리(로컬 sqlite) → 없으면 NEIS 개방 API로 학교 상세정보 (주소, 전화, 설립일, 홈페이지 등)
   3. Playwright로 네이버지도 도보 경로 / 학군지도 스크린샷 캡처
 """
 import os
 import re
 import json
+import time
+import asyncio
+import threading
 import httpx
 from typing import Optional, Tuple, Dict, List
 from urllib.parse import quote
 
-from src.models import SchoolInfo
+from src.models import ImageAsset, ImageRef, SchoolInfo
 from src.processors.image_processor import create_placeholder_image
+from src.utils.geo_cache import get_geo_cache
+from src.crawlers.neis_directory import (
+    EDUCATION_OFFICES, NEIS_API_URL, get_school_directory, office_for_address,
+)
+from src.crawlers.naver_directions import has_directions_keys, fetch_route
 
 
 # ─── NEIS 개방 API ───
 
-NEIS_API_URL = "https://open.neis.go.kr/hub/schoolInfo"
+def _school_office_code(ssr_school: Optional[Dict], address: str = "") -> str:
+    """
+    학교가 속한 시도교육청 코드
+
+    SSR 학교 코드 앞 3자리("B100001411" → "B10") → 단지 주소의 시도 순. 모르면 ''.
+    """
+    code = (ssr_school or {}).get("code") or ""
+    if code[:3] in EDUCATION_OFFICES:
+        return code[:3]
+    return office_for_address(address)
 
 
-def _fetch_neis_school_info(school_name: str) -> Optional[Dict]:
+def _fetch_neis_school_info(school_name: str, office_code: str = "") -> Optional[Dict]:
     """
-    NEIS 개방 API에서 학교 상세정보 조회 (인증키 불필요)
+    학교 상세정보 조회
+
+    1. 로컬 학교 디렉토리 (neis_directory, 교육청 단위로 미리 받아둔 sqlite)
+    2. 없으면 NEIS 개방 API 실시간 조회 (인증키 불필요) → 결과를 디렉토리에 저장
 
     Args:
         school_name: 학교명 (예: "서울상봉초등학교")
+        office_code: 시도교육청 코드 — 같은 이름의 다른 지역 학교보다 우선 (선택)
 
     Returns:
         학교 상세정보 dict 또는 None
     """
+    directory = get_school_directory()
+    row = directory.lookup(name=school_name, office_code=office_code)
+    if row:
+        return row
+
     params = {
         "Type": "json",
         "SCHUL_NM": school_name,
-        "pSize": "5",
+        "pSize": "100",
     }
     try:
         with httpx.Client(timeout=10.0) as client:
@@ -54,14 +80,13 @@ def _fetch_neis_school_info(school_name: str) -> Optional[Dict]:
             rows = school_info[1].get("row", [])
             if not rows:
                 return None
+            directory.upsert(rows)
 
-            # 정확한 이름 매칭 우선
-            for row in rows:
-                if row.get("SCHUL_NM") == school_name:
-                    return row
-
-            # 정확한 매칭 없으면 첫 번째 결과
-            return rows[0]
+            # 같은 교육청 → 정확한 이름 매칭 우선, 둘 다 없으면 첫 번째 결과
+            return min(rows, key=lambda row: (
+                bool(office_code) and row.get("ATPT_OFCDC_SC_CODE") != office_code,
+                row.get("SCHUL_NM") != school_name,
+            ))
 
     except Exception as e:
         print(f"  [WARN] NEIS API 조회 실패 ({school_name}): {e}")
@@ -108,7 +133,120 @@ def _build_school_info_from_neis(
     return result
 
 
-# ─── 학교 좌표 검색 (Nominatim HTTP) ───
+# ─── 학교 좌표 검색 (SSR → 캐시 → Nominatim) ───
+
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+# Nominatim 이용 정책: 초당 1회 이하
+NOMINATIM_MIN_INTERVAL_SEC = 1.0
+SCHOOL_GEOCODE_CACHE_PATH = os.path.join("temp", "school_geocode.json")
+
+_nominatim_lock = threading.Lock()
+_nominatim_last_call = 0.0
+_geocode_cache: Optional[Dict[str, List[float]]] = None
+_geocode_cache_lock = threading.Lock()
+
+
+def _ssr_school_coordinates(ssr_school: Optional[Dict]) -> Tuple[float, float]:
+    """SSR 학교 정보의 coordinates → (lng, lat) 또는 (0.0, 0.0)"""
+    coords = (ssr_school or {}).get("coordinates") or {}
+    try:
+        lng = float(coords.get("xCoordinate") or 0)
+        lat = float(coords.get("yCoordinate") or 0)
+    except (TypeError, ValueError):
+        return 0.0, 0.0
+    return (lng, lat) if lng and lat else (0.0, 0.0)
+
+
+def _geocode_cache_keys(school_name: str, ssr_school: Optional[Dict]) -> List[str]:
+    keys = []
+    code = (ssr_school or {}).get("code")
+    if code:
+        keys.append(f"code:{code}")
+    if school_name:
+        keys.append(f"name:{school_name}")
+    return keys
+
+
+def _load_geocode_cache() -> Dict[str, List[float]]:
+    """좌표 캐시 {키: [lng, lat]} (락 안에서 호출, 처음 한 번만 파일 로드)"""
+    global _geocode_cache
+    if _geocode_cache is None:
+        _geocode_cache = {}
+        if os.path.exists(SCHOOL_GEOCODE_CACHE_PATH):
+            try:
+                with open(SCHOOL_GEOCODE_CACHE_PATH, "r", encoding="utf-8") as f:
+                    _geocode_cache = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"  [WARN] 학교 좌표 캐시 로드 실패: {e}")
+    return _geocode_cache
+
+
+def _cached_school_location(keys: List[str]) -> Tuple[float, float]:
+    with _geocode_cache_lock:
+        cache = _load_geocode_cache()
+        for key in keys:
+            if key in cache:
+                lng, lat = cache[key]
+                return lng, lat
+    return 0.0, 0.0
+
+
+def _store_school_location(keys: List[str], lng: float, lat: float):
+    if not keys:
+        return
+    with _geocode_cache_lock:
+        cache = _load_geocode_cache()
+        if all(cache.get(key) == [lng, lat] for key in keys):
+            return
+        for key in keys:
+            cache[key] = [lng, lat]
+        try:
+            os.makedirs(os.path.dirname(SCHOOL_GEOCODE_CACHE_PATH) or ".", exist_ok=True)
+            tmp_path = SCHOOL_GEOCODE_CACHE_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, SCHOOL_GEOCODE_CACHE_PATH)
+        except OSError as e:
+            print(f"  [WARN] 학교 좌표 캐시 저장 실패: {e}")
+
+
+def _nominatim_search(query: str) -> Tuple[float, float]:
+    """
+    Nominatim 검색 1회 (프로세스 전체에서 초당 1회로 제한)
+
+    Returns:
+        (lng, lat) 또는 (0.0, 0.0)
+    """
+    global _nominatim_last_call
+    headers = {"User-Agent": "RealEstateBriefingBot/1.0"}
+    with _nominatim_lock:
+        wait = NOMINATIM_MIN_INTERVAL_SEC - (time.monotonic() - _nominatim_last_call)
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            resp = httpx.get(
+                NOMINATIM_URL,
+                params={"q": query, "format": "json", "limit": "1", "countrycodes": "kr"},
+                headers=headers, timeout=10.0,
+            )
+        except Exception:
+            return 0.0, 0.0
+        finally:
+            _nominatim_last_call = time.monotonic()
+
+    if resp.status_code != 200:
+        return 0.0, 0.0
+    try:
+        results = resp.json()
+        if results:
+            lat = float(results[0]["lat"])
+            lon = float(results[0]["lon"])
+            if lat and lon:
+                return lon, lat
+    except (ValueError, KeyError, TypeError):
+        pass
+    return 0.0, 0.0
+
 
 def _geocode_school(school_name: str, address: str = "") -> Tuple[float, float]:
     """
@@ -117,7 +255,6 @@ def _geocode_school(school_name: str, address: str = "") -> Tuple[float, float]:
     Returns:
         (lng, lat) 또는 (0.0, 0.0)
     """
-    headers = {"User-Agent": "RealEstateBriefingBot/1.0"}
     queries = [school_name]
     # "서울" 접두사 제거한 검색어 추가
     short_name = re.sub(r"^서울", "", school_name)
@@ -128,25 +265,47 @@ def _geocode_school(school_name: str, address: str = "") -> Tuple[float, float]:
         queries.append(address)
 
     for q in queries:
-        try:
-            resp = httpx.get(
-                "https://nominatim.openstreetmap.org/search",
-                params={"q": q, "format": "json", "limit": "1", "countrycodes": "kr"},
-                headers=headers, timeout=10.0,
-            )
-            if resp.status_code == 200:
-                results = resp.json()
-                if results:
-                    lat = float(results[0]["lat"])
-                    lon = float(results[0]["lon"])
-                    if lat and lon:
-                        return lon, lat
-        except Exception:
-            continue
+        lng, lat = _nominatim_search(q)
+        if lng and lat:
+            return lng, lat
 
     return 0.0, 0.0
 
 
+def resolve_school_location(
+    school_name: str,
+    address: str = "",
+    ssr_school: Optional[Dict] = None,
+) -> Tuple[float, float]:
+    """
+    학교 좌표 조회
+
+    1. SSR 학교 정보의 coordinates (추가 요청 없음)
+    2. 학교 코드/이름으로 저장된 좌표 캐시 (temp/school_geocode.json)
+    3. Nominatim 검색 (초당 1회 제한) — 찾으면 캐시에 저장
+
+    Returns:
+        (lng, lat) 또는 (0.0, 0.0)
+    """
+    keys = _geocode_cache_keys(school_name, ssr_school)
+
+    lng, lat = _ssr_school_coordinates(ssr_school)
+    if lng and lat:
+        _store_school_location(keys, lng, lat)
+        return lng, lat
+
+    lng, lat = _cached_school_location(keys)
+    if lng and lat:
+        return lng, lat
+
+    if not school_name:
+        return 0.0, 0.0
+    lng, lat = _geocode_school(school_name, address)
+    if lng and lat:
+        _store_school_location(keys, lng, lat)
+    return lng, lat
+
+
 # ─── 네이버지도 도보 경로 스크린샷 ───
 
 async def _capture_walk_route_to_school(
@@ -154,12 +313,17 @@ async def _capture_walk_route_to_school(
     school_lat: float, school_lng: float, school_name: str,
     save_path: str,
     timeout: int = 30000,
-) -> Optional[str]:
+) -> Optional[ImageAsset]:
     """
     네이버지도에서 단지→초등학교 도보 경로 스크린샷 캡처
     (좌측 패널 숨김, 지도+경로만 표시)
+
+    스크린샷은 ImageAsset으로 반환하고 save_path 사본은 백그라운드로 저장한다.
     """
     from src.crawlers.browser_utils import get_browser_page
+    from src.crawlers.capture_profiles import get_capture_profile
+
+    profile = get_capture_profile("route")
 
     try:
         s_name = quote(complex_name)
@@ -171,7 +335,7 @@ async def _capture_walk_route_to_school(
             f"-/walk"
         )
 
-        async with get_browser_page() as page:
+        async with get_browser_page(profile=profile) as page:
             await page.goto(url, wait_until="networkidle", timeout=timeout)
             await page.wait_for_timeout(5000)
 
@@ -184,10 +348,9 @@ async def _capture_walk_route_to_school(
             }""")
             await page.wait_for_timeout(500)
 
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            await page.screenshot(path=save_path, full_page=False)
+            data = await page.screenshot(**profile.screenshot_options())
             print(f"  [학군] 도보 경로 스크린샷 저장: {os.path.basename(save_path)}")
-            return save_path
+            return ImageAsset.from_bytes(data, path=save_path).write_behind()
 
     except Exception as e:
         print(f"  [WARN] 도보 경로 스크린샷 실패: {e}")
@@ -227,7 +390,7 @@ async def _capture_middle_high_school_zone(
     complex_lng: float,
     save_path: str,
     timeout: int = 45000,
-) -> Optional[str]:
+) -> Optional[ImageAsset]:
     """
     아실(asil.kr) 메인 지도에서 중·고등학교 학군 지도 스크린샷 캡처
 
@@ -240,13 +403,16 @@ async def _capture_middle_high_school_zone(
     6. 스크린샷 캡처
     """
     from src.crawlers.browser_utils import get_browser_page
+    from src.crawlers.capture_profiles import get_capture_profile
 
     if not complex_lat or not complex_lng:
         print(f"  [WARN] 중·고등학교 학군: 좌표 없음")
         return None
+    # 뷰포트를 학군지도 슬라이드 영역 비율에 맞춤
+    profile = get_capture_profile("school_map")
 
     try:
-        async with get_browser_page(viewport_width=1400, viewport_height=900) as page:
+        async with get_browser_page(profile=profile) as page:
             # 1. 아실 메인 지도 접속
             await page.goto(
                 "https://asil.kr/asil/index.jsp",
@@ -381,11 +547,10 @@ async def _capture_middle_high_school_zone(
             await page.wait_for_timeout(1000)
 
             # 6. #map 요소만 스크린샷 (레이아웃 변경 없이)
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
             map_el = page.locator('#map')
-            await map_el.screenshot(path=save_path)
+            data = await map_el.screenshot(**profile.element_screenshot_options())
             print(f"  [학군] 중·고등학교 학군지도 저장: {os.path.basename(save_path)}")
-            return save_path
+            return ImageAsset.from_bytes(data, path=save_path).write_behind()
 
     except Exception as e:
         print(f"  [WARN] 중·고등학교 학군 캡처 실패: {e}")
@@ -403,38 +568,65 @@ async def _fetch_school_info_async(
     elementary_name: str,
     neis_info: Dict,
     temp_dir: str = "temp",
+    ssr_school: Optional[Dict] = None,
+    config: Optional[dict] = None,
 ) -> Optional[SchoolInfo]:
     """학군 데이터 수집 (네이버지도 도보 경로 + 아실 학군지도)"""
     img_dir = os.path.join(temp_dir, complex_id)
 
     # ── 1. 초등학교 도보 경로 스크린샷 ──
-    elem_img = os.path.join(img_dir, "elementary_zone.png")
+    # 캡처 결과는 메모리 이미지(ImageAsset), 없으면 파일 경로 (이전 캡처 / placeholder)
+    elem_path = os.path.join(img_dir, "elementary_zone.png")
+    elem_img: ImageRef = elem_path
 
     if elementary_name and complex_lat and complex_lng:
-        # Nominatim으로 학교 좌표 검색 (HTTP, 동기)
+        # 학교 좌표: SSR 좌표 → 좌표 캐시 → Nominatim
         school_address = neis_info.get("address", "")
         print(f"  [학군] {elementary_name} 좌표 검색 중...")
-        school_lng, school_lat = _geocode_school(elementary_name, school_address)
+        school_lng, school_lat = resolve_school_location(
+            elementary_name, school_address, ssr_school,
+        )
 
         if school_lng and school_lat:
             print(f"  [학군] 좌표 확인: ({school_lat:.6f}, {school_lng:.6f})")
-            await _capture_walk_route_to_school(
+            # SSR에 도보시간이 없으면 Directions API 도로 거리로 계산
+            # (블로킹 HTTP 호출은 스레드에서 — 도보 경로 캡처와 동시에 진행)
+            route_task = None
+            if not neis_info.get("walk_distance") and has_directions_keys(config):
+                route_task = asyncio.ensure_future(asyncio.to_thread(
+                    fetch_route, (complex_lat, complex_lng), (school_lat, school_lng), config,
+                ))
+            elem_img = await _capture_walk_route_to_school(
                 complex_lat, complex_lng, complex_name,
                 school_lat, school_lng, elementary_name,
-                elem_img,
-            )
+                elem_path,
+            ) or elem_path
+            route = await route_task if route_task else None
+            if route:
+                neis_info["walk_distance"] = f"도보 {route['walk_minutes']}분"
+                neis_info["distance_m"] = route["distance_m"]
         else:
             print(f"  [WARN] {elementary_name} 좌표를 찾을 수 없습니다")
 
     # ── 2. 중·고등학교 학군지도 (아실 메인 지도) ──
-    mh_img = os.path.join(img_dir, "middle_high_zone.png")
-    await _capture_middle_high_school_zone(complex_lat, complex_lng, mh_img)
+    # 단지 좌표 중심 지도라 근처 단지가 이미 캡처한 지도는 그대로 재사용
+    mh_path = os.path.join(img_dir, "middle_high_zone.png")
+    mh_img: ImageRef = mh_path
+    geo_cache = get_geo_cache()
+    cached = geo_cache.get_bytes("middle_high_map", complex_lat, complex_lng)
+    if cached:
+        mh_img = ImageAsset.from_bytes(cached, path=mh_path).write_behind()
+    else:
+        asset = await _capture_middle_high_school_zone(complex_lat, complex_lng, mh_path)
+        if asset:
+            mh_img = asset
+            geo_cache.put_bytes("middle_high_map", complex_lat, complex_lng, asset.data)
 
     # placeholder 대체
-    if not os.path.exists(elem_img):
-        create_placeholder_image(elem_img, 800, 600, text="[초등학교 도보 경로]")
-    if not os.path.exists(mh_img):
-        create_placeholder_image(mh_img, 800, 600, text="[중·고등학교 학군지도]")
+    if elem_img is elem_path and not os.path.exists(elem_path):
+        create_placeholder_image(elem_path, 800, 600, text="[초등학교 도보 경로]")
+    if mh_img is mh_path and not os.path.exists(mh_path):
+        create_placeholder_image(mh_path, 800, 600, text="[중·고등학교 학군지도]")
 
     return SchoolInfo(
         complex_id=complex_id,
@@ -464,6 +656,7 @@ def fetch_school_info(
     temp_dir: str = "temp",
     use_mock: bool = False,
     ssr_schools: Optional[List[Dict]] = None,
+    config: Optional[dict] = None,
 ) -> SchoolInfo:
     """
     학군 정보 수집
@@ -477,6 +670,7 @@ def fetch_school_info(
         temp_dir: 임시 파일 디렉토리
         use_mock: True이면 mock 데이터 사용
         ssr_schools: SSR에서 추출한 학교 기본정보 리스트
+        config: 설정 (Directions API 키 — 도보시간 계산용)
 
     Returns:
         SchoolInfo
@@ -487,13 +681,17 @@ def fetch_school_info(
     # NEIS API로 학교 상세정보 수집
     neis_info = {}
     elementary_name = ""
+    ssr_school = None
 
     if ssr_schools:
         for school in ssr_schools:
+            ssr_school = school
             elementary_name = school.get("name", "")
             if elementary_name:
                 print(f"  [NEIS] {elementary_name} 상세정보 조회...")
-                neis_data = _fetch_neis_school_info(elementary_name)
+                neis_data = _fetch_neis_school_info(
+                    elementary_name, _school_office_code(school, address),
+                )
                 if neis_data:
                     neis_info = _build_school_info_from_neis(neis_data, school)
                     print(f"  [NEIS] 성공: {neis_info.get('address', '')}")
@@ -522,6 +720,8 @@ def fetch_school_info(
                 elementary_name=elementary_name,
                 neis_info=neis_info,
                 temp_dir=temp_dir,
+                ssr_school=ssr_school,
+                config=config,
             ))
             if result:
                 return result
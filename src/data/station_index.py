@@ -0,0 +1,285 @@
+"""
+지하철역 공간 인덱스
+역 좌표를 서울 기준 평면 좌표(m)로 투영한 뒤 격자(grid) 셀에 나눠 담아,
+최근접 k개 / 반경 검색을 전체 역을 훑지 않고 주변 셀만 보고 처리한다.
+
+여러 단지를 한 번에 처리할 때는 nearest_batch()로 NumPy 벡터 연산을 사용한다.
+"""
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# 투영 기준 위도 (서울) — 수도권 범위에서 오차 0.5% 미만
+_REF_LAT = 37.55
+_M_PER_DEG_LAT = 111_320.0
+_M_PER_DEG_LNG = 111_320.0 * math.cos(math.radians(_REF_LAT))
+
+_EARTH_RADIUS_M = 6_371_000.0
+
+# 이 링 수 안에서 결과가 확정되지 않으면 전체 검색으로 전환
+_MAX_RINGS = 32
+
+
+class StationHit(NamedTuple):
+    """검색 결과 1건"""
+    name: str
+    line: str
+    lat: float
+    lng: float
+    distance_m: float
+
+
+def project(lat, lng):
+    """위경도 → 평면 좌표 (m). 스칼라와 NumPy 배열 모두 지원"""
+    return (np.asarray(lng) * _M_PER_DEG_LNG, np.asarray(lat) * _M_PER_DEG_LAT)
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    """두 좌표 간 직선 거리 (m). NumPy 브로드캐스팅 지원"""
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    return _EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(a))
+
+
+class StationIndex:
+    """
+    격자 기반 역 인덱스
+
+    Usage:
+        index = StationIndex(SEOUL_STATIONS)
+        index.nearest(37.65, 127.07, k=3, lines={"4호선", "7호선"})
+        index.within(37.65, 127.07, radius_m=1000)
+    """
+
+    def __init__(self, stations: Sequence[Tuple[str, str, float, float]], cell_m: float = 1000.0):
+        self.cell_m = cell_m
+        self.names = [s[0] for s in stations]
+        self.lines = [s[1] for s in stations]
+        self.lat = np.array([s[2] for s in stations], dtype=np.float64)
+        self.lng = np.array([s[3] for s in stations], dtype=np.float64)
+        self.x, self.y = project(self.lat, self.lng)
+
+        self._line_idx: Dict[str, np.ndarray] = {
+            line: np.array(idx, dtype=np.int64)
+            for line, idx in _group_indices(self.lines).items()
+        }
+
+        cx = np.floor(self.x / cell_m).astype(np.int64)
+        cy = np.floor(self.y / cell_m).astype(np.int64)
+        cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, key in enumerate(zip(cx.tolist(), cy.tolist())):
+            cells[key].append(i)
+        self._cells = {k: np.array(v, dtype=np.int64) for k, v in cells.items()}
+        if len(stations):
+            self._bounds = (int(cx.min()), int(cx.max()), int(cy.min()), int(cy.max()))
+        else:
+            self._bounds = (0, -1, 0, -1)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ─── 내부 ───
+
+    def _line_mask(self, lines: Optional[Iterable[str]]) -> Optional[np.ndarray]:
+        """노선 필터 → 전체 역 기준 bool 마스크 (필터 없으면 None)"""
+        if lines is None:
+            return None
+        mask = np.zeros(len(self.names), dtype=bool)
+        for line in lines:
+            idx = self._line_idx.get(line)
+            if idx is not None:
+                mask[idx] = True
+        return mask
+
+    def _ring(self, cx: int, cy: int, r: int) -> List[np.ndarray]:
+        """(cx, cy) 기준 체비쇼프 거리 r인 셀들의 역 인덱스"""
+        if r == 0:
+            idx = self._cells.get((cx, cy))
+            return [idx] if idx is not None else []
+        out = []
+        for dx in range(-r, r + 1):
+            for dy in (-r, r):
+                idx = self._cells.get((cx + dx, cy + dy))
+                if idx is not None:
+                    out.append(idx)
+        for dy in range(-r + 1, r):
+            for dx in (-r, r):
+                idx = self._cells.get((cx + dx, cy + dy))
+                if idx is not None:
+                    out.append(idx)
+        return out
+
+    def _max_ring(self, cx: int, cy: int) -> int:
+        """격자 전체를 덮는 데 필요한 링 반경"""
+        x0, x1, y0, y1 = self._bounds
+        return max(abs(cx - x0), abs(cx - x1), abs(cy - y0), abs(cy - y1))
+
+    def _hit(self, i: int, distance_m: float) -> StationHit:
+        return StationHit(
+            self.names[i], self.lines[i],
+            float(self.lat[i]), float(self.lng[i]), float(distance_m),
+        )
+
+    # ─── 조회 ───
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 1,
+        lines: Optional[Iterable[str]] = None,
+        max_distance_m: Optional[float] = None,
+    ) -> List[StationHit]:
+        """
+        가까운 역 k개 (가까운 순)
+
+        Args:
+            lines: 이 노선들의 역만 검색 (None이면 전체)
+            max_distance_m: 이 거리보다 먼 역은 제외
+        """
+        if not len(self) or k <= 0:
+            return []
+        mask = self._line_mask(lines)
+        qx, qy = project(lat, lng)
+        cx, cy = int(math.floor(qx / self.cell_m)), int(math.floor(qy / self.cell_m))
+
+        found: List[np.ndarray] = []
+        n_found = 0
+        resolved = False
+        for r in range(min(self._max_ring(cx, cy), _MAX_RINGS) + 1):
+            for idx in self._ring(cx, cy, r):
+                if mask is not None:
+                    idx = idx[mask[idx]]
+                if len(idx):
+                    found.append(idx)
+                    n_found += len(idx)
+            # 링 r 바깥의 역은 최소 r * cell_m 떨어져 있다
+            bound = r * self.cell_m
+            if max_distance_m is not None and bound > max_distance_m:
+                resolved = True
+                break
+            if n_found >= k:
+                cand = np.concatenate(found)
+                d = np.hypot(self.x[cand] - qx, self.y[cand] - qy)
+                if np.partition(d, k - 1)[k - 1] <= bound:
+                    resolved = True
+                    break
+        else:
+            # 격자를 모두 훑었으면 완료, 아니면 (역이 아주 먼 좌표) 전체 검색
+            resolved = self._max_ring(cx, cy) <= _MAX_RINGS
+
+        if not resolved:
+            found = [np.arange(len(self)) if mask is None else np.flatnonzero(mask)]
+
+        if not found:
+            return []
+        cand = np.concatenate(found)
+        dist = haversine_m(lat, lng, self.lat[cand], self.lng[cand])
+        order = np.argsort(dist, kind="stable")[:k]
+        return [
+            self._hit(int(cand[o]), dist[o]) for o in order
+            if max_distance_m is None or dist[o] <= max_distance_m
+        ]
+
+    def within(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float,
+        lines: Optional[Iterable[str]] = None,
+    ) -> List[StationHit]:
+        """반경 radius_m 안의 역 전체 (가까운 순)"""
+        if not len(self):
+            return []
+        mask = self._line_mask(lines)
+        qx, qy = project(lat, lng)
+        x0 = int(math.floor((qx - radius_m) / self.cell_m))
+        x1 = int(math.floor((qx + radius_m) / self.cell_m))
+        y0 = int(math.floor((qy - radius_m) / self.cell_m))
+        y1 = int(math.floor((qy + radius_m) / self.cell_m))
+
+        found = []
+        for gx in range(x0, x1 + 1):
+            for gy in range(y0, y1 + 1):
+                idx = self._cells.get((gx, gy))
+                if idx is None:
+                    continue
+                if mask is not None:
+                    idx = idx[mask[idx]]
+                if len(idx):
+                    found.append(idx)
+        if not found:
+            return []
+        cand = np.concatenate(found)
+        dist = haversine_m(lat, lng, self.lat[cand], self.lng[cand])
+        keep = np.flatnonzero(dist <= radius_m)
+        keep = keep[np.argsort(dist[keep], kind="stable")]
+        return [self._hit(int(cand[o]), dist[o]) for o in keep]
+
+    def nearest_batch(
+        self,
+        lats: Sequence[float],
+        lngs: Sequence[float],
+        k: int = 1,
+        lines: Optional[Iterable[str]] = None,
+        chunk: int = 2048,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 좌표의 최근접 역 k개를 한 번에 계산
+
+        Returns:
+            (역 인덱스 (n, k), 거리 m (n, k)) — 역 인덱스는 self.names 등과 같은 순서.
+            후보 역이 k개보다 적으면 남는 칸은 인덱스 -1, 거리 inf
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        n = len(lats)
+        out_idx = np.full((n, k), -1, dtype=np.int64)
+        out_dist = np.full((n, k), np.inf, dtype=np.float64)
+
+        mask = self._line_mask(lines)
+        pool = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if not len(pool) or not n or k <= 0:
+            return out_idx, out_dist
+        kk = min(k, len(pool))
+
+        px, py = self.x[pool], self.y[pool]
+        qx, qy = project(lats, lngs)
+        for start in range(0, n, chunk):
+            end = min(start + chunk, n)
+            # (청크, 역) 거리 행렬 → argpartition으로 k개만 골라 정렬
+            d2 = (qx[start:end, None] - px[None, :]) ** 2 + (qy[start:end, None] - py[None, :]) ** 2
+            part = np.argpartition(d2, kk - 1, axis=1)[:, :kk]
+            rows = np.arange(end - start)[:, None]
+            order = np.argsort(d2[rows, part], axis=1)
+            sel = pool[part[rows, order]]
+            out_idx[start:end, :kk] = sel
+            out_dist[start:end, :kk] = haversine_m(
+                lats[start:end, None], lngs[start:end, None], self.lat[sel], self.lng[sel],
+            )
+        return out_idx, out_dist
+
+
+def _group_indices(values: Sequence[str]) -> Dict[str, List[int]]:
+    groups: Dict[str, List[int]] = defaultdict(list)
+    for i, v in enumerate(values):
+        groups[v].append(i)
+    return groups
+
+
+# ─── 내장 역 DB 인덱스 (지연 생성) ───
+
+_STATION_INDEX: Optional[StationIndex] = None
+
+
+def get_station_index() -> StationIndex:
+    """내장 지하철역 DB 인덱스 (처음 호출할 때 한 번만 생성)"""
+    global _STATION_INDEX
+    if _STATION_INDEX is None:
+        from src.data.station_table import load_station_table
+        _STATION_INDEX = StationIndex(load_station_table().rows())
+    return _STATION_INDEX
@@ -0,0 +1,204 @@
+"""
+수도권 지하철역 바이너리 테이블
+stations.csv(원본) → stations.bin(배포용)으로 변환해 두고, 실행 시에는 .bin을
+mmap으로 열어 좌표 배열을 복사 없이 바로 사용한다. 처음 조회할 때 한 번만 로드.
+
+파일 구조 (little endian):
+    헤더    magic "STBL" | version u16 | 역 수 u32 | 역명 수 u16 | 노선 수 u16 | 패딩 2바이트
+    배열    위도 f64[n] | 경도 f64[n] | 역명 번호 u16[n] | 노선 번호 u16[n]
+    문자열  역명 테이블 (u32 바이트 수 + UTF-8, 0으로 구분) | 노선 테이블 (동일)
+
+역 순서는 CSV 그대로이며, 같은 노선 안에서는 운행 순서를 따른다 (노선망 그래프가 사용).
+"""
+import os
+import csv
+import mmap
+import struct
+import threading
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIONS_CSV = os.path.join(DATA_DIR, "stations.csv")
+STATIONS_BIN = os.path.join(DATA_DIR, "stations.bin")
+
+_MAGIC = b"STBL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHIHHxx")  # 16바이트 (배열 정렬)
+
+
+class StationTable:
+    """
+    지하철역 테이블 (컬럼형)
+
+    Attributes:
+        lat, lng: float64 좌표 배열
+        name_idx, line_idx: uint16 역명/노선 테이블 번호
+        names, lines: 중복 제거된 역명/노선 문자열 목록
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lng: np.ndarray,
+        name_idx: np.ndarray,
+        line_idx: np.ndarray,
+        names: List[str],
+        lines: List[str],
+    ):
+        self.lat = lat
+        self.lng = lng
+        self.name_idx = name_idx
+        self.line_idx = line_idx
+        self.names = names
+        self.lines = lines
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, float, float]]:
+        return iter(self.rows())
+
+    def rows(self) -> List[Tuple[str, str, float, float]]:
+        """(역명, 노선, 위도, 경도) 튜플 목록 — 기존 SEOUL_STATIONS 형식"""
+        names, lines = self.names, self.lines
+        return [
+            (names[n], lines[l], float(a), float(b))
+            for n, l, a, b in zip(
+                self.name_idx.tolist(), self.line_idx.tolist(),
+                self.lat.tolist(), self.lng.tolist(),
+            )
+        ]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[str, str, float, float]]) -> "StationTable":
+        """(역명, 노선, 위도, 경도) 목록 → 테이블 (역명/노선 문자열은 한 번씩만 저장)"""
+        names: List[str] = []
+        lines: List[str] = []
+        name_ids: dict = {}
+        line_ids: dict = {}
+        name_idx, line_idx = [], []
+        for name, line, _, _ in rows:
+            if name not in name_ids:
+                name_ids[name] = len(names)
+                names.append(name)
+            if line not in line_ids:
+                line_ids[line] = len(lines)
+                lines.append(line)
+            name_idx.append(name_ids[name])
+            line_idx.append(line_ids[line])
+        return cls(
+            lat=np.array([r[2] for r in rows], dtype=np.float64),
+            lng=np.array([r[3] for r in rows], dtype=np.float64),
+            name_idx=np.array(name_idx, dtype=np.uint16),
+            line_idx=np.array(line_idx, dtype=np.uint16),
+            names=names,
+            lines=lines,
+        )
+
+
+# ─── CSV / 바이너리 변환 ───
+
+def read_stations_csv(path: str = STATIONS_CSV) -> List[Tuple[str, str, float, float]]:
+    """CSV (name,line,lat,lng 헤더) → 튜플 목록"""
+    rows = []
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            name = (row.get("name") or "").strip()
+            line = (row.get("line") or "").strip()
+            if not name or not line:
+                continue
+            rows.append((name, line, float(row["lat"]), float(row["lng"])))
+    return rows
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    data = "\0".join(values).encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def write_station_table(table: StationTable, path: str = STATIONS_BIN):
+    """테이블 → 바이너리 파일"""
+    header = _HEADER.pack(_MAGIC, _VERSION, len(table), len(table.names), len(table.lines))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(table.lat.astype("<f8").tobytes())
+        f.write(table.lng.astype("<f8").tobytes())
+        f.write(table.name_idx.astype("<u2").tobytes())
+        f.write(table.line_idx.astype("<u2").tobytes())
+        f.write(_pack_strings(table.names))
+        f.write(_pack_strings(table.lines))
+    os.replace(tmp_path, path)
+
+
+def read_station_table(path: str = STATIONS_BIN) -> StationTable:
+    """
+    바이너리 파일 → 테이블
+
+    좌표/번호 배열은 mmap 버퍼를 그대로 가리키는 읽기 전용 NumPy 배열이다.
+    """
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, n, n_names, n_lines = _HEADER.unpack_from(buf, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"지원하지 않는 역 테이블 형식: {magic!r} v{version}")
+
+    offset = _HEADER.size
+    lat = np.frombuffer(buf, dtype="<f8", count=n, offset=offset)
+    offset += 8 * n
+    lng = np.frombuffer(buf, dtype="<f8", count=n, offset=offset)
+    offset += 8 * n
+    name_idx = np.frombuffer(buf, dtype="<u2", count=n, offset=offset)
+    offset += 2 * n
+    line_idx = np.frombuffer(buf, dtype="<u2", count=n, offset=offset)
+    offset += 2 * n
+
+    tables = []
+    for expected in (n_names, n_lines):
+        (size,) = struct.unpack_from("<I", buf, offset)
+        offset += 4
+        values = bytes(buf[offset:offset + size]).decode("utf-8").split("\0") if size else []
+        offset += size
+        if len(values) != expected:
+            raise ValueError("역 테이블 문자열 개수가 헤더와 다릅니다")
+        tables.append(values)
+
+    return StationTable(lat, lng, name_idx, line_idx, tables[0], tables[1])
+
+
+# ─── 지연 로드 ───
+
+_TABLE: Optional[StationTable] = None
+_TABLE_LOCK = threading.Lock()
+
+
+def load_station_table() -> StationTable:
+    """
+    내장 역 테이블 (처음 호출할 때 한 번만 로드)
+
+    stations.bin이 없으면 CSV를 직접 읽는다.
+    CSV를 고친 뒤에는 scripts/build_station_table.py로 .bin을 다시 만들 것.
+    """
+    global _TABLE
+    if _TABLE is not None:
+        return _TABLE
+    with _TABLE_LOCK:
+        if _TABLE is None:
+            _TABLE = _load_default_table()
+    return _TABLE
+
+
+def _load_default_table() -> StationTable:
+    if os.path.exists(STATIONS_BIN):
+        try:
+            return read_station_table(STATIONS_BIN)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"  [WARN] 역 테이블 로드 실패, CSV 사용: {e}")
+    else:
+        print(f"  [INFO] stations.bin 없음, CSV에서 로드 "
+              f"(python scripts/build_station_table.py 로 생성)")
+    return StationTable.from_rows(read_stations_csv(STATIONS_CSV))
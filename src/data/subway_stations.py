@@ -1,280 +1,18 @@
 """
-서울 주요 지하철역 좌표 데이터베이스 (fallback 용)
+수도권 지하철역 좌표 데이터베이스 (fallback 용)
 (역명, 호선, 위도, 경도)
+
+역 목록은 stations.csv / stations.bin (station_table.py)으로 옮겼다.
+SEOUL_STATIONS는 기존 코드 호환용으로, 처음 접근할 때 테이블에서 튜플 목록을 만든다.
 """
+from typing import List, Tuple
+
+from src.data.station_table import load_station_table
+
 
-SEOUL_STATIONS = [
-    # ── 1호선 ──
-    ("서울역", "1호선", 37.5547, 126.9707),
-    ("시청", "1호선", 37.5659, 126.9773),
-    ("종각", "1호선", 37.5700, 126.9828),
-    ("종로3가", "1호선", 37.5713, 126.9916),
-    ("종로5가", "1호선", 37.5708, 126.9994),
-    ("동대문", "1호선", 37.5710, 127.0096),
-    ("신설동", "1호선", 37.5754, 127.0247),
-    ("제기동", "1호선", 37.5806, 127.0340),
-    ("청량리", "1호선", 37.5802, 127.0470),
-    ("회기", "1호선", 37.5897, 127.0577),
-    ("외대앞", "1호선", 37.5963, 127.0592),
-    ("남영", "1호선", 37.5416, 126.9713),
-    ("용산", "1호선", 37.5299, 126.9646),
-    ("노량진", "1호선", 37.5153, 126.9427),
-    ("대방", "1호선", 37.5131, 126.9262),
-    ("신길", "1호선", 37.5175, 126.9134),
-    ("영등포", "1호선", 37.5157, 126.9075),
-    ("신도림", "1호선", 37.5088, 126.8912),
-    ("구로", "1호선", 37.5032, 126.8826),
-    ("가산디지털단지", "1호선", 37.4816, 126.8826),
-    ("석계", "1호선", 37.6152, 127.0654),
-    ("광운대", "1호선", 37.6223, 127.0620),
-    ("월계", "1호선", 37.6265, 127.0583),
-    ("녹천", "1호선", 37.6280, 127.0510),
-    ("창동", "1호선", 37.6534, 127.0471),
-    ("도봉산", "1호선", 37.6887, 127.0437),
-    # ── 2호선 ──
-    ("강남", "2호선", 37.4979, 127.0276),
-    ("역삼", "2호선", 37.5006, 127.0365),
-    ("선릉", "2호선", 37.5046, 127.0490),
-    ("삼성", "2호선", 37.5088, 127.0631),
-    ("종합운동장", "2호선", 37.5107, 127.0739),
-    ("잠실", "2호선", 37.5133, 127.1001),
-    ("잠실나루", "2호선", 37.5196, 127.1034),
-    ("강변", "2호선", 37.5346, 127.0940),
-    ("건대입구", "2호선", 37.5402, 127.0695),
-    ("성수", "2호선", 37.5446, 127.0557),
-    ("왕십리", "2호선", 37.5614, 127.0380),
-    ("상왕십리", "2호선", 37.5646, 127.0290),
-    ("신당", "2호선", 37.5660, 127.0175),
-    ("동대문역사문화공원", "2호선", 37.5654, 127.0075),
-    ("을지로4가", "2호선", 37.5669, 127.0003),
-    ("을지로3가", "2호선", 37.5660, 126.9920),
-    ("을지로입구", "2호선", 37.5660, 126.9830),
-    ("시청", "2호선", 37.5637, 126.9770),
-    ("충정로", "2호선", 37.5600, 126.9637),
-    ("아현", "2호선", 37.5579, 126.9562),
-    ("이대", "2호선", 37.5568, 126.9466),
-    ("신촌", "2호선", 37.5551, 126.9367),
-    ("홍대입구", "2호선", 37.5569, 126.9237),
-    ("합정", "2호선", 37.5495, 126.9134),
-    ("당산", "2호선", 37.5340, 126.9021),
-    ("영등포구청", "2호선", 37.5256, 126.8963),
-    ("문래", "2호선", 37.5178, 126.8957),
-    ("신림", "2호선", 37.4842, 126.9293),
-    ("서울대입구", "2호선", 37.4816, 126.9528),
-    ("낙성대", "2호선", 37.4771, 126.9636),
-    ("사당", "2호선", 37.4765, 126.9816),
-    ("교대", "2호선", 37.4934, 127.0146),
-    ("서초", "2호선", 37.4921, 127.0079),
-    ("방배", "2호선", 37.4818, 126.9976),
-    # ── 3호선 ──
-    ("교대", "3호선", 37.4934, 127.0146),
-    ("고속터미널", "3호선", 37.5049, 127.0052),
-    ("압구정", "3호선", 37.5274, 127.0286),
-    ("신사", "3호선", 37.5165, 127.0234),
-    ("잠원", "3호선", 37.5113, 127.0141),
-    ("약수", "3호선", 37.5543, 127.0107),
-    ("옥수", "3호선", 37.5406, 127.0174),
-    ("금호", "3호선", 37.5476, 127.0136),
-    ("충무로", "3호선", 37.5614, 126.9942),
-    ("동대입구", "3호선", 37.5585, 126.9897),
-    ("경복궁", "3호선", 37.5760, 126.9748),
-    ("안국", "3호선", 37.5766, 126.9858),
-    ("연신내", "3호선", 37.6190, 126.9205),
-    ("불광", "3호선", 37.6103, 126.9299),
-    # ── 4호선 ──
-    ("명동", "4호선", 37.5607, 126.9862),
-    ("회현", "4호선", 37.5577, 126.9817),
-    ("서울역", "4호선", 37.5547, 126.9707),
-    ("숙대입구", "4호선", 37.5448, 126.9717),
-    ("삼각지", "4호선", 37.5345, 126.9728),
-    ("이촌", "4호선", 37.5213, 126.9696),
-    ("동작", "4호선", 37.5079, 126.9523),
-    ("사당", "4호선", 37.4765, 126.9816),
-    ("혜화", "4호선", 37.5822, 127.0020),
-    ("한성대입구", "4호선", 37.5884, 127.0062),
-    ("성신여대입구", "4호선", 37.5929, 127.0159),
-    ("길음", "4호선", 37.6034, 127.0252),
-    ("미아사거리", "4호선", 37.6133, 127.0300),
-    ("수유", "4호선", 37.6377, 127.0252),
-    ("쌍문", "4호선", 37.6487, 127.0346),
-    ("창동", "4호선", 37.6530, 127.0471),
-    ("노원", "4호선", 37.6563, 127.0618),
-    ("상계", "4호선", 37.6619, 127.0730),
-    ("당고개", "4호선", 37.6702, 127.0795),
-    # ── 5호선 ──
-    ("광화문", "5호선", 37.5710, 126.9774),
-    ("종로3가", "5호선", 37.5713, 126.9916),
-    ("동대문역사문화공원", "5호선", 37.5654, 127.0075),
-    ("청구", "5호선", 37.5601, 127.0143),
-    ("왕십리", "5호선", 37.5614, 127.0380),
-    ("마장", "5호선", 37.5672, 127.0440),
-    ("답십리", "5호선", 37.5669, 127.0525),
-    ("장한평", "5호선", 37.5612, 127.0645),
-    ("군자", "5호선", 37.5575, 127.0795),
-    ("아차산", "5호선", 37.5524, 127.0916),
-    ("광나루", "5호선", 37.5444, 127.1031),
-    ("천호", "5호선", 37.5390, 127.1236),
-    ("강동", "5호선", 37.5360, 127.1322),
-    ("길동", "5호선", 37.5378, 127.1400),
-    ("굽은다리", "5호선", 37.5455, 127.1429),
-    ("명일", "5호선", 37.5513, 127.1440),
-    ("고덕", "5호선", 37.5551, 127.1541),
-    ("상일동", "5호선", 37.5567, 127.1659),
-    ("둔촌동", "5호선", 37.5277, 127.1362),
-    ("올림픽공원", "5호선", 37.5159, 127.1308),
-    ("개롱", "5호선", 37.4980, 127.1351),
-    ("거여", "5호선", 37.4933, 127.1438),
-    ("마천", "5호선", 37.4951, 127.1528),
-    ("여의도", "5호선", 37.5216, 126.9244),
-    ("여의나루", "5호선", 37.5275, 126.9327),
-    ("마포", "5호선", 37.5393, 126.9462),
-    ("공덕", "5호선", 37.5441, 126.9518),
-    ("신길", "5호선", 37.5174, 126.9151),
-    ("영등포시장", "5호선", 37.5227, 126.9059),
-    ("영등포구청", "5호선", 37.5260, 126.8965),
-    ("양평", "5호선", 37.5265, 126.8854),
-    ("오목교", "5호선", 37.5248, 126.8757),
-    ("목동", "5호선", 37.5240, 126.8664),
-    ("발산", "5호선", 37.5484, 126.8384),
-    ("우장산", "5호선", 37.5485, 126.8362),
-    ("화곡", "5호선", 37.5413, 126.8393),
-    ("까치산", "5호선", 37.5341, 126.8472),
-    ("방화", "5호선", 37.5730, 126.8152),
-    ("개화산", "5호선", 37.5726, 126.8015),
-    ("김포공항", "5호선", 37.5623, 126.8013),
-    ("송정", "5호선", 37.5560, 126.8017),
-    # ── 6호선 ──
-    ("이태원", "6호선", 37.5344, 126.9942),
-    ("녹사평", "6호선", 37.5345, 126.9872),
-    ("삼각지", "6호선", 37.5345, 126.9728),
-    ("공덕", "6호선", 37.5441, 126.9518),
-    ("상수", "6호선", 37.5477, 126.9227),
-    ("망원", "6호선", 37.5560, 126.9101),
-    ("합정", "6호선", 37.5495, 126.9134),
-    ("디지털미디어시티", "6호선", 37.5776, 126.8998),
-    ("월곡", "6호선", 37.6016, 127.0390),
-    ("상월곡", "6호선", 37.6067, 127.0480),
-    ("돌곶이", "6호선", 37.6108, 127.0565),
-    ("석계", "6호선", 37.6156, 127.0666),
-    ("태릉입구", "6호선", 37.6179, 127.0755),
-    ("봉화산", "6호선", 37.6189, 127.0900),
-    ("신내", "6호선", 37.6131, 127.1035),
-    # ── 7호선 ──
-    ("장암", "7호선", 37.6988, 127.0537),
-    ("도봉산", "7호선", 37.6895, 127.0444),
-    ("수락산", "7호선", 37.6757, 127.0577),
-    ("마들", "7호선", 37.6650, 127.0576),
-    ("노원", "7호선", 37.6563, 127.0618),
-    ("중계", "7호선", 37.6447, 127.0643),
-    ("하계", "7호선", 37.6363, 127.0658),
-    ("공릉", "7호선", 37.6257, 127.0730),
-    ("태릉입구", "7호선", 37.6179, 127.0755),
-    ("먹골", "7호선", 37.6101, 127.0776),
-    ("중화", "7호선", 37.6017, 127.0790),
-    ("상봉", "7호선", 37.5966, 127.0853),
-    ("면목", "7호선", 37.5877, 127.0852),
-    ("사가정", "7호선", 37.5807, 127.0844),
-    ("용마산", "7호선", 37.5735, 127.0870),
-    ("중곡", "7호선", 37.5658, 127.0838),
-    ("군자", "7호선", 37.5575, 127.0795),
-    ("어린이대공원", "7호선", 37.5484, 127.0745),
-    ("건대입구", "7호선", 37.5402, 127.0695),
-    ("뚝섬유원지", "7호선", 37.5311, 127.0656),
-    ("청담", "7호선", 37.5193, 127.0524),
-    ("강남구청", "7호선", 37.5175, 127.0414),
-    ("학동", "7호선", 37.5144, 127.0315),
-    ("논현", "7호선", 37.5112, 127.0215),
-    ("반포", "7호선", 37.5083, 127.0121),
-    ("고속터미널", "7호선", 37.5049, 127.0052),
-    ("내방", "7호선", 37.4878, 126.9923),
-    ("이수", "7호선", 37.4854, 126.9818),
-    ("남성", "7호선", 37.4716, 126.9719),
-    ("숭실대입구", "7호선", 37.4966, 126.9537),
-    ("신풍", "7호선", 37.5090, 126.9084),
-    ("대림", "7호선", 37.4928, 126.9014),
-    # ── 8호선 ──
-    ("암사", "8호선", 37.5503, 127.1279),
-    ("천호", "8호선", 37.5390, 127.1236),
-    ("강동구청", "8호선", 37.5306, 127.1226),
-    ("몽촌토성", "8호선", 37.5172, 127.1124),
-    ("잠실", "8호선", 37.5133, 127.1001),
-    ("석촌", "8호선", 37.5057, 127.1067),
-    ("송파", "8호선", 37.5009, 127.1098),
-    ("가락시장", "8호선", 37.4927, 127.1178),
-    ("문정", "8호선", 37.4861, 127.1222),
-    ("장지", "8호선", 37.4794, 127.1266),
-    ("복정", "8호선", 37.4705, 127.1264),
-    ("산성", "8호선", 37.4584, 127.1481),
-    ("남한산성입구", "8호선", 37.4504, 127.1582),
-    ("단대오거리", "8호선", 37.4446, 127.1564),
-    ("신흥", "8호선", 37.4394, 127.1459),
-    ("수진", "8호선", 37.4363, 127.1371),
-    ("모란", "8호선", 37.4326, 127.1285),
-    # ── 9호선 ──
-    ("개화", "9호선", 37.5726, 126.8406),
-    ("김포공항", "9호선", 37.5627, 126.8013),
-    ("공항시장", "9호선", 37.5649, 126.8268),
-    ("신목동", "9호선", 37.5141, 126.8776),
-    ("선유도", "9호선", 37.5230, 126.8934),
-    ("당산", "9호선", 37.5340, 126.9021),
-    ("국회의사당", "9호선", 37.5275, 126.9180),
-    ("여의도", "9호선", 37.5216, 126.9244),
-    ("노량진", "9호선", 37.5126, 126.9426),
-    ("동작", "9호선", 37.5079, 126.9523),
-    ("신반포", "9호선", 37.5088, 126.9936),
-    ("사평", "9호선", 37.5087, 127.0015),
-    ("고속터미널", "9호선", 37.5049, 127.0052),
-    ("신논현", "9호선", 37.5044, 127.0252),
-    ("언주", "9호선", 37.5075, 127.0348),
-    ("선정릉", "9호선", 37.5106, 127.0439),
-    ("삼성중앙", "9호선", 37.5106, 127.0534),
-    ("봉은사", "9호선", 37.5143, 127.0611),
-    ("종합운동장", "9호선", 37.5107, 127.0739),
-    ("삼전", "9호선", 37.5103, 127.0850),
-    ("석촌고분", "9호선", 37.5070, 127.0990),
-    ("석촌", "9호선", 37.5057, 127.1067),
-    ("송파나루", "9호선", 37.5042, 127.1164),
-    ("한성백제", "9호선", 37.4982, 127.1249),
-    ("올림픽공원", "9호선", 37.5164, 127.1318),
-    ("둔촌오륜", "9호선", 37.5221, 127.1372),
-    ("중앙보훈병원", "9호선", 37.5283, 127.1466),
-    # ── 경의중앙선 ──
-    ("용산", "경의중앙선", 37.5298, 126.9648),
-    ("왕십리", "경의중앙선", 37.5614, 127.0380),
-    ("청량리", "경의중앙선", 37.5802, 127.0470),
-    ("회기", "경의중앙선", 37.5897, 127.0577),
-    ("중랑", "경의중앙선", 37.5973, 127.0840),
-    ("상봉", "경의중앙선", 37.5966, 127.0853),
-    ("망우", "경의중앙선", 37.5999, 127.0916),
-    ("양원", "경의중앙선", 37.6107, 127.1080),
-    ("홍대입구", "경의중앙선", 37.5569, 126.9237),
-    ("서울역", "경의중앙선", 37.5547, 126.9707),
-    ("공덕", "경의중앙선", 37.5441, 126.9518),
-    # ── 경춘선 ──
-    ("상봉", "경춘선", 37.5966, 127.0853),
-    ("망우", "경춘선", 37.5999, 127.0916),
-    ("신내", "경춘선", 37.6131, 127.1035),
-    # ── 수인분당선 ──
-    ("왕십리", "수인분당선", 37.5614, 127.0380),
-    ("서울숲", "수인분당선", 37.5434, 127.0445),
-    ("압구정로데오", "수인분당선", 37.5270, 127.0391),
-    ("강남구청", "수인분당선", 37.5175, 127.0414),
-    ("선정릉", "수인분당선", 37.5106, 127.0439),
-    ("선릉", "수인분당선", 37.5046, 127.0490),
-    ("한티", "수인분당선", 37.4996, 127.0550),
-    ("도곡", "수인분당선", 37.4912, 127.0558),
-    # ── 신분당선 ──
-    ("신사", "신분당선", 37.5165, 127.0234),
-    ("논현", "신분당선", 37.5112, 127.0215),
-    ("신논현", "신분당선", 37.5044, 127.0252),
-    ("강남", "신분당선", 37.4979, 127.0276),
-    ("양재", "신분당선", 37.4842, 127.0344),
-    ("양재시민의숲", "신분당선", 37.4705, 127.0444),
-    ("청계산입구", "신분당선", 37.4475, 127.0535),
-    ("판교", "신분당선", 37.3953, 127.1117),
-    # ── 우이신설선 ──
-    ("신설동", "우이신설선", 37.5754, 127.0247),
-    ("성신여대입구", "우이신설선", 37.5929, 127.0159),
-    ("정릉", "우이신설선", 37.6008, 127.0138),
-    ("북한산보국문", "우이신설선", 37.6530, 127.0123),
-]
+def __getattr__(name: str) -> List[Tuple[str, str, float, float]]:
+    if name == "SEOUL_STATIONS":
+        stations = load_station_table().rows()
+        globals()["SEOUL_STATIONS"] = stations
+        return stations
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,242 @@
+"""
+지하철 노선망 기반 대중교통 소요시간 추정 (오프라인)
+내장 역 테이블(stations.csv)의 노선별 역 순서로 그래프를 만들고 Dijkstra로 최단 시간을 계산한다.
+
+- 승차: 같은 노선에서 연달아 나오는 두 역을 연결 (역 간 거리 / 표정속도 + 정차시간)
+  목록 순서가 끊기는 곳(지선, 순서 누락)은 거리가 멀어지므로 MAX_EDGE_KM보다 먼 쌍은 잇지 않는다
+- 환승: 역명이 같고 노선이 다른 역끼리 환승 페널티로 연결
+- 도보: 출발지/도착지에서 가까운 역 몇 곳까지 도보 + 첫 승차 대기시간
+
+역 사이 최단시간 표는 출발역별로 처음 필요할 때 한 번만 계산해 캐시한다.
+"""
+import heapq
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.station_index import StationIndex, haversine_m
+
+
+# 역 사이 평균 운행속도 (정차 제외, km/h)
+RIDE_SPEED_KMH = 45.0
+# 역당 정차시간 (분)
+DWELL_MINUTES = 0.5
+# 환승 페널티: 환승 통로 도보 + 배차 대기 (분)
+TRANSFER_MINUTES = 5.0
+# 첫 승차 배차 대기 (분)
+BOARDING_WAIT_MINUTES = 3.0
+# 도보 속도 (km/h, naver_map과 동일)
+WALK_SPEED_KMH = 4.5
+# 이보다 먼 연속 역 쌍은 목록 순서가 끊긴 것으로 보고 연결하지 않음
+MAX_EDGE_KM = 3.5
+# 끊긴 노선 구간을 이어 붙일 최대 거리 / 평균 역 간격 (km)
+MAX_JOIN_KM = 12.0
+AVG_STATION_GAP_KM = 1.2
+# 역이 닿지 않을 때 도보만으로 인정할 최대 시간 (분)
+WALK_ONLY_MAX_MINUTES = 30
+# 출발지/도착지에서 도보로 접근할 역 후보
+ACCESS_STATIONS = 3
+ACCESS_MAX_M = 2000.0
+
+
+def _walk_minutes(distance_m: float) -> float:
+    return distance_m / 1000 * 60 / WALK_SPEED_KMH
+
+
+def _normalize_station(name: str) -> str:
+    """역명 정규화 (강남역 → 강남)"""
+    name = (name or "").strip()
+    return name[:-1] if name.endswith("역") and len(name) > 1 else name
+
+
+class TransitGraph:
+    """
+    지하철 노선 그래프 (노드 = (역명, 노선))
+
+    Usage:
+        graph = TransitGraph(SEOUL_STATIONS)
+        graph.minutes_to(37.65, 127.06, hub_name="강남", hub_lat=37.498, hub_lng=127.028)
+    """
+
+    def __init__(self, stations: Sequence[Tuple[str, str, float, float]]):
+        # (역명, 노선) 중복 제거 — 노선 목록 순서 유지
+        nodes: Dict[Tuple[str, str], int] = {}
+        unique = []
+        order_by_line: Dict[str, List[int]] = defaultdict(list)
+        for name, line, lat, lng in stations:
+            key = (_normalize_station(name), line)
+            if key not in nodes:
+                nodes[key] = len(unique)
+                unique.append((key[0], line, lat, lng))
+            order_by_line[line].append(nodes[key])
+
+        self._node_ids = nodes
+        self.index = StationIndex(unique)
+        self._adj: List[List[Tuple[int, float]]] = [[] for _ in unique]
+        self._rows: Dict[int, np.ndarray] = {}
+
+        # 승차 간선
+        for line, seq in order_by_line.items():
+            self._link_line(seq)
+
+        # 환승 간선
+        by_name: Dict[str, List[int]] = defaultdict(list)
+        for (name, _), node in nodes.items():
+            by_name[name].append(node)
+        self._by_name = dict(by_name)
+        for group in by_name.values():
+            for i, a in enumerate(group):
+                for b in group[i + 1:]:
+                    self._add_edge(a, b, TRANSFER_MINUTES)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _distance_m(self, a: int, b: int) -> float:
+        idx = self.index
+        return float(haversine_m(idx.lat[a], idx.lng[a], idx.lat[b], idx.lng[b]))
+
+    def _link_line(self, seq: List[int]):
+        """
+        한 노선의 역 연결
+
+        1. 목록에서 연달아 나오는 역 중 MAX_EDGE_KM 이내인 쌍을 연결
+        2. 그래도 끊긴 구간은 가장 가까운 역 쌍부터 이어 붙인다 (노선별 최소 신장 숲,
+           MAX_JOIN_KM 이내) — DB에 빠진 중간역이 있어도 노선이 끊기지 않도록
+        """
+        parent = {n: n for n in seq}
+
+        def find(n):
+            while parent[n] != n:
+                parent[n] = parent[parent[n]]
+                n = parent[n]
+            return n
+
+        def link(a, b, dist_km):
+            ra, rb = find(a), find(b)
+            if ra == rb:
+                return
+            parent[ra] = rb
+            # 빠진 중간역만큼 정차시간 추가
+            stops = max(1, round(dist_km / AVG_STATION_GAP_KM))
+            self._add_edge(a, b, dist_km / RIDE_SPEED_KMH * 60 + DWELL_MINUTES * stops)
+
+        for a, b in zip(seq, seq[1:]):
+            if a == b:
+                continue
+            dist_km = self._distance_m(a, b) / 1000
+            if dist_km <= MAX_EDGE_KM:
+                link(a, b, dist_km)
+
+        nodes = sorted(set(seq))
+        if len({find(n) for n in nodes}) <= 1:
+            return
+        idx = self.index
+        lat, lng = idx.lat[nodes], idx.lng[nodes]
+        dist = haversine_m(lat[:, None], lng[:, None], lat[None, :], lng[None, :]) / 1000
+        iu, ju = np.triu_indices(len(nodes), k=1)
+        for o in np.argsort(dist[iu, ju], kind="stable"):
+            d = float(dist[iu[o], ju[o]])
+            if d > MAX_JOIN_KM:
+                break
+            link(nodes[iu[o]], nodes[ju[o]], d)
+
+    def _add_edge(self, a: int, b: int, minutes: float):
+        self._adj[a].append((b, minutes))
+        self._adj[b].append((a, minutes))
+
+    def _row(self, source: int) -> np.ndarray:
+        """source 역에서 모든 역까지 최단시간 (분, 도달 불가 inf) — 지연 계산 후 캐시"""
+        row = self._rows.get(source)
+        if row is not None:
+            return row
+
+        row = np.full(len(self), np.inf)
+        row[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > row[node]:
+                continue
+            for nxt, w in self._adj[node]:
+                nd = d + w
+                if nd < row[nxt]:
+                    row[nxt] = nd
+                    heapq.heappush(heap, (nd, nxt))
+        self._rows[source] = row
+        return row
+
+    def station_minutes(self, from_name: str, to_name: str) -> Optional[float]:
+        """역명 → 역명 최단시간 (분). 환승역은 가장 빠른 노선 기준"""
+        sources = self._by_name.get(_normalize_station(from_name), [])
+        targets = self._by_name.get(_normalize_station(to_name), [])
+        if not sources or not targets:
+            return None
+        best = min(float(self._row(s)[targets].min()) for s in sources)
+        return best if np.isfinite(best) else None
+
+    def _access(self, lat: float, lng: float) -> List[Tuple[int, float]]:
+        """좌표에서 도보로 갈 수 있는 역 후보 [(노드, 도보분)]"""
+        hits = self.index.nearest(lat, lng, k=ACCESS_STATIONS, max_distance_m=ACCESS_MAX_M)
+        if not hits:
+            # 반경 안에 역이 없으면 가장 가까운 역 하나는 허용
+            hits = self.index.nearest(lat, lng, k=1)
+        return [
+            (self._node_ids[(h.name, h.line)], _walk_minutes(h.distance_m))
+            for h in hits
+        ]
+
+    def minutes_to(
+        self,
+        lat: float,
+        lng: float,
+        hub_lat: float,
+        hub_lng: float,
+        hub_name: str = "",
+    ) -> Optional[int]:
+        """
+        (lat, lng) → 목적지(허브) 대중교통 소요시간 (분)
+
+        hub_name이 역 DB에 있으면 해당 역(모든 노선)에서 하차 후 허브 좌표까지 도보,
+        없으면 허브 좌표 근처 역들을 도착 후보로 사용한다.
+        도보만으로 더 빠르면 도보 시간을 반환한다.
+        """
+        if not len(self) or not lat or not lng:
+            return None
+
+        egress_nodes = self._by_name.get(_normalize_station(hub_name), []) if hub_name else []
+        if egress_nodes:
+            egress = [
+                (n, _walk_minutes(float(haversine_m(
+                    hub_lat, hub_lng, self.index.lat[n], self.index.lng[n]))))
+                for n in egress_nodes
+            ]
+        else:
+            egress = self._access(hub_lat, hub_lng)
+        egress_ids = np.array([n for n, _ in egress], dtype=np.int64)
+        egress_walk = np.array([w for _, w in egress])
+
+        walk_only = _walk_minutes(float(haversine_m(lat, lng, hub_lat, hub_lng)))
+        best = np.inf
+        for node, walk in self._access(lat, lng):
+            ride = self._row(node)[egress_ids] + egress_walk
+            best = min(best, walk + BOARDING_WAIT_MINUTES + float(ride.min()))
+
+        if walk_only < best or (not np.isfinite(best) and walk_only <= WALK_ONLY_MAX_MINUTES):
+            best = walk_only
+        return max(1, round(best)) if np.isfinite(best) else None
+
+
+# ─── 내장 역 DB 그래프 (지연 생성) ───
+
+_TRANSIT_GRAPH: Optional[TransitGraph] = None
+
+
+def get_transit_graph() -> TransitGraph:
+    """내장 지하철역 DB로 만든 노선 그래프 (처음 호출할 때 한 번만 생성)"""
+    global _TRANSIT_GRAPH
+    if _TRANSIT_GRAPH is None:
+        from src.data.station_table import load_station_table
+        _TRANSIT_GRAPH = TransitGraph(load_station_table().rows())
+    return _TRANSIT_GRAPH
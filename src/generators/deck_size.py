@@ -0,0 +1,189 @@
+"""
+PPT 용량 관리
+저장 직전에 미디어 파트(이미지)를 살펴 슬라이드별 / 이미지별 용량을 보고하고,
+용량 예산(output.max_size_mb)을 넘으면 큰 이미지부터 단계적으로 다시 압축한다.
+
+- 재압축은 항상 원본 이미지에서 다음 단계 설정(축소 비율, JPEG 품질)으로 다시 만든다 (화질 누적 손실 없음)
+- 한 번에 초과분을 덮을 만큼의 큰 이미지들을 골라 image_executor에서 함께 처리하고,
+  실제 저장 크기를 다시 재서 예산 안에 들 때까지 반복한다
+- 형식(JPEG/PNG)과 파트 이름은 그대로 두므로 슬라이드의 그림 참조는 바뀌지 않는다
+  (GIF/BMP/TIFF 등 다른 형식의 이미지는 재압축하지 않음)
+
+Usage:
+    data = fit_to_size(prs, max_bytes=10 * 1024 * 1024)
+    report_sizes(prs, len(data))
+"""
+import io
+import os
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.parts.image import ImagePart
+
+from src.processors.image_executor import get_image_executor
+
+
+# 재압축 단계 (축소 비율, JPEG 품질) — 뒤로 갈수록 작아짐
+RECOMPRESS_STEPS: Tuple[Tuple[float, int], ...] = (
+    (1.0, 75),
+    (0.85, 65),
+    (0.7, 55),
+    (0.55, 45),
+    (0.4, 40),
+)
+
+# 이보다 작은 이미지는 재압축 대상에서 제외
+MIN_RECOMPRESS_BYTES = 50 * 1024
+
+# 재압축 대상 형식 (그 밖의 형식은 같은 형식으로 다시 저장할 수 없어 그대로 둠)
+RECOMPRESS_CONTENT_TYPES = (CT.PNG, CT.JPEG)
+
+# 보고 시 이미지 목록 최대 개수
+REPORT_TOP_IMAGES = 10
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f}MB"
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.0f}KB"
+
+
+def _save_bytes(prs) -> bytes:
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def _image_parts(prs) -> List[ImagePart]:
+    """프레젠테이션의 이미지 파트 (중복 없이)"""
+    return [part for part in prs.part.package.iter_parts() if isinstance(part, ImagePart)]
+
+
+def _slide_parts(slide) -> list:
+    """슬라이드가 참조하는 파트 (차트의 내장 엑셀 등 한 단계 아래까지, 레이아웃 제외)"""
+    parts = []
+    for rel in slide.part.rels.values():
+        if rel.is_external or rel.reltype.endswith("/slideLayout"):
+            continue
+        parts.append(rel.target_part)
+        for sub_rel in rel.target_part.rels.values():
+            if not sub_rel.is_external:
+                parts.append(sub_rel.target_part)
+    return parts
+
+
+def _slide_label(slide, width: int = 18) -> str:
+    """슬라이드 구분용 짧은 텍스트 (첫 번째 글상자 내용)"""
+    for shape in slide.shapes:
+        if shape.has_text_frame:
+            text = " ".join(shape.text_frame.text.split())
+            if text:
+                return text if len(text) <= width else text[:width] + "…"
+    return ""
+
+
+def _pixel_size(blob: bytes) -> str:
+    try:
+        with Image.open(io.BytesIO(blob)) as img:
+            return f"{img.width}x{img.height}"
+    except Exception:
+        return "?"
+
+
+def fit_to_size(prs, max_bytes: Optional[int]) -> bytes:
+    """
+    max_bytes 안에 들도록 이미지를 재압축한 뒤 저장한 바이트
+
+    Args:
+        prs: Presentation (이미지 파트가 제자리에서 바뀜)
+        max_bytes: 용량 예산 (None/0이면 재압축 없이 저장만)
+
+    Returns:
+        .pptx 파일 바이트 (모든 단계를 써도 넘으면 경고 후 가장 작은 결과)
+    """
+    data = _save_bytes(prs)
+    if not max_bytes or len(data) <= max_bytes:
+        return data
+
+    print(f"  → PPT 용량 {_mb(len(data))} > 예산 {_mb(max_bytes)}: 큰 이미지부터 재압축")
+    executor = get_image_executor()
+    originals: Dict[str, bytes] = {}
+    levels: Dict[str, int] = {}
+    start_size = len(data)
+
+    while len(data) > max_bytes:
+        candidates = sorted(
+            (part for part in _image_parts(prs)
+             if part.content_type in RECOMPRESS_CONTENT_TYPES
+             and levels.get(part.partname, 0) < len(RECOMPRESS_STEPS)
+             and len(originals.get(part.partname, part.blob)) >= MIN_RECOMPRESS_BYTES),
+            key=lambda part: len(part.blob),
+            reverse=True,
+        )
+        if not candidates:
+            break
+
+        # 초과분을 덮을 만큼의 큰 이미지들을 한 번에 다음 단계로
+        excess = len(data) - max_bytes
+        chosen, covered = [], 0
+        for part in candidates:
+            chosen.append(part)
+            covered += len(part.blob)
+            if covered >= excess:
+                break
+
+        jobs = []
+        for part in chosen:
+            original = originals.setdefault(part.partname, part.blob)
+            level = levels.get(part.partname, 0)
+            levels[part.partname] = level + 1
+            scale, quality = RECOMPRESS_STEPS[level]
+            jobs.append((part, executor.submit("recompress", original, scale=scale, jpeg_quality=quality)))
+
+        for part, future in jobs:
+            try:
+                blob = future.result()
+            except Exception as e:
+                print(f"  [WARN] 이미지 재압축 실패 ({os.path.basename(part.partname)}): {e}")
+                levels[part.partname] = len(RECOMPRESS_STEPS)
+                continue
+            if len(blob) < len(part.blob):
+                part.blob = blob
+
+        data = _save_bytes(prs)
+
+    recompressed = sum(1 for level in levels.values() if level)
+    print(f"  → 이미지 {recompressed}개 재압축: {_mb(start_size)} → {_mb(len(data))}")
+    if len(data) > max_bytes:
+        print(f"  [WARN] 재압축 후에도 용량 예산 초과: {_mb(len(data))} > {_mb(max_bytes)}")
+    return data
+
+
+def report_sizes(prs, total_bytes: int, top: int = REPORT_TOP_IMAGES):
+    """슬라이드별 / 이미지별 용량 출력 (여러 슬라이드가 같이 쓰는 이미지는 각 슬라이드에 포함)"""
+    image_slides: Dict[str, List[int]] = {}
+    print(f"  → PPT 용량 {_mb(total_bytes)} — 슬라이드별:")
+    for number, slide in enumerate(prs.slides, start=1):
+        size = len(slide.part.blob)
+        images = 0
+        for part in _slide_parts(slide):
+            size += len(part.blob)
+            if isinstance(part, ImagePart):
+                images += 1
+                slides = image_slides.setdefault(part.partname, [])
+                if number not in slides:
+                    slides.append(number)
+        print(f"     {number:>2}. {_kb(size):>7}  이미지 {images}개  {_slide_label(slide)}")
+
+    parts = sorted(_image_parts(prs), key=lambda part: len(part.blob), reverse=True)
+    if not parts:
+        return
+    image_total = sum(len(part.blob) for part in parts)
+    print(f"  → 이미지 {len(parts)}개 {_mb(image_total)} — 큰 순서 (상위 {min(top, len(parts))}개):")
+    for part in parts[:top]:
+        slides = ",".join(str(n) for n in image_slides.get(part.partname, [])) or "-"
+        print(f"     {os.path.basename(part.partname):<14} {_kb(len(part.blob)):>7}  "
+              f"{_pixel_size(part.blob):>9}  슬라이드 {slides}")
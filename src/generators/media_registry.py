@@ -0,0 +1,123 @@
+"""
+PPT 미디어 레지스트리 (프레젠테이션 1개 = 생성 세션 1개)
+python-pptx의 add_picture는 호출할 때마다 파일을 다시 읽고, SHA1을 다시 계산하고,
+PIL로 형식을 다시 확인한 뒤, 패키지의 모든 이미지 파트 SHA1을 다시 계산해서 중복을 찾는다.
+로고처럼 거의 모든 슬라이드에 들어가는 이미지는 슬라이드 수에 비례해 이 비용이 반복된다.
+
+레지스트리는 이미지마다 한 번만 읽고 해시/형식을 확인해 ImagePart를 만들어 두고,
+이후 참조는 슬라이드와 관계(rId)만 연결해서 그림 shape를 만든다.
+
+- 파일 경로: (경로, 수정시각, 크기) → ImageAsset 변환 1회
+- ImageAsset: 이미 계산된 sha1 / format 사용
+- 같은 sha1 → 같은 ImagePart
+
+Usage:
+    registry = get_media_registry(slide)
+    registry.add_picture(slide, image, left, top, width, height)
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image as PptxImage, ImagePart
+
+from src.models import ImageAsset, ImageRef
+
+
+# PIL 형식 → (확장자, content type)
+_FORMATS: Dict[str, Tuple[str, str]] = {
+    "PNG": ("png", CT.PNG),
+    "JPEG": ("jpg", CT.JPEG),
+    "GIF": ("gif", CT.GIF),
+    "BMP": ("bmp", CT.BMP),
+    "TIFF": ("tiff", CT.TIFF),
+}
+
+
+class MediaRegistry:
+    """패키지 1개의 이미지 파트 레지스트리"""
+
+    def __init__(self, package):
+        self._package = package
+        self._parts: Dict[str, ImagePart] = {}
+        self._files: Dict[Tuple[str, int, int], ImageAsset] = {}
+        self.references = 0
+        # 레지스트리 생성 전에 들어간 이미지도 재사용 대상
+        for part in package.iter_parts():
+            if isinstance(part, ImagePart) and part.partname.startswith("/ppt/media/"):
+                self._parts.setdefault(part.sha1, part)
+
+    def asset(self, image: Optional[ImageRef]) -> Optional[ImageAsset]:
+        """이미지 필드 → ImageAsset (파일은 내용이 바뀌지 않았으면 한 번만 읽음)"""
+        if isinstance(image, ImageAsset):
+            return image if image.data else None
+        if not image:
+            return None
+        try:
+            stat = os.stat(image)
+        except OSError:
+            return None
+        key = (os.path.normpath(image), stat.st_mtime_ns, stat.st_size)
+        asset = self._files.get(key)
+        if asset is None:
+            asset = ImageAsset.from_path(image)
+            self._files[key] = asset
+        return asset
+
+    def image_part(self, asset: ImageAsset) -> ImagePart:
+        """asset 내용의 ImagePart (없으면 만들어 패키지에 추가)"""
+        part = self._parts.get(asset.sha1)
+        if part is None:
+            filename = os.path.basename(asset.path) if asset.path else None
+            known = _FORMATS.get(asset.format)
+            if known:
+                ext, content_type = known
+                part = ImagePart(
+                    self._package.next_image_partname(ext), content_type,
+                    self._package, asset.data, filename,
+                )
+            else:
+                part = ImagePart.new(self._package, PptxImage(asset.data, filename))
+            self._parts[asset.sha1] = part
+        return part
+
+    def add_picture(self, slide, image: Optional[ImageRef], left, top, width, height):
+        """
+        그림 shape 추가
+
+        Returns:
+            추가된 Picture shape (이미지가 없으면 None)
+        """
+        asset = self.asset(image)
+        if asset is None:
+            return None
+        part = self.image_part(asset)
+        rId = slide.part.relate_to(part, RT.IMAGE)
+        shapes = slide.shapes
+        pic = shapes._add_pic_from_image_part(part, rId, left, top, width, height)
+        shapes._recalculate_extents()
+        self.references += 1
+        return shapes._shape_factory(pic)
+
+    def summary(self) -> str:
+        return f"이미지 참조 {self.references}개 → 고유 이미지 {len(self._parts)}개"
+
+
+_REGISTRY_ATTR = "_media_registry"
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_media_registry(target) -> MediaRegistry:
+    """
+    target(Presentation 또는 슬라이드)이 속한 패키지의 레지스트리
+
+    레지스트리는 패키지 객체에 붙여 두므로 프레젠테이션과 수명이 같다.
+    """
+    package = target.part.package
+    with _REGISTRY_LOCK:
+        registry = getattr(package, _REGISTRY_ATTR, None)
+        if registry is None:
+            registry = MediaRegistry(package)
+            setattr(package, _REGISTRY_ATTR, registry)
+        return registry
@@ -18,10 +18,14 @@ from src.generators.slide_location import add_location_slide
 from src.generators.slide_school import add_elementary_school_slide, add_middle_high_school_slide
 from src.generators.slide_price import add_price_slide
 from src.generators.slide_property import add_property_slide
+from src.generators.deck_size import fit_to_size, report_sizes
+from src.generators.media_registry import get_media_registry
 from src.processors.data_aggregator import (
     generate_complex_overview_text,
     generate_price_summary,
 )
+from src.processors.image_executor import get_image_executor
+from src.processors.image_optimizer import DEFAULT_DPI, image_size_bytes, optimize_image_async, optimize_path
 
 
 def generate_briefing_pptx(
@@ -31,6 +35,10 @@ def generate_briefing_pptx(
     output_dir: str = "output",
     background_path: Optional[str] = None,
     profile_pptx_path: Optional[str] = None,
+    image_dpi: Optional[int] = DEFAULT_DPI,
+    price_chart: str = "image",
+    chart_volume: bool = True,
+    max_size_mb: Optional[float] = None,
 ) -> str:
     """
     브리핑 PPT 생성 메인 함수
@@ -48,6 +56,10 @@ def generate_briefing_pptx(
         output_dir: 출력 디렉토리
         background_path: 표지 배경 이미지 경로
         profile_pptx_path: 중개파트너 프로필 모음 PPTX 경로
+        image_dpi: 이미지 최적화 목표 DPI (None/0이면 원본 그대로 삽입)
+        price_chart: 실거래가 그래프 방식 ("image" / "native")
+        chart_volume: native 그래프 아래 월별 거래량 막대 표시
+        max_size_mb: 파일 용량 예산 (MB). 넘으면 큰 이미지부터 재압축 (None/0이면 제한 없음)
 
     Returns:
         생성된 PPT 파일 경로
@@ -65,6 +77,14 @@ def generate_briefing_pptx(
     complex_names = [cd.complex_info.name for cd in complex_data_list]
     logo_path = agent.logo_path if os.path.exists(agent.logo_path) else None
 
+    # ─── 0. 이미지 최적화 (배치 영역 × DPI) ───
+    if image_dpi:
+        background_path = background_path or os.path.join("assets", "cover_image.png")
+        background_path = optimize_path(background_path, "cover_image", image_dpi)
+        # 로고는 표지 영역이 가장 크다
+        logo_path = optimize_path(logo_path, "cover_logo", image_dpi)
+        complex_data_list = _optimize_images(complex_data_list, image_dpi)
+
     print(f"[INFO] PPT 생성 시작: {customer_name}님 브리핑자료")
 
     # ─── 1. 표지 ───
@@ -114,6 +134,8 @@ def generate_briefing_pptx(
             add_price_slide(
                 prs, ci.name, cd.price_info, price_summary,
                 logo_path=logo_path,
+                price_chart=price_chart,
+                chart_volume=chart_volume,
             )
 
         # 매물별 슬라이드
@@ -121,6 +143,8 @@ def generate_briefing_pptx(
             print(f"  → [{ci.name}] {prop.dong} {prop.floor} 매물정보 슬라이드 생성")
             add_property_slide(prs, prop, logo_path=logo_path)
 
+    print(f"  → {get_media_registry(prs).summary()}")
+
     # ─── 전체 서체 통일 ───
     _apply_font_to_all(prs, "Noto Sans KR")
 
@@ -129,7 +153,11 @@ def generate_briefing_pptx(
     today_str = date.today().strftime("%Y%m%d")
     filename = f"{customer_name}_브리핑자료_{today_str}.pptx"
     output_path = os.path.join(output_dir, filename)
-    prs.save(output_path)
+    max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+    data = fit_to_size(prs, max_bytes)
+    with open(output_path, "wb") as f:
+        f.write(data)
+    report_sizes(prs, len(data))
 
     slide_count = len(prs.slides)
     print(f"\n[SUCCESS] PPT 생성 완료!")
@@ -139,6 +167,94 @@ def generate_briefing_pptx(
     return output_path
 
 
+# 모델 이미지 필드 → 슬라이드 배치 영역 (slide_utils.IMAGE_BOXES)
+_IMAGE_FIELDS = {
+    "complex_info": {
+        "aerial_photo_path": "overview_aerial",
+        "satellite_map_path": "overview_site_plan",
+        "site_plan_path": "overview_site_plan",
+    },
+    "location_info": {
+        "walk_route_image_path": "location_walk",
+        "transit_route_image_path": "location_transit",
+    },
+    "school_info": {
+        "elementary_map_path": "school_elementary",
+        "middle_high_map_path": "school_middle_high",
+    },
+    "price_info": {
+        "deals_image_path": "price_deals",
+        "price_graph_image_path": "price_graph",
+    },
+}
+_PROPERTY_IMAGE_FIELDS = {
+    "dong_location_image_path": "property_dong",
+    "floor_plan_image_path": "property_floor_plan",
+}
+
+
+def _image_slots(cd: ComplexData):
+    """(모델, 필드명, 배치 영역) — 단지 데이터의 이미지 필드 전체"""
+    for section, fields in _IMAGE_FIELDS.items():
+        model = getattr(cd, section)
+        if model is None:
+            continue
+        for field, box in fields.items():
+            yield model, field, box
+    for prop in cd.properties:
+        for field, box in _PROPERTY_IMAGE_FIELDS.items():
+            yield prop, field, box
+
+
+def prefetch_images(complex_data: ComplexData, dpi: int = DEFAULT_DPI):
+    """
+    단지 하나의 이미지 최적화를 미리 시작 (결과는 기다리지 않음)
+
+    크롤링 중에 호출하면 인코딩이 다음 단지 크롤링과 겹쳐 실행되고,
+    PPT 생성 시 _optimize_images()는 같은 작업의 결과(또는 캐시)를 바로 받는다.
+    """
+    if not dpi:
+        return
+    for model, field, box in _image_slots(complex_data):
+        image = getattr(model, field)
+        if image_size_bytes(image):
+            optimize_image_async(image, box, dpi=dpi)
+
+
+def _optimize_images(complex_data_list: List[ComplexData], dpi: int) -> List[ComplexData]:
+    """
+    단지 데이터의 이미지 경로를 최적화된 이미지로 바꾼 사본 목록
+
+    모든 이미지를 image_executor에 먼저 제출한 뒤 결과를 모은다.
+    원본 파일과 입력 모델은 건드리지 않는다.
+    """
+    before = after = count = 0
+
+    result = []
+    pending = []
+    for cd in complex_data_list:
+        cd = cd.model_copy(deep=True)
+        for model, field, box in _image_slots(cd):
+            image = getattr(model, field)
+            size = image_size_bytes(image)
+            if size:
+                pending.append((model, field, size, optimize_image_async(image, box, dpi=dpi)))
+        result.append(cd)
+
+    for model, field, size, future in pending:
+        new_image = future.result()
+        setattr(model, field, new_image)
+        before += size
+        after += image_size_bytes(new_image)
+        count += 1
+
+    if count:
+        print(f"  → 이미지 최적화 {count}개: "
+              f"{before / 1024 / 1024:.1f}MB → {after / 1024 / 1024:.1f}MB ({dpi}dpi)")
+        print(f"  → {get_image_executor().summary()}")
+    return result
+
+
 def _apply_font_to_all(prs: Presentation, font_name: str):
     """프레젠테이션 내 모든 텍스트 run의 서체를 font_name으로 변경"""
     for slide in prs.slides:
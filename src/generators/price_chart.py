@@ -0,0 +1,216 @@
+"""
+실거래가 추이 차트 (PowerPoint 네이티브 차트)
+matplotlib PNG 대신 python-pptx 분산형(선+표식) 차트를 슬라이드에 직접 만든다.
+이미지 인코딩이 없어 빠르고, 파일이 작고, 확대해도 깨지지 않으며 PowerPoint에서 편집할 수 있다.
+
+- 매매가: XY 분산형 (x = 거래일 엑셀 날짜값, y = 억원)
+- 거래량(선택): 아래쪽에 월별 거래건수 세로 막대 차트
+- 데이터: 실거래 이력 저장소(.npz) 컬럼 → 없으면 PriceInfo.recent_transactions
+"""
+import os
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_MARKER_STYLE, XL_TICK_LABEL_POSITION
+from pptx.enum.dml import MSO_LINE
+from pptx.util import Emu, Pt
+
+from src.models import PriceInfo
+from src.generators.slide_utils import image_box
+from src.processors.price_store import PriceHistoryStore
+
+
+# matplotlib 차트(chart_generator)와 같은 색
+PRICE_COLOR = RGBColor(0xC8, 0x10, 0x2E)
+LINE_COLOR = RGBColor(0xEE, 0xB7, 0xC0)
+VOLUME_COLOR = RGBColor(0xB0, 0xB0, 0xB0)
+GRID_COLOR = RGBColor(0xDD, 0xDD, 0xDD)
+
+# 거래량 차트가 차지하는 세로 비율
+VOLUME_HEIGHT_RATIO = 0.26
+
+# 엑셀 날짜값 기준일
+_EXCEL_EPOCH = np.datetime64("1899-12-30", "D")
+
+
+def price_series(price_info: Optional[PriceInfo]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    차트용 (거래일 datetime64[D], 거래가 원) 배열 — 날짜순 정렬
+
+    실거래 이력 저장소가 있으면 전체 이력, 없으면 최근 거래 목록. 거래가 없으면 None.
+    """
+    if price_info is None:
+        return None
+    dates = prices = None
+    if price_info.history_path and os.path.exists(price_info.history_path):
+        store = PriceHistoryStore.load(price_info.history_path)
+        if len(store):
+            dates, prices = store.dates, store.price_raw
+    if dates is None and price_info.recent_transactions:
+        dates = np.array([t.date for t in price_info.recent_transactions], dtype="datetime64[D]")
+        prices = np.array([t.price_raw for t in price_info.recent_transactions], dtype=np.int64)
+    if dates is None:
+        return None
+    order = np.argsort(dates, kind="stable")
+    return dates[order], prices[order]
+
+
+def _excel_days(dates: np.ndarray) -> np.ndarray:
+    return (dates.astype("datetime64[D]") - _EXCEL_EPOCH).astype(np.int64)
+
+
+def _year_start(year: int) -> int:
+    return int((np.datetime64(f"{year:04d}-01-01", "D") - _EXCEL_EPOCH).astype(np.int64))
+
+
+def _style_axis_font(axis, size: int = 8):
+    axis.tick_labels.font.size = Pt(size)
+    axis.tick_labels.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
+
+
+def _add_price_xy(slide, dates: np.ndarray, prices_raw: np.ndarray, complex_name: str,
+                  left, top, width, height):
+    """매매가 분산형 차트"""
+    days = _excel_days(dates)
+    prices = prices_raw / 100000000
+
+    chart_data = XyChartData()
+    series_data = chart_data.add_series("매매가", number_format="0.00")
+    for x, y in zip(days.tolist(), prices.tolist()):
+        series_data.add_data_point(x, round(y, 2))
+
+    frame = slide.shapes.add_chart(
+        XL_CHART_TYPE.XY_SCATTER_LINES, left, top, width, height, chart_data,
+    )
+    chart = frame.chart
+    chart.has_legend = False
+    chart.font.size = Pt(8)
+    chart.has_title = True
+    title = chart.chart_title.text_frame.paragraphs[0]
+    title.text = f"{complex_name} 매매가 추이"
+    title.font.size = Pt(11)
+    title.font.bold = True
+
+    series = chart.plots[0].series[0]
+    series.smooth = False
+    series.format.line.color.rgb = LINE_COLOR
+    series.format.line.width = Pt(1)
+    series.marker.style = XL_MARKER_STYLE.CIRCLE
+    series.marker.size = 4 if len(days) > 60 else 6
+    series.marker.format.fill.solid()
+    series.marker.format.fill.fore_color.rgb = PRICE_COLOR
+    series.marker.format.line.fill.background()
+
+    # x축: 연도 눈금 (기간에 따라 1~3년 간격)
+    first_year = int(str(dates[0])[:4])
+    last_year = int(str(dates[-1])[:4])
+    span = last_year - first_year + 1
+    step = 1 if span <= 6 else (2 if span <= 12 else 3)
+    x_axis = chart.category_axis
+    x_axis.minimum_scale = _year_start(first_year)
+    x_axis.maximum_scale = _year_start(last_year + 1)
+    x_axis.major_unit = step * 365.25
+    x_axis.has_major_gridlines = False
+    x_axis.tick_labels.number_format = "yyyy"
+    x_axis.tick_labels.number_format_is_linked = False
+    _style_axis_font(x_axis)
+
+    # y축: 억원, 점선 눈금선
+    y_axis = chart.value_axis
+    low, high = float(prices.min()), float(prices.max())
+    pad = max(0.5, (high - low) * 0.1)
+    y_axis.minimum_scale = max(0.0, round(low - pad, 1))
+    y_axis.maximum_scale = round(high + pad, 1)
+    y_axis.tick_labels.number_format = "0.0"
+    y_axis.tick_labels.number_format_is_linked = False
+    y_axis.has_major_gridlines = True
+    gridline = y_axis.major_gridlines.format.line
+    gridline.color.rgb = GRID_COLOR
+    gridline.dash_style = MSO_LINE.DASH
+    y_axis.has_title = True
+    axis_title = y_axis.axis_title.text_frame.paragraphs[0]
+    axis_title.text = "매매가 (억원)"
+    axis_title.font.size = Pt(8)
+    axis_title.font.bold = False
+    _style_axis_font(y_axis)
+    return frame
+
+
+def _add_volume_columns(slide, dates: np.ndarray, left, top, width, height):
+    """월별 거래건수 막대 차트 (거래 없는 달은 0)"""
+    months = dates.astype("datetime64[M]")
+    # 매매가 차트 x축(첫 해 1월 ~ 마지막 해 12월)과 막대 위치를 맞춤
+    first_month = months[0].astype("datetime64[Y]").astype("datetime64[M]")
+    end_month = (months[-1].astype("datetime64[Y]") + 1).astype("datetime64[M]")
+    all_months = np.arange(first_month, end_month)
+    counts = np.zeros(len(all_months), dtype=np.int64)
+    uniq, cnt = np.unique(months, return_counts=True)
+    counts[(uniq - all_months[0]).astype(np.int64)] = cnt
+
+    chart_data = CategoryChartData(number_format="0")
+    chart_data.categories = [m.astype("datetime64[D]").astype(date) for m in all_months]
+    chart_data.add_series("거래량", counts.tolist())
+
+    frame = slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, left, top, width, height, chart_data,
+    )
+    chart = frame.chart
+    chart.has_legend = False
+    chart.font.size = Pt(7)
+    plot = chart.plots[0]
+    plot.gap_width = 30
+    series = plot.series[0]
+    series.format.fill.solid()
+    series.format.fill.fore_color.rgb = VOLUME_COLOR
+
+    chart.category_axis.tick_label_position = XL_TICK_LABEL_POSITION.NONE
+    chart.category_axis.has_major_gridlines = False
+    y_axis = chart.value_axis
+    y_axis.has_major_gridlines = False
+    y_axis.minimum_scale = 0
+    y_axis.tick_labels.number_format = "0"
+    y_axis.tick_labels.number_format_is_linked = False
+    y_axis.has_title = True
+    axis_title = y_axis.axis_title.text_frame.paragraphs[0]
+    axis_title.text = "거래량"
+    axis_title.font.size = Pt(7)
+    axis_title.font.bold = False
+    _style_axis_font(y_axis, 7)
+    return frame
+
+
+def add_price_chart(
+    slide,
+    dates: np.ndarray,
+    prices_raw: np.ndarray,
+    complex_name: str,
+    box: str = "price_graph",
+    volume: bool = True,
+):
+    """
+    매매가 추이 네이티브 차트 추가
+
+    Args:
+        dates: datetime64[D] 거래일 배열 (날짜순)
+        prices_raw: 거래가 배열 (원)
+        complex_name: 단지명 (차트 제목용)
+        box: IMAGE_BOXES 영역 이름
+        volume: 아래쪽에 월별 거래량 막대 추가
+
+    Returns:
+        매매가 차트 GraphicFrame (거래가 없으면 None)
+    """
+    if len(dates) == 0:
+        return None
+    left, top, width, height = image_box(box)
+    if not volume:
+        return _add_price_xy(slide, dates, prices_raw, complex_name, left, top, width, height)
+
+    volume_height = Emu(int(height * VOLUME_HEIGHT_RATIO))
+    price_height = Emu(height - volume_height)
+    frame = _add_price_xy(slide, dates, prices_raw, complex_name, left, top, width, price_height)
+    _add_volume_columns(slide, dates, left, Emu(top + price_height), width, volume_height)
+    return frame
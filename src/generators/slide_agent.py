@@ -13,6 +13,9 @@ from pptx.enum.text import PP_ALIGN
 from pptx.shapes.picture import Picture
 from pptx.shapes.group import GroupShape
 
+from src.models import ImageAsset
+from src.generators.media_registry import get_media_registry
+
 
 # 프로필 PPT 높이(5.62") → 출력 PPT 높이(6.25") 비율
 _Y_SCALE = 6.25 / 5.62  # ≈ 1.112
@@ -106,18 +109,22 @@ def _scale_y(y_emu: int) -> int:
 
 
 def _copy_picture(shape: Picture, dst_slide):
-    """이미지 shape 복사: blob 추출 → BytesIO → add_picture"""
+    """이미지 shape 복사: blob 추출 → 미디어 레지스트리 (PIL이 못 읽는 형식은 BytesIO → add_picture)"""
     try:
         image = shape.image
         blob = image.blob
-        stream = BytesIO(blob)
 
         left = shape.left
         top = _scale_y(shape.top)
         width = shape.width
         height = int(shape.height * _Y_SCALE)
 
-        dst_slide.shapes.add_picture(stream, left, top, width, height)
+        try:
+            asset = ImageAsset.from_bytes(blob)
+        except Exception:
+            dst_slide.shapes.add_picture(BytesIO(blob), left, top, width, height)
+            return
+        get_media_registry(dst_slide).add_picture(dst_slide, asset, left, top, width, height)
     except Exception as e:
         print(f"    [WARN] 이미지 복사 실패: {e}")
 
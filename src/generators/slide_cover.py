@@ -9,6 +9,8 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 
+from src.generators.slide_utils import add_picture
+
 
 def add_cover_slide(
     prs: Presentation,
@@ -31,12 +33,7 @@ def add_cover_slide(
 
     # 우측 커버 이미지
     cover_image_path = background_path or os.path.join("assets", "cover_image.png")
-    if os.path.exists(cover_image_path):
-        slide.shapes.add_picture(
-            cover_image_path,
-            Inches(5.952), Inches(0),
-            Inches(4.048), Inches(6.25),
-        )
+    add_picture(slide, cover_image_path, "cover_image")
 
     # 좌측 고객명 + 브리핑 제목 (우측정렬, 40pt bold)
     complex_text = " / ".join(complex_names) if complex_names else ""
@@ -77,11 +74,6 @@ def add_cover_slide(
     p3.alignment = PP_ALIGN.RIGHT
 
     # 좌하단 로고 이미지
-    if logo_path and os.path.exists(logo_path):
-        slide.shapes.add_picture(
-            logo_path,
-            Inches(1.357), Inches(4.770),
-            Inches(3.033), Inches(1.480),
-        )
+    add_picture(slide, logo_path, "cover_logo")
 
     return slide
@@ -1,7 +1,6 @@
 """
 입지정보 슬라이드 생성 — 레퍼런스 PPT 양식
 """
-import os
 from typing import Optional
 
 from pptx import Presentation
@@ -10,7 +9,7 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 
 from src.models import LocationInfo
-from src.generators.slide_utils import add_slide_header, add_logo, add_source_text
+from src.generators.slide_utils import add_slide_header, add_logo, add_source_text, add_picture, image_box
 
 
 def add_location_slide(
@@ -59,34 +58,16 @@ def add_location_slide(
     p2.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
 
     # ── 좌측 지도 이미지 ──
-    if (location_info.walk_route_image_path
-            and os.path.exists(location_info.walk_route_image_path)):
-        slide.shapes.add_picture(
-            location_info.walk_route_image_path,
-            Inches(0.678), Inches(1.384),
-            Inches(3.956), Inches(3.935),
-        )
-    else:
+    if not add_picture(slide, location_info.walk_route_image_path, "location_walk"):
         _add_placeholder_text(
-            slide,
-            Inches(0.678), Inches(1.384),
-            Inches(3.956), Inches(3.935),
+            slide, *image_box("location_walk"),
             "[최근접역 경로 지도]",
         )
 
     # ── 우측 지도 이미지 ──
-    if (location_info.transit_route_image_path
-            and os.path.exists(location_info.transit_route_image_path)):
-        slide.shapes.add_picture(
-            location_info.transit_route_image_path,
-            Inches(4.998), Inches(1.387),
-            Inches(3.905), Inches(3.935),
-        )
-    else:
+    if not add_picture(slide, location_info.transit_route_image_path, "location_transit"):
         _add_placeholder_text(
-            slide,
-            Inches(4.998), Inches(1.387),
-            Inches(3.905), Inches(3.935),
+            slide, *image_box("location_transit"),
             "[강남역 대중교통 경로]",
         )
 
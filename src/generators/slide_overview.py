@@ -1,7 +1,6 @@
 """
 단지 개요 슬라이드 생성 — 레퍼런스 PPT 양식
 """
-import os
 from typing import Optional
 
 from pptx import Presentation
@@ -11,7 +10,7 @@ from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
 from src.models import ComplexInfo
-from src.generators.slide_utils import add_slide_header, add_logo, add_source_text
+from src.generators.slide_utils import add_slide_header, add_logo, add_source_text, add_picture
 
 
 def add_overview_slide(
@@ -74,26 +73,11 @@ def add_overview_slide(
         txBox2.fill.fore_color.rgb = RGBColor(0xEE, 0xFF, 0x41)
 
     # 좌측 이미지: 전경사진 (0.428", 1.948", 4.415"×3.509")
-    if complex_info.aerial_photo_path and os.path.exists(complex_info.aerial_photo_path):
-        slide.shapes.add_picture(
-            complex_info.aerial_photo_path,
-            Inches(0.428), Inches(1.948),
-            Inches(4.415), Inches(3.509),
-        )
+    add_picture(slide, complex_info.aerial_photo_path, "overview_aerial")
 
     # 우측 이미지: 배치도/위성지도 (5.0", 1.948", 4.439"×3.246")
-    if complex_info.satellite_map_path and os.path.exists(complex_info.satellite_map_path):
-        slide.shapes.add_picture(
-            complex_info.satellite_map_path,
-            Inches(5.0), Inches(1.948),
-            Inches(4.439), Inches(3.246),
-        )
-    elif complex_info.site_plan_path and os.path.exists(complex_info.site_plan_path):
-        slide.shapes.add_picture(
-            complex_info.site_plan_path,
-            Inches(5.0), Inches(1.948),
-            Inches(4.439), Inches(3.246),
-        )
+    if not add_picture(slide, complex_info.satellite_map_path, "overview_site_plan"):
+        add_picture(slide, complex_info.site_plan_path, "overview_site_plan")
 
     # 출처
     add_source_text(slide, "*네이버부동산  *네이버지도")
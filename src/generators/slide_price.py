@@ -1,7 +1,6 @@
 """
 실거래가 슬라이드 생성 — 레퍼런스 PPT 양식
 """
-import os
 from datetime import date
 from typing import Optional, List
 
@@ -11,7 +10,8 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 
 from src.models import PriceInfo
-from src.generators.slide_utils import add_slide_header, add_logo, add_source_text
+from src.generators.slide_utils import add_slide_header, add_logo, add_source_text, add_picture
+from src.generators.price_chart import add_price_chart, price_series
 
 
 def _filter_recent_transactions(price_info: PriceInfo) -> list:
@@ -49,6 +49,8 @@ def add_price_slide(
     price_info: PriceInfo,
     price_summary_text: str,
     logo_path: Optional[str] = None,
+    price_chart: str = "image",
+    chart_volume: bool = True,
 ):
     """
     실거래가 슬라이드 추가 (레퍼런스 레이아웃)
@@ -58,6 +60,11 @@ def add_price_slide(
     - 빨간 세로 마커 + 라벨 "매매거래" at (4.049", 1.882")
     - 실거래 테이블 이미지: (0.713", 2.102")
     - 매매거래 그래프: (4.139", 2.102")
+
+    price_chart:
+        "image"  — 그래프 이미지 (아실 캡처 / matplotlib)
+        "native" — PowerPoint 차트 (실거래 이력 저장소 → 최근 거래 목록).
+                   그래프 이미지(아실 / 기간이 짧은 저장소 대신 빌려 온 그래프)가 있으면 이미지 우선
     """
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
@@ -110,13 +117,7 @@ def add_price_slide(
 
     # ── 좌측: 최근 실거래 (0.713", 2.102") ──
     # 아실 거래내역 스크린샷이 있으면 이미지, 없으면 테이블 생성
-    if price_info.deals_image_path and os.path.exists(price_info.deals_image_path):
-        slide.shapes.add_picture(
-            price_info.deals_image_path,
-            Inches(0.713), Inches(2.102),
-            Inches(3.2), Inches(3.2),
-        )
-    else:
+    if not add_picture(slide, price_info.deals_image_path, "price_deals"):
         transactions = _filter_recent_transactions(price_info)
         if transactions:
             cols = 4
@@ -163,12 +164,10 @@ def add_price_slide(
                         cell.fill.fore_color.rgb = RGBColor(0xF5, 0xF5, 0xF5)
 
     # ── 우측: 매매거래 그래프 (4.139", 2.102") ──
-    if price_info.price_graph_image_path and os.path.exists(price_info.price_graph_image_path):
-        slide.shapes.add_picture(
-            price_info.price_graph_image_path,
-            Inches(4.139), Inches(2.102),
-            Inches(5.3), Inches(3.2),
-        )
+    if price_chart == "native":
+        _add_native_or_image_chart(slide, complex_name, price_info, chart_volume)
+    else:
+        add_picture(slide, price_info.price_graph_image_path, "price_graph")
 
     # 출처
     add_source_text(slide, "*아실  *국토교통부 실거래가 공개시스템")
@@ -179,6 +178,20 @@ def add_price_slide(
     return slide
 
 
+def _add_native_or_image_chart(slide, complex_name: str, price_info: PriceInfo, volume: bool):
+    """
+    그래프 이미지 → 네이티브 차트 (이력 저장소 / 최근 거래) 순
+
+    native 모드에서 price_provider는 저장소 그래프 이미지를 만들지 않으므로, 이미지가 있다는 것은
+    아실 그래프이거나 저장소 기간이 짧아 빌려 온 긴 기간 그래프라는 뜻이다.
+    """
+    if add_picture(slide, price_info.price_graph_image_path, "price_graph"):
+        return
+    series = price_series(price_info)
+    if series is not None:
+        add_price_chart(slide, *series, complex_name, volume=volume)
+
+
 def _add_red_marker(slide, left, top):
     """빨간 세로 마커 (0.052"×0.197")"""
     marker = slide.shapes.add_shape(
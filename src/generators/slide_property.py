@@ -1,7 +1,6 @@
 """
 매물정보 슬라이드 생성 — 레퍼런스 PPT 양식
 """
-import os
 from typing import Optional
 
 from pptx import Presentation
@@ -10,7 +9,7 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 
 from src.models import PropertyDetail
-from src.generators.slide_utils import add_slide_header, add_logo, add_source_text
+from src.generators.slide_utils import add_slide_header, add_logo, add_source_text, add_picture, image_box
 
 
 def add_property_slide(
@@ -58,32 +57,16 @@ def add_property_slide(
     lp2.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
 
     # ── 좌측: 배치도/동 위치 이미지 (0.084", 1.688", 2.712"×3.673") ──
-    if prop.dong_location_image_path and os.path.exists(prop.dong_location_image_path):
-        slide.shapes.add_picture(
-            prop.dong_location_image_path,
-            Inches(0.084), Inches(1.688),
-            Inches(2.712), Inches(3.673),
-        )
-    else:
+    if not add_picture(slide, prop.dong_location_image_path, "property_dong"):
         _add_placeholder_text(
-            slide,
-            Inches(0.084), Inches(1.688),
-            Inches(2.712), Inches(3.673),
+            slide, *image_box("property_dong"),
             "[단지 내 위치]",
         )
 
     # ── 우측: 평면도 (2.864", 1.688", 4.607"×3.673") ──
-    if prop.floor_plan_image_path and os.path.exists(prop.floor_plan_image_path):
-        slide.shapes.add_picture(
-            prop.floor_plan_image_path,
-            Inches(2.864), Inches(1.688),
-            Inches(4.607), Inches(3.673),
-        )
-    else:
+    if not add_picture(slide, prop.floor_plan_image_path, "property_floor_plan"):
         _add_placeholder_text(
-            slide,
-            Inches(2.864), Inches(1.688),
-            Inches(4.607), Inches(3.673),
+            slide, *image_box("property_floor_plan"),
             "[평면도]",
         )
 
@@ -2,7 +2,6 @@
 학군지도 슬라이드 생성 — 레퍼런스 PPT 양식
 초등학교 학구도 (Slide C) + 중·고등학교 학군 지도 (Slide D)
 """
-import os
 from typing import Optional
 
 from pptx import Presentation
@@ -11,7 +10,7 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 
 from src.models import SchoolInfo
-from src.generators.slide_utils import add_slide_header, add_logo, add_source_text
+from src.generators.slide_utils import add_slide_header, add_logo, add_source_text, add_picture, image_box
 
 
 def add_elementary_school_slide(
@@ -34,15 +33,9 @@ def add_elementary_school_slide(
     add_slide_header(slide, "학구도(초등학교)", "학군지도")
 
     # ── 학구도 지도 이미지 (왼쪽) ──
-    if (school_info.elementary_map_path
-            and os.path.exists(school_info.elementary_map_path)):
-        slide.shapes.add_picture(
-            school_info.elementary_map_path,
-            Inches(0.5), Inches(1.2), Inches(5.0), Inches(4.5)
-        )
-    else:
+    if not add_picture(slide, school_info.elementary_map_path, "school_elementary"):
         _add_placeholder_text(
-            slide, Inches(0.5), Inches(1.2), Inches(5.0), Inches(4.5),
+            slide, *image_box("school_elementary"),
             "[초등학교 학구도 지도]"
         )
 
@@ -183,15 +176,9 @@ def add_middle_high_school_slide(
     add_slide_header(slide, "학군지도(중·고등학교)", "학군지도")
 
     # 학군 지도 이미지
-    if (school_info.middle_high_map_path
-            and os.path.exists(school_info.middle_high_map_path)):
-        slide.shapes.add_picture(
-            school_info.middle_high_map_path,
-            Inches(0.5), Inches(1.2), Inches(9.0), Inches(4.3)
-        )
-    else:
+    if not add_picture(slide, school_info.middle_high_map_path, "school_middle_high"):
         _add_placeholder_text(
-            slide, Inches(0.5), Inches(1.2), Inches(9.0), Inches(4.3),
+            slide, *image_box("school_middle_high"),
             "[중·고등학교 학군 지도]"
         )
 
@@ -2,14 +2,65 @@
 공통 슬라이드 유틸리티
 레퍼런스 PPT의 공통 요소를 함수화
 """
-import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
+from src.models import ImageAsset, ImageRef
+from src.generators.media_registry import get_media_registry
+from src.utils.write_behind import file_ready
+
+
+# ─── 이미지 배치 영역 ───
+# (left, top, width, height) 인치. 슬라이드 생성기와 이미지 최적화(image_optimizer)가 함께 사용
+IMAGE_BOXES: Dict[str, Tuple[float, float, float, float]] = {
+    "cover_image": (5.952, 0.0, 4.048, 6.25),
+    "cover_logo": (1.357, 4.770, 3.033, 1.480),
+    "logo": (4.139, 5.726, 1.68, 0.48),
+    "overview_aerial": (0.428, 1.948, 4.415, 3.509),
+    "overview_site_plan": (5.0, 1.948, 4.439, 3.246),
+    "location_walk": (0.678, 1.384, 3.956, 3.935),
+    "location_transit": (4.998, 1.387, 3.905, 3.935),
+    "school_elementary": (0.5, 1.2, 5.0, 4.5),
+    "school_middle_high": (0.5, 1.2, 9.0, 4.3),
+    "price_deals": (0.713, 2.102, 3.2, 3.2),
+    "price_graph": (4.139, 2.102, 5.3, 3.2),
+    "property_dong": (0.084, 1.688, 2.712, 3.673),
+    "property_floor_plan": (2.864, 1.688, 4.607, 3.673),
+}
+
+
+def image_box(name: str) -> Tuple[Emu, Emu, Emu, Emu]:
+    """IMAGE_BOXES 영역 → (left, top, width, height) EMU"""
+    return tuple(Inches(v) for v in IMAGE_BOXES[name])
+
+
+def has_image(image: Optional[ImageRef]) -> bool:
+    """이미지 필드에 넣을 수 있는 이미지가 있는지 (메모리 이미지 또는 존재하는 파일)"""
+    if isinstance(image, ImageAsset):
+        return bool(image.data)
+    return bool(image) and file_ready(image)
+
+
+def add_picture(slide, image: Optional[ImageRef], box: str):
+    """
+    IMAGE_BOXES 영역에 이미지 추가
+
+    Args:
+        image: 파일 경로 또는 ImageAsset
+               (미디어 레지스트리 경유 — 같은 이미지는 파일을 다시 읽지 않고 이미지 파트 재사용)
+        box: IMAGE_BOXES 영역 이름
+
+    Returns:
+        추가된 Picture shape (이미지가 없으면 None)
+    """
+    if not has_image(image):
+        return None
+    return get_media_registry(slide).add_picture(slide, image, *image_box(box))
+
 
 def add_group_marker(slide):
     """
@@ -75,17 +126,12 @@ def add_slide_header(slide, title: str, subtitle: str):
     p2.alignment = PP_ALIGN.RIGHT
 
 
-def add_logo(slide, logo_path: Optional[str] = None):
+def add_logo(slide, logo_path: Optional[ImageRef] = None):
     """
     중앙 하단 로고 이미지
     위치: (4.139", 5.726", 1.68"×0.48")
     """
-    if logo_path and os.path.exists(logo_path):
-        slide.shapes.add_picture(
-            logo_path,
-            Inches(4.139), Inches(5.726),
-            Inches(1.68), Inches(0.48),
-        )
+    add_picture(slide, logo_path, "logo")
 
 
 def add_source_text(slide, text: str):
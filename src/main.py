@@ -19,16 +19,22 @@ from src.models import (
     PropertyDetail,
 )
 from src.utils.url_parser import parse_naver_land_url
-from src.crawlers.naver_land import fetch_complex_info, fetch_property_detail, fetch_school_basic_from_ssr, capture_complex_images, capture_complex_detail_screenshot
-from src.crawlers.asil import fetch_price_info, fetch_price_info_mock, capture_asil_price_chart
+from src.utils.write_behind import flush_writes
+from src.utils.geo_cache import get_geo_cache
+from src.crawlers.naver_land import fetch_complex_info, fetch_property_detail, fetch_school_basic_from_ssr, capture_complex_images, capture_complex_detail_screenshot, load_lawd_cd, load_jibun
+from src.crawlers.asil import fetch_price_info_mock
+from src.crawlers.price_provider import fetch_price_hedged
 from src.crawlers.naver_map import fetch_location_info
+from src.crawlers.cascade import format_cascade_stats
 from src.crawlers.school_zone import fetch_school_info
+from src.crawlers.neis_directory import refresh_school_directory
 from src.processors.data_aggregator import (
     group_properties_by_complex,
     generate_hashtags,
 )
 from src.processors.chart_generator import generate_price_chart
-from src.generators.pptx_generator import generate_briefing_pptx
+from src.processors.image_executor import get_image_executor
+from src.generators.pptx_generator import generate_briefing_pptx, prefetch_images
 
 
 # ─── 설정 로드 ───
@@ -94,6 +100,13 @@ def run_pipeline(
     temp_dir = "temp"
     output_dir = config.get("output", {}).get("directory", "output")
     api_key = config.get("public_data_api_key", "")
+    price_config = config.get("price", {})
+    image_dpi = config.get("output", {}).get("image_dpi", 150)
+    price_chart = config.get("output", {}).get("price_chart", "image")
+    # 이미지 작업 프로세스 수 (output.image_workers) 적용
+    get_image_executor(config)
+    # 좌표 캐시 설정 (geo_cache) 적용 — 크롤러가 config 없이 먼저 호출해도 덮어쓰기가 빠지지 않도록
+    get_geo_cache(config)
 
     print("=" * 60)
     print(f"  부동산 브리핑자료 자동생성기")
@@ -110,6 +123,10 @@ def run_pipeline(
     print("\n[2/4] 데이터 수집...")
     complex_data_list = []
 
+    # 학교 디렉토리가 오래됐으면 미리 갱신 (이후 학교 조회는 로컬 테이블)
+    if not use_mock:
+        refresh_school_directory(config)
+
     for complex_id, prop_inputs in groups.items():
         print(f"\n  ── 단지 [{complex_id}] 처리 중 ──")
 
@@ -132,28 +149,30 @@ def run_pipeline(
         complex_info.hashtags = generate_hashtags(complex_info)
         print(f"  단지명: {complex_info.name}")
 
-        # 실거래가
-        if use_mock or not api_key:
+        # 실거래가 + 그래프 (아실 / 국토부 / 저장된 이력 동시 시작 → 먼저 완성된 결과)
+        chart_path = os.path.join(temp_dir, complex_id, "price_chart.png")
+        if use_mock:
             price_info = fetch_price_info_mock(complex_id, complex_info.name)
         else:
-            price_info = fetch_price_info(
-                complex_id, complex_info.name, api_key=api_key
+            price_info = fetch_price_hedged(
+                complex_id, complex_info.name, complex_info.address,
+                temp_dir=temp_dir,
+                lawd_cd=load_lawd_cd(complex_id, temp_dir),
+                api_key=api_key,
+                jibun=load_jibun(complex_id, temp_dir),
+                months=price_config.get("molit_months", 6),
+                max_concurrency=price_config.get("molit_concurrency", 4),
+                min_score=price_config.get("hedge_min_score", 0.8),
+                timeout=price_config.get("hedge_timeout_sec", 90),
+                cache_max_age_hours=price_config.get("cache_max_age_hours", 24),
+                native_chart=price_chart == "native",
+                min_chart_years=price_config.get("min_chart_years", 10),
             )
 
-        # 실거래가 그래프 생성 (아실 캡처 → matplotlib fallback)
-        chart_path = os.path.join(temp_dir, complex_id, "price_chart.png")
-        asil_result = None
-        if not use_mock:
-            asil_result = capture_asil_price_chart(
-                complex_info.name, complex_id, complex_info.address, chart_path
-            )
-        if asil_result:
-            # 아실 데이터로 price_info 대체
-            if asil_result.get("price_info"):
-                price_info = asil_result["price_info"]
-            if price_info:
-                price_info.price_graph_image_path = asil_result["chart_path"]
-        elif price_info and price_info.recent_transactions:
+        # 그래프를 얻지 못했으면 거래 목록으로 matplotlib 그래프 생성
+        # (native 모드는 슬라이드에서 거래 목록으로 PowerPoint 차트를 만듦)
+        if (price_chart != "native" and price_info and not price_info.price_graph_image_path
+                and price_info.recent_transactions):
             generate_price_chart(
                 price_info.recent_transactions,
                 complex_info.name,
@@ -192,6 +211,7 @@ def run_pipeline(
             temp_dir=temp_dir,
             use_mock=use_mock,
             ssr_schools=ssr_schools,
+            config=config,
         )
         if school_info:
             print(f"  학군정보: {school_info.elementary_name}")
@@ -228,6 +248,7 @@ def run_pipeline(
                     temp_dir,
                     latitude=complex_info.latitude or 0.0,
                     longitude=complex_info.longitude or 0.0,
+                    config=config,
                 )
                 prop.floor_plan_image_path = images.get("floor_plan_path")
                 prop.dong_location_image_path = images.get("site_plan_path")
@@ -240,6 +261,14 @@ def run_pipeline(
             properties=properties,
         )
         complex_data_list.append(complex_data)
+        # 이미지 최적화는 프로세스 풀에서 다음 단지 크롤링과 함께 진행
+        prefetch_images(complex_data, image_dpi)
+
+    # 소스별 응답 시간 / 적중률
+    cascade_stats = format_cascade_stats()
+    if cascade_stats:
+        print("\n  [INFO] 소스별 응답 통계")
+        print(cascade_stats)
 
     # 3. PPT 생성
     print("\n[3/4] PPT 생성...")
@@ -248,9 +277,14 @@ def run_pipeline(
         agent=agent,
         complex_data_list=complex_data_list,
         output_dir=output_dir,
+        image_dpi=image_dpi,
+        price_chart=price_chart,
+        chart_volume=config.get("output", {}).get("price_chart_volume", True),
+        max_size_mb=config.get("output", {}).get("max_size_mb"),
     )
 
-    # 4. 완료
+    # 4. 완료 (백그라운드로 저장 중인 캡처 사본까지 기다림)
+    flush_writes()
     print("\n[4/4] 완료!")
     print(f"\n{'=' * 60}")
     print(f"  생성된 파일: {output_path}")
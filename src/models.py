@@ -2,11 +2,66 @@
 부동산 브리핑자료 자동생성기 - 데이터 모델
 PRD Section 7 기반 Pydantic 모델 정의
 """
-from pydantic import BaseModel
-from typing import Optional, List
+import io
+import hashlib
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Union
 from datetime import date
 
 
+class ImageAsset(BaseModel):
+    """
+    메모리 이미지 (캡처/다운로드 결과)
+
+    캡처한 바이트를 디스크에 썼다가 다시 읽지 않고 슬라이드까지 그대로 넘긴다.
+    path는 디스크 사본 위치 (write_behind()로 백그라운드 저장, 없으면 메모리 전용).
+    """
+    data: bytes = Field(repr=False)
+    width: int = 0
+    height: int = 0
+    format: str = ""                   # "PNG", "JPEG"
+    sha1: str = ""
+    path: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes, path: Optional[str] = None) -> "ImageAsset":
+        """바이트 → ImageAsset (크기/형식은 헤더만 읽어서 확인)"""
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            fmt = img.format or ""
+        return cls(
+            data=data, width=width, height=height, format=fmt,
+            sha1=hashlib.sha1(data).hexdigest(), path=path,
+        )
+
+    @classmethod
+    def from_path(cls, path: str) -> "ImageAsset":
+        """이미지 파일 → ImageAsset"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read(), path=path)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+    def stream(self) -> io.BytesIO:
+        """add_picture 등에 넘길 스트림 (호출마다 새 스트림)"""
+        return io.BytesIO(self.data)
+
+    def write_behind(self) -> "ImageAsset":
+        """path가 있으면 디스크 사본을 백그라운드로 저장 (self 반환)"""
+        if self.path:
+            from src.utils.write_behind import write_behind
+            write_behind(self.path, self.data)
+        return self
+
+
+# 이미지 필드: 파일 경로 또는 메모리 이미지
+ImageRef = Union[ImageAsset, str]
+
+
 class AgentProfile(BaseModel):
     """중개사 프로필 (사전 설정)"""
     name: str                          # "홍길동"
@@ -51,9 +106,9 @@ class ComplexInfo(BaseModel):
     hashtags: List[str]                # ["역세권", "대단지"]
     latitude: Optional[float] = None           # 위도
     longitude: Optional[float] = None          # 경도
-    aerial_photo_path: Optional[str] = None   # 다운로드된 전경사진 경로
-    site_plan_path: Optional[str] = None      # 배치도 이미지 경로
-    satellite_map_path: Optional[str] = None  # 위성지도 캡처 경로
+    aerial_photo_path: Optional[ImageRef] = None   # 다운로드된 전경사진 경로
+    site_plan_path: Optional[ImageRef] = None      # 배치도 이미지 경로
+    satellite_map_path: Optional[ImageRef] = None  # 위성지도 캡처 경로
 
 
 class LocationInfo(BaseModel):
@@ -64,8 +119,8 @@ class LocationInfo(BaseModel):
     walk_minutes: int = 0              # 도보 소요시간 (분)
     station_transit_minutes: int = 0   # 역까지 대중교통 소요시간 (역이 멀 때)
     gangnam_minutes: int = 0           # 강남역까지 대중교통 소요시간
-    walk_route_image_path: Optional[str] = None
-    transit_route_image_path: Optional[str] = None
+    walk_route_image_path: Optional[ImageRef] = None
+    transit_route_image_path: Optional[ImageRef] = None
 
 
 class SchoolInfo(BaseModel):
@@ -83,8 +138,8 @@ class SchoolInfo(BaseModel):
     elementary_homepage: str = ""            # "http://www.sang-bong.es.kr"
     elementary_walk_distance: str = ""       # "도보 2분"
     elementary_distance_m: int = 0           # 106 (미터)
-    elementary_map_path: Optional[str] = None
-    middle_high_map_path: Optional[str] = None
+    elementary_map_path: Optional[ImageRef] = None
+    middle_high_map_path: Optional[ImageRef] = None
 
 
 class Transaction(BaseModel):
@@ -101,6 +156,7 @@ class PriceInfo(BaseModel):
     """실거래가 정보 (크롤링 결과)"""
     complex_id: str
     recent_transactions: List[Transaction] = []
+    failed_months: Dict[str, str] = {}  # 조회 실패한 달 {"202601": "사유"}
     month1_count: int = 0              # 이번 달 거래건수
     month1_label: str = ""             # "2026년 1월"
     month2_count: int = 0              # 지난 달 거래건수
@@ -109,8 +165,11 @@ class PriceInfo(BaseModel):
     recent_3m_low: str = ""            # "5억 5300만원"
     all_time_high: str = ""            # "7억 2000만원"
     all_time_high_date: str = ""       # "21년 10월"
-    price_graph_image_path: Optional[str] = None  # 15년 추이 그래프 이미지
-    deals_image_path: Optional[str] = None        # 아실 거래내역 스크린샷
+    price_graph_image_path: Optional[ImageRef] = None  # 15년 추이 그래프 이미지
+    history_path: Optional[str] = None            # 단지별 실거래 이력 저장소 (.npz)
+    history_years: float = 0.0                    # 이력 저장소가 다루는 기간 (년)
+    price_source: Optional[str] = None            # 채택된 소스 ("asil", "molit", "cache", "mock")
+    deals_image_path: Optional[ImageRef] = None        # 아실 거래내역 스크린샷
 
 
 class PropertyDetail(BaseModel):
@@ -123,8 +182,8 @@ class PropertyDetail(BaseModel):
     direction: Optional[str] = None
     structure: Optional[str] = None
     memo: Optional[str] = None
-    floor_plan_image_path: Optional[str] = None   # 평면도 이미지
-    dong_location_image_path: Optional[str] = None  # 배치도에서 동 위치
+    floor_plan_image_path: Optional[ImageRef] = None   # 평면도 이미지
+    dong_location_image_path: Optional[ImageRef] = None  # 배치도에서 동 위치
     rooms: Optional[int] = None
     bathrooms: Optional[int] = None
     area_pyeong: Optional[str] = None  # "21평"
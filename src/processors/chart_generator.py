@@ -1,102 +1,101 @@
 """
 실거래가 추이 그래프 생성
 matplotlib으로 15년 매매가 추이 차트 생성
+
+- matplotlib은 첫 차트를 그릴 때 import한다 (차트를 안 그리는 실행은 import 비용 없음)
+- pyplot 전역 상태를 쓰지 않고 Figure + FigureCanvasAgg 객체 API만 사용하므로
+  여러 스레드/프로세스에서 동시에 그려도 서로 간섭하지 않는다
+- 한글 폰트 / 스타일 설정은 최초 1회만 하고 이후 호출은 재사용
 """
 import os
+import io
+import threading
+from types import SimpleNamespace
 from typing import List, Optional
 
-import matplotlib
-matplotlib.use('Agg')  # GUI 없는 환경에서 사용
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib import font_manager
-from datetime import date
+import numpy as np
 
 from src.models import Transaction
+from src.utils.fonts import setup_matplotlib_korean_font
 
 
-def _get_korean_font_paths():
-    """OS별 한글 폰트 경로 목록 반환"""
-    import platform
-    system = platform.system()
-
-    if system == 'Windows':
-        return [
-            "C:/Windows/Fonts/malgun.ttf",      # 맑은 고딕
-            "C:/Windows/Fonts/NanumGothic.ttf",
-            "C:/Windows/Fonts/gulim.ttc",        # 굴림
-        ]
-    elif system == 'Darwin':  # macOS
-        return [
-            "/System/Library/Fonts/AppleSDGothicNeo.ttc",
-            "/System/Library/Fonts/Supplemental/AppleGothic.ttf",
-            "/Library/Fonts/NanumGothic.ttf",
-        ]
-    else:  # Linux
-        return [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/usr/share/fonts/nhn-nanum/NanumGothic.ttf",
-        ]
-
-
-def _setup_korean_font():
-    """한글 폰트 설정 (OS 자동 감지)"""
-    font_paths = _get_korean_font_paths()
-    for fp in font_paths:
-        if os.path.exists(fp):
-            font_manager.fontManager.addfont(fp)
-            prop = font_manager.FontProperties(fname=fp)
-            plt.rcParams['font.family'] = prop.get_name()
-            break
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-
-    plt.rcParams['axes.unicode_minus'] = False
+# 차트 스타일 (slide 네이티브 차트와 같은 색)
+PRICE_COLOR = "#C8102E"
+FACE_COLOR = "#FAFAFA"
+DEFAULT_DPI = 150
 
+_MPL: Optional[SimpleNamespace] = None
+_MPL_LOCK = threading.Lock()
 
-def generate_price_chart(
-    transactions: List[Transaction],
+
+def _matplotlib() -> SimpleNamespace:
+    """
+    matplotlib 객체 API 모듈 (최초 호출 시 import + 한글 폰트 설정)
+
+    rcParams는 여기서 한 번만 바꾸고 이후에는 읽기만 하므로 스레드 간 경합이 없다.
+    """
+    global _MPL
+    with _MPL_LOCK:
+        if _MPL is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            import matplotlib.dates as mdates
+
+            _MPL = SimpleNamespace(
+                Figure=Figure,
+                FigureCanvasAgg=FigureCanvasAgg,
+                mdates=mdates,
+                font_family=setup_matplotlib_korean_font(),
+            )
+        return _MPL
+
+
+def render_price_chart(
+    dates: np.ndarray,
+    prices_raw: np.ndarray,
     complex_name: str,
-    output_path: str,
     figsize: tuple = (8, 4),
-) -> Optional[str]:
+    dpi: int = DEFAULT_DPI,
+) -> Optional[bytes]:
     """
-    실거래가 추이 차트 생성
+    실거래가 추이 차트 PNG 바이트 (스레드 안전)
 
     Args:
-        transactions: 거래 내역 리스트
+        dates: datetime64[D] 거래일 배열
+        prices_raw: 거래가 배열 (원)
         complex_name: 단지명 (차트 제목용)
-        output_path: 저장 경로
-        figsize: 차트 크기
+        figsize: 차트 크기 (inch)
+        dpi: 해상도
 
     Returns:
-        저장된 이미지 경로 또는 None
+        PNG 바이트 (거래가 없으면 None)
     """
-    if not transactions:
+    if len(dates) == 0:
         return None
 
-    _setup_korean_font()
-
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    mpl = _matplotlib()
 
-    # 데이터 준비
-    dates = [t.date for t in transactions]
-    prices = [t.price_raw / 100000000 for t in transactions]  # 억 단위
+    # 데이터 준비 (날짜순 정렬, 억 단위)
+    order = np.argsort(dates, kind="stable")
+    dates = np.asarray(dates, dtype="datetime64[D]")[order]
+    prices = prices_raw[order] / 100000000
 
-    fig, ax = plt.subplots(figsize=figsize, dpi=150)
+    fig = mpl.Figure(figsize=figsize, dpi=dpi)
+    mpl.FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     # 스타일링
-    ax.scatter(dates, prices, color='#C8102E', s=30, zorder=5, alpha=0.7)
-    ax.plot(dates, prices, color='#C8102E', alpha=0.3, linewidth=1)
+    ax.scatter(dates, prices, color=PRICE_COLOR, s=30, zorder=5, alpha=0.7)
+    ax.plot(dates, prices, color=PRICE_COLOR, alpha=0.3, linewidth=1)
 
     # 축 설정
     ax.set_ylabel('매매가 (억원)', fontsize=11)
     ax.set_title(f'{complex_name} 매매가 추이', fontsize=14, fontweight='bold', pad=15)
 
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
-    ax.xaxis.set_major_locator(mdates.YearLocator(3))
-    plt.xticks(rotation=0, fontsize=9)
-    plt.yticks(fontsize=9)
+    ax.xaxis.set_major_formatter(mpl.mdates.DateFormatter('%Y'))
+    ax.xaxis.set_major_locator(mpl.mdates.YearLocator(3))
+    ax.tick_params(axis='x', labelrotation=0, labelsize=9)
+    ax.tick_params(axis='y', labelsize=9)
 
     # 그리드
     ax.grid(True, linestyle='--', alpha=0.3)
@@ -104,11 +103,71 @@ def generate_price_chart(
 
     # 배경
     fig.patch.set_facecolor('white')
-    ax.set_facecolor('#FAFAFA')
+    ax.set_facecolor(FACE_COLOR)
 
     # 여백
-    plt.tight_layout()
-    plt.savefig(output_path, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches='tight', facecolor='white')
+    return buffer.getvalue()
+
+
+def generate_price_chart(
+    transactions: List[Transaction],
+    complex_name: str,
+    output_path: str,
+    figsize: tuple = (8, 4),
+) -> Optional[str]:
+    """
+    실거래가 추이 차트 생성
+
+    Args:
+        transactions: 거래 내역 리스트
+        complex_name: 단지명 (차트 제목용)
+        output_path: 저장 경로
+        figsize: 차트 크기
+
+    Returns:
+        저장된 이미지 경로 또는 None
+    """
+    if not transactions:
+        return None
+
+    dates = np.array([t.date for t in transactions], dtype="datetime64[D]")
+    prices_raw = np.array([t.price_raw for t in transactions], dtype=np.int64)
+    return generate_price_chart_from_columns(
+        dates, prices_raw, complex_name, output_path, figsize,
+    )
+
+
+def generate_price_chart_from_columns(
+    dates: np.ndarray,
+    prices_raw: np.ndarray,
+    complex_name: str,
+    output_path: str,
+    figsize: tuple = (8, 4),
+) -> Optional[str]:
+    """
+    실거래가 추이 차트 생성 (실거래 이력 저장소 컬럼을 그대로 사용)
+
+    Args:
+        dates: datetime64[D] 거래일 배열
+        prices_raw: 거래가 배열 (원)
+        complex_name: 단지명 (차트 제목용)
+        output_path: 저장 경로
+        figsize: 차트 크기
+
+    Returns:
+        저장된 이미지 경로 또는 None
+    """
+    png = render_price_chart(dates, prices_raw, complex_name, figsize)
+    if png is None:
+        return None
 
+    # 임시 파일에 쓴 뒤 교체 — 같은 경로를 읽는 쪽이 반쯤 쓴 파일을 보지 않도록
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp_path = f"{output_path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(png)
+    os.replace(tmp_path, output_path)
     return output_path
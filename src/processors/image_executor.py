@@ -0,0 +1,228 @@
+"""
+이미지 작업 실행기 (프로세스 풀)
+리사이즈 / 크롭 / 동 마킹 / 인코딩 / 재압축 / placeholder 같은 CPU 작업을 별도 프로세스에서 실행해
+네트워크 대기 위주인 크롤링과 겹쳐 돌린다. 단지가 많은 배치 작업에서 효과가 크다.
+
+- 작업 키 = 작업 종류 + 입력 내용 해시 + 파라미터. 실행 중이거나 최근에 끝난 같은 키의 작업은
+  같은 Future를 돌려준다 (실패한 작업은 다시 제출하면 재실행)
+- 끝난 작업은 최근 RECENT_RESULTS개만 보관한다. 인코딩 결과는 image_optimizer가 디스크 캐시에
+  저장하므로, 오래된 결과를 메모리에 들고 있을 필요가 없다 (배치 작업에서 메모리가 계속 늘지 않도록)
+- 현재 파이프라인에서 제출하는 작업은 encode(크롤링 중 prefetch + PPT 생성)와 recompress(용량 예산)뿐.
+  resize / crop / mark는 같은 방식으로 쓸 수 있게 등록만 되어 있다
+- 작업 함수는 바이트 → 결과 형태의 모듈 함수 (_OPS). 자식 프로세스에서 import해서 실행한다
+- workers 0이거나 프로세스 풀을 만들 수 없으면 호출한 스레드에서 바로 실행한다
+
+Usage:
+    executor = get_image_executor(config)
+    future = executor.submit("resize", data, max_width=1200, max_height=900)
+    resized = future.result()
+"""
+import os
+import hashlib
+import importlib
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from src.models import ImageAsset
+
+
+# 작업 종류 → "모듈:함수" (자식 프로세스에서 import)
+# 함수는 (data, **params) 형태, placeholder만 입력 없이 (**params)
+_OPS: Dict[str, str] = {
+    "resize": "src.processors.image_processor:resize_bytes",
+    "crop": "src.processors.image_processor:crop_bytes",
+    "mark": "src.processors.image_processor:mark_dong_bytes",
+    "encode": "src.processors.image_optimizer:encode_bytes",
+    "recompress": "src.processors.image_optimizer:recompress_bytes",
+    "placeholder": "src.processors.image_processor:placeholder_png_bytes",
+}
+
+DEFAULT_WORKERS = 2
+
+# 끝난 작업 Future(결과 포함) 보관 개수
+RECENT_RESULTS = 32
+
+
+def _resolve(op: str) -> Callable:
+    module_name, func_name = _OPS[op].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def run_job(op: str, data: Optional[bytes], params: Dict[str, Any]) -> Any:
+    """작업 1개 실행 (자식 프로세스 진입점)"""
+    func = _resolve(op)
+    if data is None:
+        return func(**params)
+    return func(data, **params)
+
+
+def job_key(op: str, content_hash: str, params: Dict[str, Any]) -> str:
+    """작업 키 (종류 + 입력 해시 + 파라미터)"""
+    spec = f"{op}|{content_hash}|{sorted(params.items())!r}"
+    return hashlib.sha1(spec.encode()).hexdigest()
+
+
+def completed_future(value: Any) -> Future:
+    """이미 끝난 Future"""
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+def chain(future: Future, func: Callable[[Any], Any],
+          on_error: Optional[Callable[[BaseException], Any]] = None) -> Future:
+    """
+    future 결과에 func를 적용한 새 Future
+
+    on_error가 있으면 실패 시 on_error(예외) 값을 결과로 쓴다.
+    """
+    out: Future = Future()
+
+    def _done(f: Future):
+        try:
+            exc = f.exception()
+            if exc is not None:
+                if on_error is None:
+                    out.set_exception(exc)
+                    return
+                out.set_result(on_error(exc))
+                return
+            out.set_result(func(f.result()))
+        except BaseException as e:
+            out.set_exception(e)
+
+    future.add_done_callback(_done)
+    return out
+
+
+class ImageExecutor:
+    """프로세스 풀 이미지 작업 실행기 (작업 키 단위 중복 제거)"""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers = max(0, int(workers))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, Future] = {}                      # 실행 중
+        self._recent: "OrderedDict[str, Future]" = OrderedDict()  # 최근에 성공한 작업
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.deduplicated = 0
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers and self._pool is None:
+            try:
+                # fork는 크롤러 스레드(Playwright, write-behind)와 섞이면 위험하므로 spawn
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, ValueError, NotImplementedError) as e:
+                print(f"  [WARN] 이미지 프로세스 풀 생성 실패 → 현재 프로세스에서 처리: {e}")
+                self.workers = 0
+        return self._pool
+
+    def _run_inline(self, op: str, data: Optional[bytes], params: Dict[str, Any]) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(run_job(op, data, params))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _start(self, op: str, data: Optional[bytes], params: Dict[str, Any]) -> Future:
+        pool = self._get_pool()
+        if pool is None:
+            return self._run_inline(op, data, params)
+        try:
+            return pool.submit(run_job, op, data, params)
+        except (BrokenProcessPool, RuntimeError) as e:
+            print(f"  [WARN] 이미지 프로세스 풀 사용 불가 → 현재 프로세스에서 처리: {e}")
+            self.workers = 0
+            self._pool = None
+            return self._run_inline(op, data, params)
+
+    def submit(
+        self,
+        op: str,
+        data: Optional[Any] = None,
+        content_hash: Optional[str] = None,
+        **params,
+    ) -> Future:
+        """
+        작업 제출
+
+        Args:
+            op: 작업 종류 (resize, crop, mark, encode, recompress, placeholder)
+            data: 입력 이미지 바이트 또는 ImageAsset (placeholder는 None)
+            content_hash: 입력 내용 해시 (이미 알고 있으면 전달, 없으면 계산)
+            **params: 작업 함수 파라미터 (키에 포함되므로 repr이 안정적인 값만)
+
+        Returns:
+            작업 결과 Future (같은 작업이 이미 있으면 그 Future)
+        """
+        if op not in _OPS:
+            raise ValueError(f"알 수 없는 이미지 작업: {op}")
+        if isinstance(data, ImageAsset):
+            content_hash = content_hash or data.sha1
+            data = data.data
+        if content_hash is None:
+            content_hash = hashlib.sha1(data).hexdigest() if data is not None else ""
+
+        key = job_key(op, content_hash, params)
+        with self._lock:
+            future = self._jobs.get(key)
+            if future is None and key in self._recent:
+                future = self._recent[key]
+                self._recent.move_to_end(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self.deduplicated += 1
+                return future
+            future = self._start(op, data, params)
+            self._jobs[key] = future
+            self.submitted += 1
+        # 락 밖에서 등록 (현재 프로세스에서 실행한 작업은 이미 끝나 있어 콜백이 바로 호출됨)
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return future
+
+    def _finish(self, key: str, future: Future):
+        """끝난 작업을 실행 중 목록에서 빼고, 성공했으면 최근 결과에 보관 (오래된 것부터 버림)"""
+        with self._lock:
+            if self._jobs.get(key) is future:
+                del self._jobs[key]
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._recent[key] = future
+            self._recent.move_to_end(key)
+            while len(self._recent) > RECENT_RESULTS:
+                self._recent.popitem(last=False)
+
+    def summary(self) -> str:
+        mode = f"프로세스 {self.workers}개" if self.workers else "현재 프로세스"
+        return f"이미지 작업 {self.submitted}개 ({mode}), 중복 {self.deduplicated}개 재사용"
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_EXECUTOR: Optional[ImageExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_image_executor(config: Optional[dict] = None) -> ImageExecutor:
+    """
+    프로세스 공용 이미지 실행기
+
+    처음 호출할 때 config의 output.image_workers로 프로세스 수를 정한다 (0이면 사용 안 함).
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            workers = (config or {}).get("output", {}).get("image_workers", DEFAULT_WORKERS)
+            _EXECUTOR = ImageExecutor(min(int(workers), os.cpu_count() or 1))
+        return _EXECUTOR
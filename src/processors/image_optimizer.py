@@ -0,0 +1,274 @@
+"""
+PPT 삽입용 이미지 최적화
+슬라이드 배치 영역(slide_utils.IMAGE_BOXES) × 목표 DPI에 맞춰 이미지를 줄이고,
+색이 적은 이미지(차트, placeholder)는 팔레트 PNG, 그 외(지도 캡처, 사진)는 JPEG로 저장한다.
+EXIF/ICC 등 메타데이터는 제거한다.
+
+결과는 원본 내용 해시 + 영역 + 설정으로 temp/image_cache에 캐시하므로
+같은 이미지를 다시 넣을 때는 파일만 재사용한다.
+메모리 이미지(ImageAsset)는 디스크를 거치지 않고 바이트에서 바로 최적화한다.
+optimize_image_async()는 인코딩을 image_executor 프로세스 풀로 넘긴다.
+"""
+import io
+import os
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Optional, Tuple, Union
+
+from PIL import Image
+
+from src.models import ImageAsset, ImageRef
+from src.utils.write_behind import file_ready
+
+
+DEFAULT_DPI = 150
+DEFAULT_JPEG_QUALITY = 85
+DEFAULT_CACHE_DIR = os.path.join("temp", "image_cache")
+
+# 이 색 수 이하이면 팔레트 PNG
+_PALETTE_MAX_COLORS = 256
+
+Box = Union[str, Tuple[float, float]]
+
+
+def _box_inches(box: Box) -> Tuple[float, float]:
+    """영역 이름 또는 (가로, 세로) 인치 → (가로, 세로) 인치"""
+    if isinstance(box, str):
+        from src.generators.slide_utils import IMAGE_BOXES
+        _, _, width, height = IMAGE_BOXES[box]
+        return width, height
+    return box
+
+
+def _target_size(size: Tuple[int, int], box_in: Tuple[float, float], dpi: int) -> Tuple[int, int]:
+    """
+    영역에 필요한 픽셀 크기 (비율 유지, 확대하지 않음)
+
+    PPT는 이미지를 영역에 맞춰 늘리므로, 가로/세로 모두 목표 DPI 이상이 되도록
+    두 축 중 덜 줄여도 되는 쪽 기준으로 축소한다.
+    """
+    width, height = size
+    need_w = box_in[0] * dpi
+    need_h = box_in[1] * dpi
+    scale = min(1.0, max(need_w / width, need_h / height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _flatten(img: Image.Image) -> Image.Image:
+    """투명도가 실제로 쓰이지 않으면 알파 채널 제거"""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        rgba = img.convert("RGBA")
+        if rgba.getchannel("A").getextrema()[0] == 255:
+            return rgba.convert("RGB")
+        return rgba
+    if img.mode not in ("RGB", "L"):
+        return img.convert("RGB")
+    return img
+
+
+def _encode(img: Image.Image, box_in: Tuple[float, float], dpi: int, jpeg_quality: int) -> Tuple[bytes, str]:
+    """축소 + 형식 선택 후 인코딩 → (바이트, 확장자)"""
+    out = _flatten(img)
+    target = _target_size(out.size, box_in, dpi)
+    if target != out.size:
+        out = out.resize(target, Image.LANCZOS)
+
+    buf = io.BytesIO()
+    colors = out.getcolors(maxcolors=_PALETTE_MAX_COLORS) if out.mode != "RGBA" else None
+    if colors is not None or out.mode == "RGBA":
+        if colors is not None:
+            out = out.convert("RGB").quantize(colors=len(colors), dither=Image.Dither.NONE)
+        out.save(buf, format="PNG", optimize=True)
+        return buf.getvalue(), ".png"
+    out.convert("RGB").save(
+        buf, format="JPEG", quality=jpeg_quality,
+        optimize=True, progressive=True,
+    )
+    return buf.getvalue(), ".jpg"
+
+
+def encode_bytes(data: bytes, box_in: Tuple[float, float], dpi: int,
+                 jpeg_quality: int = DEFAULT_JPEG_QUALITY) -> Tuple[bytes, str]:
+    """이미지 바이트 최적화 → (바이트, 확장자) (image_executor "encode" 작업)"""
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+        return _encode(img, box_in, dpi, jpeg_quality)
+
+
+def recompress_bytes(data: bytes, scale: float = 1.0,
+                     jpeg_quality: int = DEFAULT_JPEG_QUALITY) -> bytes:
+    """
+    형식을 유지한 채 더 작게 다시 인코딩 (PPT 용량 맞추기용)
+
+    JPEG는 scale 배 축소 + jpeg_quality로, PNG는 scale 배 축소 + 256색 팔레트로 저장한다.
+    투명도가 있는 PNG는 팔레트로 바꾸지 않고 축소만 한다.
+    그 밖의 형식(GIF/BMP/TIFF 등)은 파트 content type과 어긋나므로 ValueError.
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+        fmt = img.format
+        if fmt not in ("JPEG", "PNG"):
+            raise ValueError(f"재압축 대상이 아닌 형식: {fmt}")
+        out = _flatten(img)
+    if scale < 1.0:
+        size = (max(1, round(out.width * scale)), max(1, round(out.height * scale)))
+        out = out.resize(size, Image.LANCZOS)
+
+    buf = io.BytesIO()
+    if fmt == "JPEG":
+        out.convert("RGB").save(
+            buf, format="JPEG", quality=jpeg_quality,
+            optimize=True, progressive=True,
+        )
+    elif out.mode == "RGBA":
+        out.save(buf, format="PNG", optimize=True)
+    else:
+        out = out.convert("RGB").quantize(colors=_PALETTE_MAX_COLORS, dither=Image.Dither.NONE)
+        out.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def _name(src: ImageRef) -> str:
+    return os.path.basename((src.path or "") if isinstance(src, ImageAsset) else src)
+
+
+def _lookup(src: ImageRef, box: Box, dpi: int, jpeg_quality: int, cache_dir: str):
+    """
+    캐시 조회
+
+    Returns:
+        (결과, None): 바로 쓸 수 있는 결과 (캐시 적중 / 최적화 대상 아님)
+        (None, (key, 내용 해시, 원본 바이트, 영역 인치)): 인코딩이 필요한 경우
+    """
+    is_asset = isinstance(src, ImageAsset)
+    if not is_asset and (not src or not os.path.exists(src)):
+        return src, None
+
+    box_in = _box_inches(box)
+    try:
+        if is_asset:
+            data, content_hash = src.data, src.sha1
+        else:
+            with open(src, "rb") as f:
+                data = f.read()
+            content_hash = hashlib.sha1(data).hexdigest()
+    except OSError as e:
+        print(f"  [WARN] 이미지 최적화 생략 ({_name(src)}): {e}")
+        return src, None
+    key = hashlib.sha1(
+        f"{content_hash}|{box_in[0]:.3f}x{box_in[1]:.3f}|{dpi}|{jpeg_quality}".encode()
+    ).hexdigest()[:20]
+
+    for ext in (".jpg", ".png"):
+        cached = os.path.join(cache_dir, key + ext)
+        if os.path.exists(cached):
+            return (ImageAsset.from_path(cached) if is_asset else cached), None
+    # 최적화해도 작아지지 않았던 이미지
+    if os.path.exists(os.path.join(cache_dir, key + ".orig")):
+        return src, None
+    return None, (key, content_hash, data, box_in)
+
+
+def _store(src: ImageRef, key: str, src_size: int, encoded: Tuple[bytes, str], cache_dir: str) -> ImageRef:
+    """인코딩 결과를 캐시에 저장하고 결과 반환 (원본보다 크면 원본)"""
+    data, ext = encoded
+    os.makedirs(cache_dir, exist_ok=True)
+    if len(data) >= src_size:
+        open(os.path.join(cache_dir, key + ".orig"), "wb").close()
+        return src
+
+    dest = os.path.join(cache_dir, key + ext)
+    if isinstance(src, ImageAsset):
+        return ImageAsset.from_bytes(data, path=dest).write_behind()
+    tmp_path = f"{dest}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, dest)
+    return dest
+
+
+def optimize_image(
+    src: ImageRef,
+    box: Box,
+    dpi: int = DEFAULT_DPI,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> ImageRef:
+    """
+    이미지를 배치 영역에 맞게 최적화
+
+    Args:
+        src: 원본 이미지 경로 또는 ImageAsset
+        box: IMAGE_BOXES 영역 이름 또는 (가로, 세로) 인치
+        dpi: 목표 해상도
+        jpeg_quality: JPEG 품질
+
+    Returns:
+        경로를 주면 최적화된 이미지 경로, ImageAsset을 주면 최적화된 ImageAsset
+        (원본보다 커지거나 실패하면 원본 그대로).
+        ImageAsset 결과의 캐시 파일은 백그라운드로 저장한다.
+    """
+    result, job = _lookup(src, box, dpi, jpeg_quality, cache_dir)
+    if job is None:
+        return result
+    key, _, data, box_in = job
+    try:
+        encoded = encode_bytes(data, box_in, dpi, jpeg_quality)
+    except Exception as e:
+        print(f"  [WARN] 이미지 최적화 실패 ({_name(src)}): {e}")
+        return src
+    return _store(src, key, len(data), encoded, cache_dir)
+
+
+def optimize_image_async(
+    src: ImageRef,
+    box: Box,
+    dpi: int = DEFAULT_DPI,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    executor=None,
+) -> Future:
+    """
+    optimize_image의 비동기 버전 — 인코딩을 image_executor 프로세스 풀에서 실행
+
+    같은 이미지 / 영역 / 설정은 실행기에서 한 번만 인코딩한다.
+
+    Returns:
+        optimize_image와 같은 값을 돌려주는 Future
+    """
+    from src.processors.image_executor import chain, completed_future, get_image_executor
+
+    result, job = _lookup(src, box, dpi, jpeg_quality, cache_dir)
+    if job is None:
+        return completed_future(result)
+    key, content_hash, data, box_in = job
+    # 콜백이 원본 바이트를 붙잡지 않도록 크기만 넘긴다
+    src_size = len(data)
+
+    def on_error(e: BaseException) -> ImageRef:
+        print(f"  [WARN] 이미지 최적화 실패 ({_name(src)}): {e}")
+        return src
+
+    executor = executor or get_image_executor()
+    future = executor.submit(
+        "encode", data, content_hash=content_hash,
+        box_in=box_in, dpi=dpi, jpeg_quality=jpeg_quality,
+    )
+    return chain(future, lambda encoded: _store(src, key, src_size, encoded, cache_dir), on_error)
+
+
+def image_size_bytes(image: Optional[ImageRef]) -> int:
+    """이미지 필드의 바이트 크기 (없으면 0)"""
+    if isinstance(image, ImageAsset):
+        return image.size_bytes
+    if image and file_ready(image):
+        return os.path.getsize(image)
+    return 0
+
+
+def optimize_path(path: Optional[ImageRef], box: Box, dpi: int = DEFAULT_DPI) -> Optional[ImageRef]:
+    """optimize_image의 Optional 버전 (없는 파일은 그대로 반환)"""
+    if not image_size_bytes(path):
+        return path
+    return optimize_image(path, box, dpi=dpi)
@@ -1,12 +1,60 @@
 """
 이미지 프로세서
 크롭, 리사이즈, PPT 삽입 최적화
+
+*_bytes 함수는 바이트 → 바이트 버전 (image_executor 프로세스 풀 작업으로도 사용)
 """
+import io
 import os
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from PIL import Image
 
+from src.utils.fonts import get_pil_font
+
+
+def _save_like(img: Image.Image, fmt: str, quality: int = 90) -> bytes:
+    """원본 형식(PNG/JPEG)으로 인코딩"""
+    buf = io.BytesIO()
+    if fmt == "JPEG":
+        img.convert("RGB").save(buf, format="JPEG", quality=quality)
+    else:
+        img.save(buf, format=fmt or "PNG")
+    return buf.getvalue()
+
+
+def resize_bytes(data: bytes, max_width: int = 1200, max_height: int = 900, quality: int = 90) -> bytes:
+    """resize_image의 바이트 버전 (비율 유지, 원본 형식 유지)"""
+    with Image.open(io.BytesIO(data)) as img:
+        fmt = img.format
+        img.thumbnail((max_width, max_height), Image.LANCZOS)
+        return _save_like(img, fmt, quality)
+
+
+def crop_bytes(data: bytes, box: Tuple[int, int, int, int]) -> bytes:
+    """crop_image의 바이트 버전"""
+    with Image.open(io.BytesIO(data)) as img:
+        return _save_like(img.crop(box), img.format)
+
+
+def mark_dong_bytes(
+    data: bytes,
+    dong_coordinates: Tuple[int, int, int, int],
+    border_color: str = "#C8102E",
+    border_width: int = 3,
+    fmt: Optional[str] = None,
+) -> bytes:
+    """mark_dong_on_siteplan의 바이트 버전 (fmt 없으면 원본 형식)"""
+    from PIL import ImageDraw
+
+    with Image.open(io.BytesIO(data)) as src:
+        img = src.copy()
+        fmt = fmt or src.format
+    draw = ImageDraw.Draw(img)
+    draw.rectangle(dong_coordinates, outline=border_color, width=border_width)
+    return _save_like(img, fmt)
+
 
 def resize_image(
     input_path: str,
@@ -68,6 +116,35 @@ def crop_image(
         return None
 
 
+@lru_cache(maxsize=64)
+def placeholder_png_bytes(
+    width: int = 400,
+    height: int = 300,
+    text: str = "",
+    bg_color: str = "#E0E0E0",
+) -> bytes:
+    """
+    placeholder 이미지 PNG 바이트 (크기/텍스트/색상별로 한 번만 렌더링)
+    """
+    from PIL import ImageDraw
+
+    img = Image.new('RGB', (width, height), bg_color)
+    draw = ImageDraw.Draw(img)
+
+    if text:
+        font = get_pil_font(20)
+        bbox = draw.textbbox((0, 0), text, font=font)
+        text_w = bbox[2] - bbox[0]
+        text_h = bbox[3] - bbox[1]
+        x = (width - text_w) // 2
+        y = (height - text_h) // 2
+        draw.text((x, y), text, fill="#888888", font=font)
+
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
 def create_placeholder_image(
     output_path: str,
     width: int = 400,
@@ -78,6 +155,9 @@ def create_placeholder_image(
     """
     대체 placeholder 이미지 생성 (실제 이미지가 없을 때)
 
+    같은 (크기, 텍스트, 색상)은 메모리에 캐시된 PNG를 그대로 쓰고,
+    output_path에 이미 같은 내용이 있으면 다시 쓰지 않는다.
+
     Args:
         output_path: 저장 경로
         width: 가로 픽셀
@@ -88,36 +168,18 @@ def create_placeholder_image(
     Returns:
         저장 경로
     """
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    # PIL로 간단한 placeholder 이미지 생성
-    from PIL import ImageDraw, ImageFont
-
-    img = Image.new('RGB', (width, height), bg_color)
-    draw = ImageDraw.Draw(img)
-
-    if text:
-        try:
-            import platform
-            system = platform.system()
-            if system == 'Windows':
-                font_path = "C:/Windows/Fonts/malgun.ttf"
-            elif system == 'Darwin':
-                font_path = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
-            else:
-                font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-            font = ImageFont.truetype(font_path, 20)
-        except Exception:
-            font = ImageFont.load_default()
-
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-        x = (width - text_w) // 2
-        y = (height - text_h) // 2
-        draw.text((x, y), text, fill="#888888", font=font)
+    data = placeholder_png_bytes(width, height, text, bg_color)
+    try:
+        if os.path.getsize(output_path) == len(data):
+            with open(output_path, "rb") as f:
+                if f.read() == data:
+                    return output_path
+    except OSError:
+        pass
 
-    img.save(output_path)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(data)
     return output_path
 
 
@@ -146,7 +208,7 @@ def mark_location_on_map(
         저장 경로 또는 None
     """
     try:
-        from PIL import ImageDraw, ImageFont
+        from PIL import ImageDraw
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         img = Image.open(map_image_path).copy()
@@ -161,18 +223,7 @@ def mark_location_on_map(
 
         # 라벨 텍스트
         if label:
-            try:
-                import platform
-                system = platform.system()
-                if system == 'Windows':
-                    font_path = "C:/Windows/Fonts/malgun.ttf"
-                elif system == 'Darwin':
-                    font_path = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
-                else:
-                    font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-                font = ImageFont.truetype(font_path, 14)
-            except Exception:
-                font = ImageFont.load_default()
+            font = get_pil_font(14)
 
             text_bbox = draw.textbbox((0, 0), label, font=font)
             text_w = text_bbox[2] - text_bbox[0]
@@ -208,13 +259,14 @@ def mark_dong_on_siteplan(
         저장 경로 또는 None
     """
     try:
-        from PIL import ImageDraw
-
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        img = Image.open(siteplan_path).copy()
-        draw = ImageDraw.Draw(img)
-        draw.rectangle(dong_coordinates, outline=border_color, width=border_width)
-        img.save(output_path)
+        with open(siteplan_path, "rb") as f:
+            data = mark_dong_bytes(
+                f.read(), dong_coordinates, border_color, border_width,
+                fmt=Image.registered_extensions().get(os.path.splitext(output_path)[1].lower()),
+            )
+        with open(output_path, "wb") as f:
+            f.write(data)
         return output_path
     except Exception as e:
         print(f"[ERROR] 배치도 마킹 실패: {e}")
@@ -0,0 +1,158 @@
+"""
+실거래가 월별 통계
+거래(또는 월별 집계)를 한 번에 월 단위 버킷으로 모아 NumPy 배열로 보관하고,
+월별 건수 / 최고·최저 / 최근 N개월 범위 / 역대 최고가를 조회한다.
+
+국토부 이력 저장소(개별 거래)와 아실 차트 데이터(월 평균 + 건수) 모두 이 모듈을 사용한다.
+"""
+from datetime import date
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.models import PriceInfo, Transaction
+from src.utils.text_helpers import format_price
+
+
+def _month_index(year: int, month: int) -> int:
+    """(연, 월) → 1970년 1월 기준 월 번호 (datetime64[M]과 동일)"""
+    return (year - 1970) * 12 + (month - 1)
+
+
+def _year_month(index: int) -> Tuple[int, int]:
+    """월 번호 → (연, 월)"""
+    year, month0 = divmod(int(index), 12)
+    return year + 1970, month0 + 1
+
+
+class MonthlyPriceStats:
+    """
+    월 단위 버킷 통계
+
+    Attributes:
+        months: 거래가 있는 달의 월 번호 (오름차순)
+        counts: 달별 거래 건수
+        highs: 달별 최고가 (원)
+        lows: 달별 최저가 (원)
+    """
+
+    def __init__(self, months: np.ndarray, counts: np.ndarray, highs: np.ndarray, lows: np.ndarray):
+        self.months = months
+        self.counts = counts
+        self.highs = highs
+        self.lows = lows
+
+    @classmethod
+    def from_columns(
+        cls,
+        dates: np.ndarray,
+        prices_raw: np.ndarray,
+        counts: Optional[np.ndarray] = None,
+    ) -> "MonthlyPriceStats":
+        """
+        거래 컬럼을 월 버킷으로 집계
+
+        Args:
+            dates: datetime64 거래일 (또는 월) 배열
+            prices_raw: 거래가 배열 (원)
+            counts: 행별 거래 건수 (월별 집계 데이터일 때, None이면 행당 1건)
+        """
+        prices_raw = np.asarray(prices_raw, dtype=np.int64)
+        month_idx = np.asarray(dates).astype("datetime64[M]").astype(np.int64)
+        months, inverse = np.unique(month_idx, return_inverse=True)
+
+        weights = None if counts is None else np.asarray(counts, dtype=np.int64)
+        bucket_counts = np.bincount(inverse, weights=weights, minlength=len(months)).astype(np.int64)
+
+        highs = np.full(len(months), np.iinfo(np.int64).min, dtype=np.int64)
+        lows = np.full(len(months), np.iinfo(np.int64).max, dtype=np.int64)
+        np.maximum.at(highs, inverse, prices_raw)
+        np.minimum.at(lows, inverse, prices_raw)
+        return cls(months, bucket_counts, highs, lows)
+
+    @classmethod
+    def from_transactions(cls, transactions: List[Transaction]) -> "MonthlyPriceStats":
+        """Transaction 리스트를 월 버킷으로 집계"""
+        dates = np.array([t.date for t in transactions], dtype="datetime64[D]")
+        prices = np.array([t.price_raw for t in transactions], dtype=np.int64)
+        return cls.from_columns(dates, prices)
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def count(self, year: int, month: int) -> int:
+        """해당 월 거래 건수"""
+        idx = _month_index(year, month)
+        pos = np.searchsorted(self.months, idx)
+        if pos < len(self.months) and self.months[pos] == idx:
+            return int(self.counts[pos])
+        return 0
+
+    def window_range(self, n_months: int, today: Optional[date] = None) -> Tuple[int, int]:
+        """
+        최근 n개월(이번 달 포함) 최고/최저가
+
+        Returns:
+            (최고가, 최저가), 해당 기간 거래가 없으면 (0, 0)
+        """
+        today = today or date.today()
+        end = _month_index(today.year, today.month)
+        lo = np.searchsorted(self.months, end - n_months + 1)
+        hi = np.searchsorted(self.months, end, side="right")
+        if lo >= hi:
+            return 0, 0
+        return int(self.highs[lo:hi].max()), int(self.lows[lo:hi].min())
+
+    def all_time_high(self) -> Tuple[int, int, int]:
+        """
+        역대 최고가
+
+        Returns:
+            (최고가, 연, 월), 거래가 없으면 (0, 0, 0)
+        """
+        if not len(self.months):
+            return 0, 0, 0
+        pos = int(np.argmax(self.highs))
+        year, month = _year_month(self.months[pos])
+        return int(self.highs[pos]), year, month
+
+
+def _shift_month(year: int, month: int, delta: int) -> Tuple[int, int]:
+    """(연, 월)에서 delta개월 이동"""
+    return _year_month(_month_index(year, month) + delta)
+
+
+def build_price_info(
+    complex_id: str,
+    stats: MonthlyPriceStats,
+    recent_transactions: List[Transaction],
+    today: Optional[date] = None,
+    window_months: int = 3,
+    fallback_window_months: int = 6,
+) -> PriceInfo:
+    """
+    월별 통계 → PriceInfo
+
+    최근 window_months개월에 거래가 없으면 fallback_window_months개월 범위를 사용한다.
+    """
+    today = today or date.today()
+    prev_y, prev_m = _shift_month(today.year, today.month, -1)
+
+    high, low = stats.window_range(window_months, today)
+    if not high and fallback_window_months:
+        high, low = stats.window_range(fallback_window_months, today)
+
+    ath_price, ath_y, ath_m = stats.all_time_high()
+
+    return PriceInfo(
+        complex_id=complex_id,
+        recent_transactions=recent_transactions,
+        month1_count=stats.count(today.year, today.month),
+        month1_label=f"{today.year}년 {today.month}월",
+        month2_count=stats.count(prev_y, prev_m),
+        month2_label=f"{prev_y}년 {prev_m}월",
+        recent_3m_high=format_price(high) if high else "",
+        recent_3m_low=format_price(low) if low else "",
+        all_time_high=format_price(ath_price) if ath_price else "",
+        all_time_high_date=f"{ath_y % 100:02d}년 {ath_m}월" if ath_price else "",
+    )
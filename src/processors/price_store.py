@@ -0,0 +1,153 @@
+"""
+단지별 실거래 이력 저장소
+거래일/전용면적/층/가격 컬럼을 NumPy 배열로 보관하고 단지별 .npz 파일로 저장
+
+신고기한(계약 후 30일)이 지난 달의 거래는 더 이상 바뀌지 않으므로,
+새 실행에서는 저장소에 없는 달과 아직 신고 중인 최근 달만 다시 조회한다.
+"""
+import os
+from datetime import date
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from src.models import Transaction
+from src.utils.text_helpers import format_price
+
+
+# 이번 달 + 지난 달은 신고가 계속 들어오므로 매번 다시 조회
+OPEN_MONTHS = 2
+
+
+def month_key(year: int, month: int) -> int:
+    """(2025, 3) → 202503"""
+    return year * 100 + month
+
+
+def _open_month_keys(today: date) -> set:
+    """아직 신고가 들어올 수 있는 최근 달 키 목록"""
+    keys = set()
+    for i in range(OPEN_MONTHS):
+        m = today.month - i
+        y = today.year
+        while m <= 0:
+            m += 12
+            y -= 1
+        keys.add(month_key(y, m))
+    return keys
+
+
+class PriceHistoryStore:
+    """
+    단지 1개의 실거래 이력 (컬럼형)
+
+    Attributes:
+        dates: datetime64[D] 거래일
+        area_m2: float32 전용면적
+        floor: int16 층
+        price_raw: int64 거래가 (원)
+        months: int32 조회 완료한 달 키 (202503) — 거래가 없던 달도 포함
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.dates = np.empty(0, dtype="datetime64[D]")
+        self.area_m2 = np.empty(0, dtype=np.float32)
+        self.floor = np.empty(0, dtype=np.int16)
+        self.price_raw = np.empty(0, dtype=np.int64)
+        self.months = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def load(cls, path: str) -> "PriceHistoryStore":
+        """저장소 파일 로드 (없거나 손상되었으면 빈 저장소)"""
+        store = cls(path)
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    store.dates = data["dates"]
+                    store.area_m2 = data["area_m2"]
+                    store.floor = data["floor"]
+                    store.price_raw = data["price_raw"]
+                    store.months = data["months"]
+            except Exception as e:
+                print(f"  [WARN] 실거래 이력 파일 로드 실패, 새로 만듭니다: {e}")
+                store = cls(path)
+        return store
+
+    def save(self):
+        """저장소 파일 저장 (날짜순 정렬 후 압축 저장)"""
+        order = np.argsort(self.dates, kind="stable")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            dates=self.dates[order],
+            area_m2=self.area_m2[order],
+            floor=self.floor[order],
+            price_raw=self.price_raw[order],
+            months=np.sort(self.months),
+        )
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def covered_years(self, today: Optional[date] = None) -> float:
+        """조회 완료한 가장 오래된 달부터 오늘까지의 기간 (년, 거래가 없던 달 포함)"""
+        if not len(self.months):
+            return 0.0
+        today = today or date.today()
+        oldest_year, oldest_month = divmod(int(self.months.min()), 100)
+        months = (today.year - oldest_year) * 12 + (today.month - oldest_month) + 1
+        return round(months / 12, 2)
+
+    def missing_months(self, month_keys: Iterable[int], today: Optional[date] = None) -> List[int]:
+        """조회가 필요한 달 (저장소에 없거나 아직 신고 중인 달)"""
+        open_keys = _open_month_keys(today or date.today())
+        stored = set(self.months.tolist())
+        return [k for k in month_keys if k not in stored or k in open_keys]
+
+    def replace_month(
+        self,
+        key: int,
+        days: Iterable[int],
+        area_m2: Iterable[float],
+        floor: Iterable[int],
+        price_raw: Iterable[int],
+    ):
+        """한 달치 거래를 통째로 교체 (거래 0건이어도 조회 완료로 기록)"""
+        year, month = divmod(key, 100)
+        month_start = np.datetime64(f"{year:04d}-{month:02d}", "M")
+        keep = self.dates.astype("datetime64[M]") != month_start
+
+        days = np.asarray(list(days), dtype=np.int64)
+        new_dates = month_start.astype("datetime64[D]") + (np.minimum(days, 28) - 1)
+
+        self.dates = np.concatenate([self.dates[keep], new_dates.astype("datetime64[D]")])
+        self.area_m2 = np.concatenate([self.area_m2[keep], np.asarray(list(area_m2), dtype=np.float32)])
+        self.floor = np.concatenate([self.floor[keep], np.asarray(list(floor), dtype=np.int16)])
+        self.price_raw = np.concatenate([self.price_raw[keep], np.asarray(list(price_raw), dtype=np.int64)])
+        if key not in self.months:
+            self.months = np.append(self.months, np.int32(key))
+
+    def to_transactions(self, since: Optional[date] = None) -> List[Transaction]:
+        """since 이후 거래만 Transaction 리스트로 변환 (최신순)"""
+        mask = np.ones(len(self.dates), dtype=bool)
+        if since is not None:
+            mask = self.dates >= np.datetime64(since, "D")
+        idx = np.flatnonzero(mask)
+        idx = idx[np.argsort(self.dates[idx], kind="stable")[::-1]]
+
+        transactions = []
+        for i in idx:
+            area = float(self.area_m2[i])
+            price_raw = int(self.price_raw[i])
+            transactions.append(Transaction(
+                date=self.dates[i].astype(date),
+                area_pyeong=f"{round(area / 3.305785)}평",
+                area_m2=round(area, 2),
+                floor=int(self.floor[i]),
+                price=format_price(price_raw),
+                price_raw=price_raw,
+            ))
+        return transactions
@@ -0,0 +1,96 @@
+"""
+한글 폰트 레지스트리 (프로세스 공용)
+OS별 한글 폰트 경로를 한 번만 찾고, PIL 폰트 객체와 matplotlib 폰트 등록도 한 번만 한다.
+
+Usage:
+    font = get_pil_font(20)          # PIL ImageFont (크기별 캐시)
+    setup_matplotlib_korean_font()   # matplotlib rcParams 한글 설정 (최초 1회 등록)
+"""
+import os
+import platform
+import threading
+from functools import lru_cache
+from typing import List, Optional
+
+
+# OS별 한글 폰트 후보 (앞쪽 우선)
+KOREAN_FONT_CANDIDATES = {
+    "Windows": [
+        "C:/Windows/Fonts/malgun.ttf",      # 맑은 고딕
+        "C:/Windows/Fonts/NanumGothic.ttf",
+        "C:/Windows/Fonts/gulim.ttc",        # 굴림
+    ],
+    "Darwin": [
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+        "/System/Library/Fonts/Supplemental/AppleGothic.ttf",
+        "/Library/Fonts/NanumGothic.ttf",
+    ],
+    "Linux": [
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "/usr/share/fonts/nhn-nanum/NanumGothic.ttf",
+    ],
+}
+
+
+def korean_font_candidates() -> List[str]:
+    """현재 OS의 한글 폰트 후보 경로"""
+    return KOREAN_FONT_CANDIDATES.get(platform.system(), KOREAN_FONT_CANDIDATES["Linux"])
+
+
+@lru_cache(maxsize=1)
+def korean_font_path() -> Optional[str]:
+    """설치된 첫 번째 한글 폰트 경로 (없으면 None)"""
+    for path in korean_font_candidates():
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=32)
+def get_pil_font(size: int):
+    """
+    크기별 PIL 폰트 (한글 폰트가 없으면 PIL 기본 폰트)
+
+    반환된 객체는 공유되므로 수정하지 말 것.
+    """
+    from PIL import ImageFont
+
+    path = korean_font_path()
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+
+_MPL_FAMILY: Optional[str] = None
+_MPL_LOCK = threading.Lock()
+
+
+def setup_matplotlib_korean_font() -> str:
+    """
+    matplotlib 한글 폰트 설정
+
+    폰트 파일 등록(fontManager.addfont)은 최초 1회만 하고, rcParams는 호출할 때마다
+    다시 지정한다 (다른 코드가 바꿔 놓았을 수 있으므로).
+
+    Returns:
+        적용된 font.family 이름
+    """
+    global _MPL_FAMILY
+    import matplotlib
+
+    with _MPL_LOCK:
+        if _MPL_FAMILY is None:
+            family = "sans-serif"
+            path = korean_font_path()
+            if path:
+                from matplotlib import font_manager
+                font_manager.fontManager.addfont(path)
+                family = font_manager.FontProperties(fname=path).get_name()
+            _MPL_FAMILY = family
+
+    matplotlib.rcParams["font.family"] = _MPL_FAMILY
+    matplotlib.rcParams["axes.unicode_minus"] = False
+    return _MPL_FAMILY
@@ -0,0 +1,310 @@
+"""
+좌표 기반 캐시
+좌표만으로 결정되는 결과물(강남역 소요시간, 경로/학군 지도 캡처 등)을 geohash 셀 단위로
+저장해 두고, 허용 거리 안의 다른 단지가 같은 결과를 재사용하게 한다.
+
+결과물 종류(artifact)마다 geohash 정밀도 / 유효기간 / 허용 거리를 따로 둔다.
+    정밀도 6 ≈ 1.2km x 0.6km 셀, 정밀도 7 ≈ 150m x 120m 셀 (위도 37.5° 기준)
+조회 시 해당 셀과 주변 셀을 허용 거리를 덮을 만큼(ceil(허용 거리 / 셀 크기) 겹) 함께 보므로
+허용 거리가 셀보다 커도, 셀 경계 근처의 좌표도 놓치지 않는다.
+
+저장 위치: temp/geo_cache/{artifact}/index.json (+ 파일 결과물)
+"""
+import os
+import json
+import math
+import time
+import shutil
+import threading
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join("temp", "geo_cache")
+
+# artifact별 기본 설정 (config.yaml의 geo_cache 섹션으로 덮어쓸 수 있음)
+DEFAULT_PROFILES: Dict[str, Dict[str, float]] = {
+    # 강남역 대중교통 소요시간 (분) — 수백 m 차이는 결과에 거의 영향 없음
+    "gangnam_minutes": {"precision": 6, "ttl_days": 30, "tolerance_m": 400},
+    # 대중교통 경로 캡처 — 출발지 라벨이 지도에 찍히므로 label이 같은 경우만 재사용
+    "transit_route": {"precision": 7, "ttl_days": 14, "tolerance_m": 150},
+    # 아실 중·고등학교 학군지도 — 단지 좌표 중심 zoom 15 지도
+    "middle_high_map": {"precision": 7, "ttl_days": 90, "tolerance_m": 250},
+    # Directions API 도로 경로 — label은 목적지 좌표, 출발지는 수십 m만 허용
+    "directions": {"precision": 7, "ttl_days": 30, "tolerance_m": 30},
+}
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(lat: float, lng: float, precision: int) -> str:
+    """위경도 → geohash 문자열"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars = []
+    bits, bit_count, even = 0, 0, True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_lo = mid
+            else:
+                bits <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def _cell_size_deg(precision: int):
+    """geohash 셀 크기 (위도 차, 경도 차)"""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = math.floor(precision * 5 / 2)
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def _cell_size_m(lat: float, precision: int):
+    """geohash 셀 크기 (남북 m, 동서 m) — 위도 lat 기준"""
+    dlat, dlng = _cell_size_deg(precision)
+    return dlat * 111320.0, dlng * 111320.0 * math.cos(math.radians(lat))
+
+
+def neighbor_rings(lat: float, precision: int, tolerance_m: float) -> int:
+    """허용 거리 안의 모든 셀을 덮는 주변 셀 겹 수 (최소 1)"""
+    cell_m = min(_cell_size_m(lat, precision))
+    return max(1, math.ceil(tolerance_m / cell_m))
+
+
+def geohash_neighbors(lat: float, lng: float, precision: int, rings: int = 1) -> List[str]:
+    """좌표가 속한 셀 + 주변 rings 겹 셀의 geohash (rings=1이면 주변 8개)"""
+    dlat, dlng = _cell_size_deg(precision)
+    cells = []
+    offsets = range(-rings, rings + 1)
+    for i in offsets:
+        for j in offsets:
+            cell = geohash_encode(lat + i * dlat, lng + j * dlng, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def _distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    dlat = math.radians(lat2 - lat1)
+    dlng = math.radians(lng2 - lng1)
+    a = (math.sin(dlat / 2) ** 2
+         + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2))
+         * math.sin(dlng / 2) ** 2)
+    return 6371000 * 2 * math.asin(math.sqrt(a))
+
+
+class GeoCache:
+    """
+    geohash 셀 단위 캐시
+
+    Usage:
+        cache = get_geo_cache()
+        minutes = cache.get_value("gangnam_minutes", lat, lng, label="강남")
+        cache.put_value("gangnam_minutes", lat, lng, 42, label="강남")
+
+        if cache.get_file("middle_high_map", lat, lng, save_path):
+            ...  # save_path에 복사됨
+    """
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, profiles: Optional[Dict[str, dict]] = None):
+        self.root = root
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, Dict[str, List[dict]]] = {}
+        self.configure(profiles)
+
+    def configure(self, profiles: Optional[Dict[str, dict]] = None):
+        """artifact별 설정을 기본값 + profiles 덮어쓰기로 다시 지정"""
+        merged = {k: dict(v) for k, v in DEFAULT_PROFILES.items()}
+        for name, override in (profiles or {}).items():
+            if isinstance(override, dict):
+                merged.setdefault(name, {}).update(override)
+        self.profiles = merged
+
+    # ─── 인덱스 ───
+
+    def _profile(self, artifact: str) -> dict:
+        profile = self.profiles.get(artifact)
+        if profile is None:
+            raise KeyError(f"geo_cache 설정에 없는 artifact: {artifact}")
+        return profile
+
+    def _index_path(self, artifact: str) -> str:
+        return os.path.join(self.root, artifact, "index.json")
+
+    def _index(self, artifact: str) -> Dict[str, List[dict]]:
+        """artifact 인덱스 {geohash: [entry]} (락 안에서 호출)"""
+        index = self._indexes.get(artifact)
+        if index is None:
+            index = {}
+            path = self._index_path(artifact)
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        index = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"  [WARN] 좌표 캐시 인덱스 로드 실패 ({artifact}): {e}")
+            self._indexes[artifact] = index
+        return index
+
+    def _save_index(self, artifact: str):
+        path = self._index_path(artifact)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._indexes[artifact], f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _find(self, artifact: str, lat: float, lng: float, label: str) -> Optional[dict]:
+        """허용 거리 안에서 가장 가까운 유효 항목"""
+        if not lat or not lng:
+            return None
+        profile = self._profile(artifact)
+        precision = int(profile["precision"])
+        max_age = profile["ttl_days"] * 86400
+        tolerance = profile["tolerance_m"]
+        now = time.time()
+
+        best, best_dist = None, math.inf
+        rings = neighbor_rings(lat, precision, tolerance)
+        with self._lock:
+            index = self._index(artifact)
+            for cell in geohash_neighbors(lat, lng, precision, rings):
+                for entry in index.get(cell, []):
+                    if entry.get("label", "") != label:
+                        continue
+                    if now - entry.get("created", 0) > max_age:
+                        continue
+                    dist = _distance_m(lat, lng, entry["lat"], entry["lng"])
+                    if dist <= tolerance and dist < best_dist:
+                        best, best_dist = entry, dist
+        if best is not None:
+            print(f"  [캐시] {artifact}: {best_dist:.0f}m 거리의 저장된 결과 재사용")
+        return best
+
+    def _put(self, artifact: str, lat: float, lng: float, label: str, **fields) -> dict:
+        profile = self._profile(artifact)
+        cell = geohash_encode(lat, lng, int(profile["precision"]))
+        max_age = profile["ttl_days"] * 86400
+        now = time.time()
+        entry = {"lat": lat, "lng": lng, "label": label, "created": now, **fields}
+        with self._lock:
+            index = self._index(artifact)
+            # 같은 셀의 만료 항목 / 같은 좌표·라벨 항목은 교체
+            kept = []
+            for old in index.get(cell, []):
+                expired = now - old.get("created", 0) > max_age
+                same = old.get("label", "") == label and _distance_m(lat, lng, old["lat"], old["lng"]) < 1
+                if expired or same:
+                    old_file = old.get("file")
+                    if old_file and old_file != fields.get("file"):
+                        try:
+                            os.remove(os.path.join(self.root, artifact, old_file))
+                        except OSError:
+                            pass
+                    continue
+                kept.append(old)
+            kept.append(entry)
+            index[cell] = kept
+            self._save_index(artifact)
+        return entry
+
+    # ─── 값 ───
+
+    def get_value(self, artifact: str, lat: float, lng: float, label: str = "") -> Any:
+        """허용 거리 안의 저장된 값 (없으면 None)"""
+        entry = self._find(artifact, lat, lng, label)
+        return entry.get("value") if entry else None
+
+    def put_value(self, artifact: str, lat: float, lng: float, value: Any, label: str = ""):
+        """값 저장 (JSON 직렬화 가능해야 함)"""
+        if not lat or not lng:
+            return
+        self._put(artifact, lat, lng, label, value=value)
+
+    # ─── 파일 ───
+
+    def get_file(self, artifact: str, lat: float, lng: float, dest_path: str, label: str = "") -> bool:
+        """허용 거리 안의 저장된 파일을 dest_path로 복사. 성공 시 True"""
+        entry = self._find(artifact, lat, lng, label)
+        if not entry or not entry.get("file"):
+            return False
+        src = os.path.join(self.root, artifact, entry["file"])
+        if not os.path.exists(src):
+            return False
+        os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+        shutil.copyfile(src, dest_path)
+        return True
+
+    def put_file(self, artifact: str, lat: float, lng: float, src_path: str, label: str = ""):
+        """파일 결과물 저장 (캐시 디렉토리로 복사)"""
+        if not lat or not lng or not os.path.exists(src_path):
+            return
+        profile = self._profile(artifact)
+        cell = geohash_encode(lat, lng, int(profile["precision"]))
+        ext = os.path.splitext(src_path)[1] or ".bin"
+        filename = f"{cell}_{int(time.time() * 1000)}{ext}"
+        dest_dir = os.path.join(self.root, artifact)
+        os.makedirs(dest_dir, exist_ok=True)
+        shutil.copyfile(src_path, os.path.join(dest_dir, filename))
+        self._put(artifact, lat, lng, label, file=filename)
+
+    def get_bytes(self, artifact: str, lat: float, lng: float, label: str = "") -> Optional[bytes]:
+        """허용 거리 안의 저장된 파일 내용 (없으면 None)"""
+        entry = self._find(artifact, lat, lng, label)
+        if not entry or not entry.get("file"):
+            return None
+        try:
+            with open(os.path.join(self.root, artifact, entry["file"]), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put_bytes(self, artifact: str, lat: float, lng: float, data: bytes,
+                  ext: str = ".png", label: str = ""):
+        """메모리 결과물 저장 (put_file의 바이트 버전)"""
+        if not lat or not lng or not data:
+            return
+        profile = self._profile(artifact)
+        cell = geohash_encode(lat, lng, int(profile["precision"]))
+        filename = f"{cell}_{int(time.time() * 1000)}{ext}"
+        dest_dir = os.path.join(self.root, artifact)
+        os.makedirs(dest_dir, exist_ok=True)
+        with open(os.path.join(dest_dir, filename), "wb") as f:
+            f.write(data)
+        self._put(artifact, lat, lng, label, file=filename)
+
+
+_GEO_CACHE: Optional[GeoCache] = None
+_GEO_CACHE_LOCK = threading.Lock()
+
+
+def get_geo_cache(config: Optional[dict] = None) -> GeoCache:
+    """
+    프로세스 공용 좌표 캐시
+
+    config에 geo_cache 섹션이 있으면 그 값으로 artifact별 설정을 덮어쓴다 (호출 순서와 무관).
+    config 없이 호출하면 현재 설정 그대로 사용. run_pipeline이 시작할 때 config로 한 번 호출한다.
+    예) geo_cache: {transit_route: {tolerance_m: 100, ttl_days: 7}}
+    """
+    global _GEO_CACHE
+    with _GEO_CACHE_LOCK:
+        if _GEO_CACHE is None:
+            _GEO_CACHE = GeoCache()
+        if config and config.get("geo_cache") is not None:
+            _GEO_CACHE.configure(config["geo_cache"])
+        return _GEO_CACHE
@@ -2,6 +2,7 @@
 텍스트 헬퍼 유틸리티
 가격 포맷팅, 면적 변환 등
 """
+import re
 import math
 from typing import Optional
 
@@ -79,3 +80,36 @@ def truncate_text(text: str, max_len: int = 20) -> str:
     if len(text) <= max_len:
         return text
     return text[:max_len - 1] + "…"
+
+
+# 단지명 비교 시 무시할 문자 (공백, 괄호, 구두점)
+_APT_NAME_NOISE = re.compile(r"[\s()\[\]{}·.,\-_/]")
+# 단지 구분 접미사: "2차", "제2차", "1단지", "단지"
+_APT_NAME_SUFFIX = re.compile(r"(?:제?\d+차|\d*단지)$")
+
+
+def normalize_apt_name(name: str) -> str:
+    """
+    아파트 단지명 정규화 (데이터 출처 간 비교용)
+
+    Examples:
+        "중계 그린 아파트" -> "중계그린"
+        "현대(제2차)"      -> "현대2차"
+        "래미안 대치팰리스" -> "래미안대치팰리스"
+    """
+    key = _APT_NAME_NOISE.sub("", name or "").lower()
+    key = key.replace("아파트", "")
+    return re.sub(r"제(\d+차)", r"\1", key)
+
+
+def apt_base_name(name: str) -> str:
+    """
+    정규화된 단지명에서 차수/단지 접미사 제거
+
+    Examples:
+        "현대2차" -> "현대"
+        "중계그린1단지" -> "중계그린"
+    """
+    key = normalize_apt_name(name)
+    base = _APT_NAME_SUFFIX.sub("", key)
+    return base or key
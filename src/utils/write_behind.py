@@ -0,0 +1,85 @@
+"""
+디스크 쓰기 지연 (write-behind)
+캡처/다운로드한 이미지는 메모리(ImageAsset)로 바로 넘기고, 디스크 사본은
+백그라운드 스레드 1개가 순서대로 저장한다. 같은 경로에 대기 중인 쓰기가 있으면 최신 것만 남긴다.
+
+파일이 실제로 있어야 하는 쪽은 file_ready() / flush_writes()로 기다린 뒤 사용한다.
+프로세스 종료 시에도 남은 쓰기를 마저 저장한다.
+
+Usage:
+    write_behind("temp/123/walk_route.png", data)
+    ...
+    flush_writes()
+"""
+import os
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PENDING: Dict[str, Future] = {}
+_LOCK = threading.Lock()
+
+
+def _write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _run(path: str, data: bytes, future_box: list):
+    try:
+        _write(path, data)
+    except OSError as e:
+        print(f"  [WARN] 파일 저장 실패 ({path}): {e}")
+    finally:
+        with _LOCK:
+            if _PENDING.get(path) is future_box[0]:
+                del _PENDING[path]
+
+
+def write_behind(path: str, data: bytes) -> Future:
+    """path에 data를 백그라운드로 저장 (완료 Future 반환)"""
+    global _EXECUTOR
+    path = os.path.normpath(path)
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write-behind")
+            atexit.register(flush_writes)
+        previous = _PENDING.get(path)
+        if previous is not None:
+            previous.cancel()
+        future_box: list = []
+        future = _EXECUTOR.submit(_run, path, data, future_box)
+        future_box.append(future)
+        _PENDING[path] = future
+    return future
+
+
+def is_pending(path: str) -> bool:
+    """path에 아직 저장되지 않은 쓰기가 있는지"""
+    with _LOCK:
+        return os.path.normpath(path) in _PENDING
+
+
+def flush_writes(path: Optional[str] = None, timeout: Optional[float] = None):
+    """대기 중인 쓰기 완료까지 대기 (path를 주면 해당 파일만)"""
+    with _LOCK:
+        if path is None:
+            futures = list(_PENDING.values())
+        else:
+            future = _PENDING.get(os.path.normpath(path))
+            futures = [future] if future else []
+    if futures:
+        wait(futures, timeout=timeout)
+
+
+def file_ready(path: str) -> bool:
+    """path 파일이 있는지 (대기 중인 쓰기가 있으면 끝날 때까지 기다린 뒤 확인)"""
+    if is_pending(path):
+        flush_writes(path)
+    return os.path.exists(path)